@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Compressed Input Benchmarks - Streaming decompression vs. decompress-then-read
+
+Compresses a synthetic dataset with gzip, bzip2 and xz, then times reading
+it through compressed_input.open_text against first decompressing it to a
+temporary file and reading that, reporting time and temporary disk usage.
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import time
+from typing import List, Dict, Any
+
+import csv_parser
+from benchmark_csv_parser import ensure_dataset, save_results
+from compressed_input import READ_BUFFER_SIZE
+
+FORMATS = {
+    'gzip': ('gz', gzip.open),
+    'bzip2': ('bz2', bz2.open),
+    'xz': ('xz', lzma.open)
+}
+
+def ensure_compressed(filename: str, compression: str) -> str:
+    """
+    Get the path of a compressed copy of a dataset, creating it if needed
+
+    Args:
+        filename (str): Path to the uncompressed dataset
+        compression (str): 'gzip', 'bzip2' or 'xz'
+
+    Returns:
+        str: Path to the compressed copy
+    """
+    extension, opener = FORMATS[compression]
+    compressed = f"{filename}.{extension}"
+
+    if not os.path.exists(compressed):
+        print(f"Compressing '{filename}' with {compression}...")
+        with open(filename, 'rb') as source, opener(compressed, 'wb') as target:
+            shutil.copyfileobj(source, target, READ_BUFFER_SIZE)
+
+    return compressed
+
+def scan(filename: str) -> int:
+    """
+    Stream a CSV file and calculate statistics for its salary column
+
+    Args:
+        filename (str): Path to the (possibly compressed) CSV file
+
+    Returns:
+        int: Number of rows read
+    """
+    _, rows_read = csv_parser.calculate_statistics_streaming(csv_parser.iter_csv_rows(filename), "salary")
+    return rows_read
+
+def benchmark_streaming(compressed: str) -> Dict[str, float]:
+    """
+    Time reading a compressed file while decompressing it on the fly
+
+    Args:
+        compressed (str): Path to the compressed file
+
+    Returns:
+        Dict[str, float]: Elapsed seconds and temporary bytes written
+    """
+    start = time.perf_counter()
+    scan(compressed)
+    return {"seconds": time.perf_counter() - start, "temp_bytes": 0}
+
+def benchmark_decompress_first(compressed: str, compression: str, temp_dir: str) -> Dict[str, float]:
+    """
+    Time decompressing a file to disk and then reading the uncompressed copy
+
+    Args:
+        compressed (str): Path to the compressed file
+        compression (str): 'gzip', 'bzip2' or 'xz'
+        temp_dir (str): Directory for the temporary uncompressed copy
+
+    Returns:
+        Dict[str, float]: Elapsed seconds and temporary bytes written
+    """
+    start = time.perf_counter()
+    with tempfile.NamedTemporaryFile(dir=temp_dir, suffix='.csv', delete=False) as target:
+        with FORMATS[compression][1](compressed, 'rb') as source:
+            shutil.copyfileobj(source, target, READ_BUFFER_SIZE)
+    try:
+        temp_bytes = os.path.getsize(target.name)
+        scan(target.name)
+        return {"seconds": time.perf_counter() - start, "temp_bytes": temp_bytes}
+    finally:
+        os.remove(target.name)
+
+def run_benchmarks(scales: List[int], data_dir: str, formats: List[str], repeat: int = 1) -> List[Dict[str, Any]]:
+    """
+    Run both read paths for every compression format at every scale
+
+    Args:
+        scales (List[int]): Row counts to benchmark
+        data_dir (str): Directory holding the generated files
+        formats (List[str]): Compression formats to benchmark
+        repeat (int): Number of runs per benchmark; the fastest is kept
+
+    Returns:
+        List[Dict[str, Any]]: One result per format, read path and scale
+    """
+    results = []
+
+    for rows in scales:
+        filename = ensure_dataset(data_dir, rows)
+
+        for compression in formats:
+            compressed = ensure_compressed(filename, compression)
+            paths = {
+                "stream": lambda: benchmark_streaming(compressed),
+                "decompress_then_read": lambda: benchmark_decompress_first(compressed, compression, data_dir)
+            }
+
+            for path, run in paths.items():
+                best = min((run() for _ in range(repeat)), key=lambda result: result["seconds"])
+                result = {
+                    "benchmark": f"{compression}_{path}",
+                    "rows": rows,
+                    "seconds": round(best["seconds"], 4),
+                    "rows_per_sec": round(rows / best["seconds"]) if best["seconds"] else None,
+                    "temp_mb": round(best["temp_bytes"] / (1024 * 1024), 1)
+                }
+                results.append(result)
+                print(f"  {result['benchmark']:28} {rows:>12,} rows  {result['seconds']:>9.3f}s  "
+                      f"{result['rows_per_sec']:>12,} rows/s  {result['temp_mb']:>9.1f} MB temp")
+
+    return results
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """
+    Create and configure argument parser
+
+    Returns:
+        argparse.ArgumentParser: Configured parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark streaming decompression against decompress-then-read",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_compressed_input.py
+  python benchmark_compressed_input.py --rows 100000 --formats gzip --repeat 3
+        """
+    )
+
+    parser.add_argument(
+        '--rows', '-r',
+        type=int,
+        nargs='+',
+        default=[1_000_000],
+        help='Dataset sizes to benchmark (default: 1M rows)'
+    )
+
+    parser.add_argument(
+        '--formats',
+        nargs='+',
+        choices=list(FORMATS),
+        default=list(FORMATS),
+        help='Compression formats to benchmark (default: all)'
+    )
+
+    parser.add_argument(
+        '--data-dir',
+        default='benchmark_data',
+        help='Directory for the generated datasets and temporary files'
+    )
+
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=1,
+        help='Runs per benchmark; the fastest is reported'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        help='JSON file to save the results to'
+    )
+
+    return parser
+
+def main():
+    """
+    Main function to run the benchmarks
+    """
+    args = create_argument_parser().parse_args()
+
+    print(f"Benchmarking compressed input at {', '.join(f'{rows:,}' for rows in args.rows)} rows")
+    print("-" * 88)
+    results = run_benchmarks(args.rows, args.data_dir, args.formats, args.repeat)
+
+    if args.output:
+        save_results(results, args.output)
+
+if __name__ == "__main__":
+    main()
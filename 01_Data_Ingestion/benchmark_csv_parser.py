@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+CSV Parser Benchmarks - Measure throughput and memory of csv_parser.py
+
+Generates synthetic files shaped like sample_data.csv, times the parsing hot
+path at several scales and saves the results as JSON so runs can be compared.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import List, Dict, Any
+
+import csv_parser
+
+SCALES = [1_000_000, 10_000_000, 100_000_000]
+
+FIRST_NAMES = ["John", "Jane", "Bob", "Alice", "Charlie", "Diana", "Frank", "Grace", "Henry", "Ivy"]
+LAST_NAMES = ["Smith", "Doe", "Johnson", "Brown", "Wilson", "Davis", "Miller", "Lee", "Clark", "Young"]
+DEPARTMENTS = ["Engineering", "Marketing", "HR", "Sales", "Finance"]
+
+CLI_MODES = {
+    "cli": [],
+    "cli_stream": ["--stream"],
+    "cli_columnar": ["--columnar"]
+}
+
+def generate_csv(filename: str, rows: int, seed: int = 42) -> None:
+    """
+    Write a synthetic CSV file with the same columns as sample_data.csv
+
+    Args:
+        filename (str): Path of the file to write
+        rows (int): Number of data rows
+        seed (int): Random seed, so files are reproducible
+    """
+    rng = random.Random(seed)
+    batch = []
+
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        csvfile.write("name,age,salary,department,years_experience\n")
+        for _ in range(rows):
+            age = rng.randint(21, 65)
+            batch.append(f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)},{age},"
+                         f"{rng.randrange(35000, 150000, 500)},{rng.choice(DEPARTMENTS)},"
+                         f"{rng.randint(0, age - 21)}\n")
+            if len(batch) >= 10000:
+                csvfile.write(''.join(batch))
+                batch.clear()
+        csvfile.write(''.join(batch))
+
+def ensure_dataset(data_dir: str, rows: int) -> str:
+    """
+    Get the path of a synthetic dataset, generating it if it does not exist yet
+
+    Args:
+        data_dir (str): Directory holding the generated files
+        rows (int): Number of data rows
+
+    Returns:
+        str: Path to the dataset
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    filename = os.path.join(data_dir, f"synthetic_{rows}.csv")
+
+    if not os.path.exists(filename):
+        print(f"Generating {rows:,} rows into '{filename}'...")
+        start = time.perf_counter()
+        generate_csv(filename, rows)
+        print(f"Generated in {time.perf_counter() - start:.1f}s")
+
+    return filename
+
+def peak_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    """
+    Get the peak resident set size in megabytes
+
+    Args:
+        who (int): resource.RUSAGE_SELF or resource.RUSAGE_CHILDREN
+
+    Returns:
+        float: Peak RSS in MB
+    """
+    peak = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def _run_benchmark(name: str, filename: str, column: str, filter_column: str,
+                   filter_value: str) -> Dict[str, float]:
+    """
+    Run a single benchmark (inside its own process, so peak RSS is its own)
+
+    Args:
+        name (str): Benchmark name
+        filename (str): Dataset path
+        column (str): Column to calculate statistics for
+        filter_column (str): Column to filter by
+        filter_value (str): Value to filter for
+
+    Returns:
+        Dict[str, float]: Elapsed seconds and peak RSS in MB
+    """
+    if name in CLI_MODES:
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "csv_parser.py")
+        command = [sys.executable, script, filename, "--column", column,
+                   "--filter", filter_column, filter_value] + CLI_MODES[name]
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+        elapsed = time.perf_counter() - start
+        return {"seconds": elapsed, "peak_rss_mb": peak_rss_mb(resource.RUSAGE_CHILDREN)}
+
+    if name == "read_csv_file":
+        start = time.perf_counter()
+        csv_parser.read_csv_file(filename)
+        elapsed = time.perf_counter() - start
+    else:
+        data = csv_parser.read_csv_file(filename)
+        start = time.perf_counter()
+        if name == "filter_rows":
+            csv_parser.filter_rows(data, filter_column, filter_value)
+        else:
+            csv_parser.calculate_statistics(data, column)
+        elapsed = time.perf_counter() - start
+
+    return {"seconds": elapsed, "peak_rss_mb": peak_rss_mb()}
+
+def run_benchmarks(scales: List[int], data_dir: str, max_in_memory_rows: int,
+                   repeat: int = 1) -> List[Dict[str, Any]]:
+    """
+    Run every benchmark at every scale
+
+    In-memory benchmarks load the whole file as a list of dictionaries, so
+    they are skipped above max_in_memory_rows to avoid running out of memory.
+
+    Args:
+        scales (List[int]): Row counts to benchmark
+        data_dir (str): Directory holding the generated files
+        max_in_memory_rows (int): Largest scale for in-memory benchmarks
+        repeat (int): Number of runs per benchmark; the fastest is kept
+
+    Returns:
+        List[Dict[str, Any]]: One result per benchmark and scale
+    """
+    results = []
+    benchmarks = ["read_csv_file", "filter_rows", "calculate_statistics"] + list(CLI_MODES)
+
+    for rows in scales:
+        filename = ensure_dataset(data_dir, rows)
+
+        for name in benchmarks:
+            if name not in CLI_MODES and rows > max_in_memory_rows:
+                print(f"  {name:22} {rows:>12,} rows  skipped (above --max-in-memory-rows)")
+                continue
+
+            runs = []
+            for _ in range(repeat):
+                # A fresh process per run keeps peak RSS measurements independent
+                with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+                    runs.append(pool.apply(_run_benchmark, (name, filename, "salary",
+                                                            "department", "Engineering")))
+            best = min(runs, key=lambda run: run["seconds"])
+
+            result = {
+                "benchmark": name,
+                "rows": rows,
+                "seconds": round(best["seconds"], 4),
+                "rows_per_sec": round(rows / best["seconds"]) if best["seconds"] else None,
+                "peak_rss_mb": round(max(run["peak_rss_mb"] for run in runs), 1)
+            }
+            results.append(result)
+            print(f"  {name:22} {rows:>12,} rows  {result['seconds']:>9.3f}s  "
+                  f"{result['rows_per_sec']:>12,} rows/s  {result['peak_rss_mb']:>9.1f} MB")
+
+    return results
+
+def save_results(results: List[Dict[str, Any]], output: str) -> None:
+    """
+    Save benchmark results together with information about the environment
+
+    Args:
+        results (List[Dict[str, Any]]): Benchmark results
+        output (str): Path of the JSON file to write
+    """
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results
+    }
+    with open(output, 'w') as file:
+        json.dump(report, file, indent=2)
+    print(f"\nResults saved to '{output}'")
+
+def compare_results(results: List[Dict[str, Any]], baseline_file: str, threshold: float) -> List[str]:
+    """
+    Compare results with a previous run and list the regressions
+
+    Args:
+        results (List[Dict[str, Any]]): Current benchmark results
+        baseline_file (str): JSON file written by an earlier run
+        threshold (float): Allowed relative slowdown, e.g. 0.1 for 10%
+
+    Returns:
+        List[str]: Description of every benchmark that got slower than allowed
+    """
+    with open(baseline_file, 'r') as file:
+        baseline = {(r["benchmark"], r["rows"]): r for r in json.load(file)["results"]}
+
+    regressions = []
+    print(f"\nComparison with '{baseline_file}':")
+    for result in results:
+        previous = baseline.get((result["benchmark"], result["rows"]))
+        if not previous:
+            continue
+        change = result["seconds"] / previous["seconds"] - 1 if previous["seconds"] else 0.0
+        print(f"  {result['benchmark']:22} {result['rows']:>12,} rows  {change:+.1%}")
+        if change > threshold:
+            regressions.append(f"{result['benchmark']} at {result['rows']:,} rows is {change:.1%} slower")
+
+    return regressions
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """
+    Create and configure argument parser
+
+    Returns:
+        argparse.ArgumentParser: Configured parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark csv_parser.py on synthetic data",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_csv_parser.py
+  python benchmark_csv_parser.py --rows 100000 1000000 --output quick.json
+  python benchmark_csv_parser.py --compare baseline.json --threshold 0.15
+        """
+    )
+
+    parser.add_argument(
+        '--rows', '-r',
+        type=int,
+        nargs='+',
+        default=SCALES,
+        help='Dataset sizes to benchmark (default: 1M, 10M and 100M rows)'
+    )
+
+    parser.add_argument(
+        '--data-dir',
+        default='benchmark_data',
+        help='Directory for the generated datasets (reused between runs)'
+    )
+
+    parser.add_argument(
+        '--max-in-memory-rows',
+        type=int,
+        default=10_000_000,
+        help='Skip the in-memory benchmarks above this many rows'
+    )
+
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=1,
+        help='Runs per benchmark; the fastest is reported'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        default=f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        help='JSON file to save the results to'
+    )
+
+    parser.add_argument(
+        '--compare',
+        metavar='BASELINE',
+        help='JSON results of an earlier run to compare against'
+    )
+
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.10,
+        help='Relative slowdown counted as a regression (default: 0.10)'
+    )
+
+    return parser
+
+def main():
+    """
+    Main function to run the benchmarks
+    """
+    args = create_argument_parser().parse_args()
+
+    print(f"Benchmarking csv_parser.py at {', '.join(f'{rows:,}' for rows in args.rows)} rows")
+    print("-" * 80)
+    results = run_benchmarks(args.rows, args.data_dir, args.max_in_memory_rows, args.repeat)
+    save_results(results, args.output)
+
+    if args.compare:
+        regressions = compare_results(results, args.compare, args.threshold)
+        if regressions:
+            print("\nRegressions found:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\nNo regressions found.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Benchmarks - json_codec against the standard json module
+
+Generates documents shaped like company_data.json scaled up to the requested
+sizes, then times parsing and 2-space indented serialization with json and
+with json_codec, checking that both produce the same results.
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from typing import List, Dict, Any, Callable
+
+import json_codec
+from benchmark_csv_parser import save_results
+
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'company_data.json')
+
+def vary_company(company: Dict[str, Any], index: int, rng: random.Random) -> Dict[str, Any]:
+    """
+    Create a copy of a company record with different names and numbers
+
+    Args:
+        company (Dict[str, Any]): Record from company_data.json
+        index (int): Number of the copy, appended to its names
+        rng (random.Random): Source of the varied numbers
+
+    Returns:
+        Dict[str, Any]: Copy with the same structure
+    """
+    def vary(value, key=None):
+        if isinstance(value, dict):
+            return {k: vary(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [vary(item) for item in value]
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, int):
+            return max(1, round(value * rng.uniform(0.5, 1.5)))
+        if isinstance(value, float):
+            return round(value * rng.uniform(0.5, 1.5), 4)
+        if key in ('name', 'head', 'lead'):
+            return f"{value} {index}"
+        return value
+
+    return vary(company)
+
+def ensure_document(data_dir: str, size_mb: int, seed: int = 42) -> str:
+    """
+    Get the path of a scaled company document, generating it if needed
+
+    Args:
+        data_dir (str): Directory holding the generated files
+        size_mb (int): Approximate size of the document in megabytes
+        seed (int): Seed for the varied numbers
+
+    Returns:
+        str: Path to the document
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    filename = os.path.join(data_dir, f"company_data_{size_mb}mb.json")
+
+    if not os.path.exists(filename):
+        print(f"Generating ~{size_mb} MB of company records into '{filename}'...")
+        with open(TEMPLATE_FILE, 'r') as file:
+            company = json.load(file)['company']
+
+        rng = random.Random(seed)
+        copies = max(1, size_mb * 1024 * 1024 // len(json.dumps(company, indent=4)))
+        with open(filename, 'w') as file:
+            json.dump({"companies": [vary_company(company, index, rng) for index in range(copies)]},
+                      file, indent=4)
+
+    return filename
+
+def best_time(run: Callable[[], Any], repeat: int) -> float:
+    """
+    Time a function several times
+
+    Args:
+        run (Callable[[], Any]): Function to time
+        repeat (int): Number of runs
+
+    Returns:
+        float: Fastest run in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run_benchmarks(sizes: List[int], data_dir: str, repeat: int = 1) -> List[Dict[str, Any]]:
+    """
+    Time parsing and serialization with both codecs at every document size
+
+    Args:
+        sizes (List[int]): Document sizes in megabytes
+        data_dir (str): Directory holding the generated files
+        repeat (int): Number of runs per benchmark; the fastest is kept
+
+    Returns:
+        List[Dict[str, Any]]: One result per operation, codec and size
+    """
+    results = []
+
+    for size_mb in sizes:
+        filename = ensure_document(data_dir, size_mb)
+        with open(filename, 'r') as file:
+            text = file.read()
+        megabytes = len(text) / (1024 * 1024)
+
+        data = json.loads(text)
+        if json_codec.loads(text) != data:
+            raise AssertionError(f"json_codec parsed '{filename}' differently from json")
+        if json_codec.dumps(data, indent=2) != json.dumps(data, indent=2):
+            raise AssertionError(f"json_codec serialized '{filename}' differently from json")
+
+        operations = {
+            "parse": (lambda: json.loads(text), lambda: json_codec.loads(text)),
+            "dump": (lambda: json.dumps(data, indent=2), lambda: json_codec.dumps(data, indent=2))
+        }
+
+        for operation, (stdlib_run, codec_run) in operations.items():
+            stdlib_seconds = best_time(stdlib_run, repeat)
+            codec_seconds = best_time(codec_run, repeat)
+
+            for codec, seconds in (("json", stdlib_seconds), (f"json_codec[{json_codec.BACKEND}]", codec_seconds)):
+                result = {
+                    "benchmark": f"{operation}_{codec}",
+                    "megabytes": round(megabytes, 1),
+                    "seconds": round(seconds, 4),
+                    "mb_per_sec": round(megabytes / seconds, 1) if seconds else None,
+                    "speedup": round(stdlib_seconds / seconds, 2) if seconds else None
+                }
+                results.append(result)
+                print(f"  {result['benchmark']:28} {megabytes:>9.1f} MB  {result['seconds']:>9.3f}s  "
+                      f"{result['mb_per_sec']:>9.1f} MB/s  {result['speedup']:>6.2f}x")
+
+    return results
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """
+    Create and configure argument parser
+
+    Returns:
+        argparse.ArgumentParser: Configured parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark json_codec against the standard json module",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python benchmark_json_codec.py
+  python benchmark_json_codec.py --size-mb 10 100 --repeat 3 -o json_codec.json
+        """
+    )
+
+    parser.add_argument(
+        '--size-mb', '-s',
+        type=int,
+        nargs='+',
+        default=[100, 300],
+        help='Document sizes to benchmark in megabytes (default: 100 300)'
+    )
+
+    parser.add_argument(
+        '--data-dir',
+        default='benchmark_data',
+        help='Directory for the generated documents'
+    )
+
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=1,
+        help='Runs per benchmark; the fastest is reported'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        help='JSON file to save the results to'
+    )
+
+    return parser
+
+def main():
+    """
+    Main function to run the benchmarks
+    """
+    args = create_argument_parser().parse_args()
+
+    print(f"Benchmarking json_codec ({json_codec.BACKEND} backend) at "
+          f"{', '.join(f'{size} MB' for size in args.size_mb)}")
+    print("-" * 80)
+    results = run_benchmarks(args.size_mb, args.data_dir, args.repeat)
+
+    if args.output:
+        save_results(results, args.output)
+
+if __name__ == "__main__":
+    main()
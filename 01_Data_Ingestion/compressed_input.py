@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compressed Input - Open plain, gzip, bzip2 or xz files as one text stream
+
+The compression is detected from the magic bytes at the start of the file,
+not from its extension, and the data is decompressed while it is read, so
+compressed inputs never have to be unpacked to disk first.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+from typing import Optional
+
+READ_BUFFER_SIZE = 1 << 20
+
+MAGIC_BYTES = {
+    'gzip': b'\x1f\x8b',
+    'bzip2': b'BZh',
+    'xz': b'\xfd7zXZ\x00'
+}
+
+DECOMPRESSORS = {
+    'gzip': gzip.GzipFile,
+    'bzip2': bz2.BZ2File,
+    'xz': lzma.LZMAFile
+}
+
+def detect_compression(filename: str) -> Optional[str]:
+    """
+    Detect the compression of a file from its magic bytes
+
+    Args:
+        filename (str): Path to the file
+
+    Returns:
+        Optional[str]: 'gzip', 'bzip2' or 'xz', or None for uncompressed files
+    """
+    with open(filename, 'rb') as file:
+        header = file.read(6)
+
+    for compression, magic in MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return compression
+    return None
+
+def open_text(filename: str, encoding: str = 'utf-8', newline: Optional[str] = '',
+              buffer_size: int = READ_BUFFER_SIZE) -> io.TextIOBase:
+    """
+    Open a possibly compressed file for reading as text
+
+    Compressed files are decompressed on the fly behind a large read buffer,
+    so the caller sees the same text stream as for the uncompressed file.
+
+    Args:
+        filename (str): Path to the file
+        encoding (str): Text encoding of the (decompressed) contents
+        newline (Optional[str]): Newline handling, '' as required by the csv module
+        buffer_size (int): Size of the read buffer in bytes
+
+    Returns:
+        io.TextIOBase: Text stream over the decompressed contents
+    """
+    compression = detect_compression(filename)
+    if compression is None:
+        return open(filename, 'r', buffering=buffer_size, encoding=encoding, newline=newline)
+
+    decompressed = io.BufferedReader(DECOMPRESSORS[compression](filename), buffer_size)
+    return io.TextIOWrapper(decompressed, encoding=encoding, newline=newline)
@@ -5,21 +5,42 @@ CSV Parser - A command-line tool for parsing and analyzing CSV files
 
 import csv
 import argparse
+import ast
+import contextlib
+import hashlib
+import io
+import itertools
+import json
+import math
+import mmap
+import multiprocessing
+import operator
+import os
+import re
 import sys
-from typing import List, Dict, Any, Optional
+from array import array
+from typing import List, Dict, Any, Optional, Iterator, Iterable, Callable, Tuple, Union, NamedTuple
 
-def read_csv_file(filename: str) -> List[Dict[str, Any]]:
+from compressed_input import detect_compression, open_text
+
+def read_csv_file(filename: str, where: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Read CSV file and return list of dictionaries
     
+    Files compressed with gzip, bzip2 or xz are decompressed while reading.
+    
     Args:
         filename (str): Path to the CSV file
-        
+        where (Optional[str]): Condition rows must satisfy (see compile_predicate);
+            other rows are dropped before being turned into dictionaries
+    
     Returns:
         List[Dict[str, Any]]: List of rows as dictionaries
     """
     try:
-        with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
+        with open_text(filename) as csvfile:
+            if where:
+                return list(_read_matching_rows(csvfile, where))
             reader = csv.DictReader(csvfile)
             return list(reader)
     except FileNotFoundError:
@@ -29,13 +50,253 @@ def read_csv_file(filename: str) -> List[Dict[str, Any]]:
         print(f"Error reading file: {e}")
         sys.exit(1)
 
+def iter_csv_rows(filename: str, where: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Read CSV file lazily, yielding one row dictionary at a time
+    
+    Args:
+        filename (str): Path to the CSV file
+        where (Optional[str]): Condition rows must satisfy (see compile_predicate)
+    
+    Yields:
+        Dict[str, Any]: Each row as a dictionary
+    """
+    try:
+        with open_text(filename) as csvfile:
+            if where:
+                yield from _read_matching_rows(csvfile, where)
+            else:
+                yield from csv.DictReader(csvfile)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
+
+def read_csv_header(filename: str) -> List[str]:
+    """
+    Read only the header line of a CSV file
+    
+    Args:
+        filename (str): Path to the CSV file
+    
+    Returns:
+        List[str]: Column names
+    """
+    try:
+        with open_text(filename) as csvfile:
+            return next(csv.reader(csvfile), [])
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
+
+def rows_to_dicts(records: Iterable[List[str]], fieldnames: List[str],
+                  predicate: Optional[Callable[[List[str]], bool]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Turn parsed CSV records into row dictionaries the way csv.DictReader does
+    
+    Records rejected by the predicate are skipped before any dictionary is built.
+    
+    Args:
+        records (Iterable[List[str]]): Records from csv.reader
+        fieldnames (List[str]): Column names
+        predicate (Optional[Callable]): Compiled condition, see compile_predicate
+    
+    Yields:
+        Dict[str, Any]: Each accepted row as a dictionary
+    """
+    width = len(fieldnames)
+    for record in records:
+        if not record or (predicate and not predicate(record)):
+            continue
+        row = dict(zip(fieldnames, record))
+        if len(record) > width:
+            row[None] = record[width:]
+        elif len(record) < width:
+            for name in fieldnames[len(record):]:
+                row[name] = None
+        yield row
+
+def _read_matching_rows(csvfile, where: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of an open CSV file that satisfy a condition
+    
+    Args:
+        csvfile: CSV file opened in text mode
+        where (str): Condition rows must satisfy
+    
+    Yields:
+        Dict[str, Any]: Each matching row as a dictionary
+    """
+    reader = csv.reader(csvfile)
+    fieldnames = next(reader, [])
+    yield from rows_to_dicts(reader, fieldnames, compile_predicate(where, fieldnames))
+
+_COMPARISON_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge
+}
+
+_REVERSED_OPERATORS = {ast.Lt: ast.Gt(), ast.LtE: ast.GtE(), ast.Gt: ast.Lt(), ast.GtE: ast.LtE()}
+
+def compile_predicate(expression: str, fieldnames: List[str]) -> Callable[[List[str]], bool]:
+    """
+    Compile a condition such as "salary > 50000 and department == 'Engineering'"
+    
+    The expression is parsed once into a tree of small closures that work
+    directly on csv.reader records, so rows can be tested before they are
+    turned into dictionaries. Supported are and/or/not, parentheses, the
+    comparisons ==, !=, <, <=, >, >= (also chained) and in / not in with a
+    list of constants. Comparisons against numbers are numeric, and cells
+    that are not numbers never match them; comparisons against strings are
+    case-insensitive and ignore surrounding whitespace, like --filter.
+    
+    Args:
+        expression (str): Condition to compile
+        fieldnames (List[str]): Column names of the CSV file
+    
+    Returns:
+        Callable[[List[str]], bool]: Predicate over a record
+    
+    Raises:
+        ValueError: If the expression is invalid or uses an unknown column
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"{e.msg} in '{expression}'")
+    return _compile_node(tree.body, fieldnames)
+
+def _compile_node(node: ast.AST, fieldnames: List[str]) -> Callable[[List[str]], bool]:
+    """
+    Compile one node of a condition expression
+    
+    Args:
+        node (ast.AST): Expression node
+        fieldnames (List[str]): Column names of the CSV file
+    
+    Returns:
+        Callable[[List[str]], bool]: Predicate over a record
+    """
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile_node(value, fieldnames) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda record: all(part(record) for part in parts)
+        return lambda record: any(part(record) for part in parts)
+    
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _compile_node(node.operand, fieldnames)
+        return lambda record: not operand(record)
+    
+    if isinstance(node, ast.Compare):
+        checks = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            checks.append(_compile_comparison(left, op, right, fieldnames))
+            left = right
+        if len(checks) == 1:
+            return checks[0]
+        return lambda record: all(check(record) for check in checks)
+    
+    raise ValueError(f"Unsupported expression '{ast.unparse(node)}'")
+
+def _constant_value(node: ast.AST) -> Union[str, float]:
+    """
+    Get the value of a constant in a condition expression
+    
+    Args:
+        node (ast.AST): Expression node
+    
+    Returns:
+        Union[str, float]: Normalized constant (lowercased string or float)
+    """
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_constant_value(node.operand)
+    if isinstance(node, ast.Constant) and not isinstance(node.value, bool):
+        if isinstance(node.value, str):
+            return node.value.strip().lower()
+        if isinstance(node.value, (int, float)):
+            return float(node.value)
+    raise ValueError(f"Expected a string or number, got '{ast.unparse(node)}'")
+
+def _compile_comparison(left: ast.AST, op: ast.cmpop, right: ast.AST,
+                        fieldnames: List[str]) -> Callable[[List[str]], bool]:
+    """
+    Compile a single comparison between a column and a constant
+    
+    Args:
+        left (ast.AST): Left operand
+        op (ast.cmpop): Comparison operator
+        right (ast.AST): Right operand
+        fieldnames (List[str]): Column names of the CSV file
+    
+    Returns:
+        Callable[[List[str]], bool]: Predicate over a record
+    """
+    # Put the column on the left: "50000 < salary" becomes "salary > 50000"
+    if not isinstance(left, ast.Name) and isinstance(right, ast.Name) and type(op) in _REVERSED_OPERATORS:
+        left, op, right = right, _REVERSED_OPERATORS[type(op)], left
+    
+    if not isinstance(left, ast.Name):
+        raise ValueError(f"Comparisons need a column name, got '{ast.unparse(left)}'")
+    if left.id not in fieldnames:
+        raise ValueError(f"Column '{left.id}' not found in CSV file")
+    
+    index = fieldnames.index(left.id)
+    
+    if isinstance(op, (ast.In, ast.NotIn)):
+        if not isinstance(right, (ast.List, ast.Tuple, ast.Set)):
+            raise ValueError(f"Expected a list of values, got '{ast.unparse(right)}'")
+        values = [_constant_value(element) for element in right.elts]
+        texts = {value for value in values if isinstance(value, str)}
+        numbers = {value for value in values if isinstance(value, float)}
+        negate = isinstance(op, ast.NotIn)
+        
+        def check_membership(record):
+            cell = record[index] if index < len(record) else ''
+            found = cell.strip().lower() in texts
+            if not found and numbers:
+                try:
+                    found = float(cell) in numbers
+                except ValueError:
+                    pass
+            return found != negate
+        
+        return check_membership
+    
+    compare = _COMPARISON_OPERATORS[type(op)]
+    target = _constant_value(right)
+    
+    if isinstance(target, float):
+        def check_number(record):
+            try:
+                return compare(float(record[index]), target)
+            except (ValueError, IndexError):
+                return False
+        
+        return check_number
+    
+    def check_text(record):
+        cell = record[index] if index < len(record) else ''
+        return compare(cell.strip().lower(), target)
+    
+    return check_text
+
 def is_numeric(value: str) -> bool:
     """
     Check if a string value can be converted to a number
     
     Args:
         value (str): String value to check
-        
+    
     Returns:
         bool: True if numeric, False otherwise
     """
@@ -51,7 +312,7 @@ def convert_to_number(value: str) -> float:
     
     Args:
         value (str): String value to convert
-        
+    
     Returns:
         float: Converted number
     """
@@ -63,94 +324,1725 @@ def convert_to_number(value: str) -> float:
     except ValueError:
         return 0.0
 
-def calculate_statistics(data: List[Dict[str, Any]], column: str) -> Dict[str, float]:
+NUMERIC_KINDS = ('int', 'float')
+# Distinct rejected values shown in a skipped-values warning
+REJECT_EXAMPLES = 3
+
+def schema_path(filename: str) -> str:
     """
-    Calculate average, min, and max for a numerical column
+    Get the path of the sidecar schema file of a CSV file
     
     Args:
-        data (List[Dict[str, Any]]): CSV data as list of dictionaries
-        column (str): Column name to analyze
+        filename (str): Path to the CSV file
+    
+    Returns:
+        str: Path of the schema file
+    """
+    return f"{filename}.schema.json"
+
+def infer_schema(filename: str, sample_rows: int = 1000) -> Dict[str, str]:
+    """
+    Choose a parse plan for every column from the first rows of a CSV file
+    
+    A column is int or float when at least 90% of its non-empty sampled
+    values parse as such, categorical when its values repeat (at most half
+    of them distinct) and string otherwise.
+    
+    Args:
+        filename (str): Path to the CSV file
+        sample_rows (int): Number of data rows to sample
+    
+    Returns:
+        Dict[str, str]: Column kind ('int', 'float', 'categorical', 'string') per column
+    """
+    with open_text(filename) as csvfile:
+        reader = csv.reader(csvfile)
+        fieldnames = next(reader, [])
+        samples = [[] for _ in fieldnames]
+        for record in itertools.islice(filter(None, reader), sample_rows):
+            for values, value in zip(samples, record):
+                value = value.strip()
+                if value:
+                    values.append(value)
+    
+    plan = {}
+    for name, values in zip(fieldnames, samples):
+        ints = floats = 0
+        for value in values:
+            try:
+                int(value)
+                ints += 1
+            except ValueError:
+                if is_numeric(value):
+                    floats += 1
         
+        if values and ints + floats >= 0.9 * len(values):
+            plan[name] = 'float' if floats else 'int'
+        elif values and len(set(values)) <= len(values) / 2:
+            plan[name] = 'categorical'
+        else:
+            plan[name] = 'string'
+    
+    return plan
+
+def save_schema(filename: str, plan: Dict[str, str], sample_rows: int) -> str:
+    """
+    Save a parse plan next to the CSV file it was inferred from
+    
+    Args:
+        filename (str): Path to the CSV file
+        plan (Dict[str, str]): Column kind per column
+        sample_rows (int): Number of rows the plan was inferred from
+    
     Returns:
-        Dict[str, float]: Dictionary with avg, min, max values
+        str: Path of the written schema file
     """
-    if not data:
-        return {"avg": 0, "min": 0, "max": 0, "count": 0}
+    source = os.stat(filename)
+    schema = {
+        'source_size': source.st_size,
+        'source_mtime_ns': source.st_mtime_ns,
+        'sample_rows': sample_rows,
+        'columns': plan
+    }
     
-    # Check if column exists
-    if column not in data[0]:
-        print(f"Error: Column '{column}' not found in CSV file.")
-        available_columns = list(data[0].keys())
-        print(f"Available columns: {', '.join(available_columns)}")
+    path = schema_path(filename)
+    with open(path, 'w') as schema_file:
+        json.dump(schema, schema_file, indent=2)
+    
+    return path
+
+def load_schema(filename: str, sample_rows: Optional[int] = None) -> Optional[Dict[str, str]]:
+    """
+    Load the saved parse plan of a CSV file
+    
+    Args:
+        filename (str): Path to the CSV file
+        sample_rows (Optional[int]): Number of rows the plan must have been
+            inferred from; any saved plan is accepted when None
+    
+    Returns:
+        Optional[Dict[str, str]]: Column kind per column, or None when the plan
+            is missing, the file changed since it was saved, or the plan was
+            inferred from a different number of rows
+    """
+    try:
+        source = os.stat(filename)
+        with open(schema_path(filename), 'r') as schema_file:
+            schema = json.load(schema_file)
+    except (OSError, ValueError):
+        return None
+    
+    if (schema.get('source_size'), schema.get('source_mtime_ns')) != (source.st_size, source.st_mtime_ns):
+        return None
+    if sample_rows is not None and schema.get('sample_rows') != sample_rows:
+        return None
+    return schema['columns']
+
+def load_or_infer_schema(filename: str, sample_rows: int = 1000) -> Dict[str, str]:
+    """
+    Load the saved parse plan of a CSV file, inferring and saving it if needed
+    
+    Args:
+        filename (str): Path to the CSV file
+        sample_rows (int): Number of data rows to sample when inferring
+    
+    Returns:
+        Dict[str, str]: Column kind per column
+    """
+    plan = load_schema(filename, sample_rows)
+    if plan is not None:
+        print(f"Using schema: {schema_path(filename)}")
+        return plan
+    
+    try:
+        plan = infer_schema(filename, sample_rows)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
         sys.exit(1)
     
-    # Extract numerical values from the column
-    numerical_values = []
-    for row in data:
-        value = row[column].strip()
-        if is_numeric(value):
-            numerical_values.append(convert_to_number(value))
+    try:
+        path = save_schema(filename, plan, sample_rows)
+        print(f"Schema inferred from the first {sample_rows} rows, written to: {path}")
+    except OSError as e:
+        print(f"Warning: Could not write schema: {e}")
+    print("  " + ", ".join(f"{name}: {kind}" for name, kind in plan.items()))
+    
+    return plan
+
+def convert_values(values: List[str], kind: str) -> Tuple[List[float], List[str]]:
+    """
+    Convert the raw values of a column with the converter of its planned kind
+    
+    Numeric columns are converted with a single map(float, ...) call and only
+    fall back to per-value handling when the column contains rejects. Other
+    columns repeat their values, so each distinct value is parsed once.
+    
+    Args:
+        values (List[str]): Raw cell values
+        kind (str): Planned column kind
+    
+    Returns:
+        Tuple[List[float], List[str]]: Parsed numbers and the rejected values
+    """
+    rejects = []
+    
+    if kind in NUMERIC_KINDS:
+        try:
+            return list(map(float, values)), rejects
+        except ValueError:
+            pass
+        
+        numbers = []
+        for value in values:
+            try:
+                numbers.append(float(value))
+            except ValueError:
+                rejects.append(value.strip())
+        return numbers, rejects
+    
+    parsed = {}
+    numbers = []
+    for value in values:
+        if value not in parsed:
+            parsed[value] = float(value) if is_numeric(value) else None
+        number = parsed[value]
+        if number is None:
+            rejects.append(value.strip())
         else:
-            print(f"Warning: Non-numeric value '{value}' found in column '{column}', skipping...")
+            numbers.append(number)
+    return numbers, rejects
 
-    if not numerical_values:
-        print(f"Error: No numerical values found in column '{column}'")
-        sys.exit(1)
+def print_skipped(column: str, skipped: int, empty: int, shown: List[str]) -> None:
+    """
+    Print the summary line for the values skipped in a column
     
-    # Calculate statistics
-    avg_value = sum(numerical_values) / len(numerical_values)
-    min_value = min(numerical_values)
-    max_value = max(numerical_values)
+    Args:
+        column (str): Column name
+        skipped (int): Number of skipped values, empty ones included
+        empty (int): Number of empty values among them
+        shown (List[str]): Distinct non-empty rejected values to show
+    """
+    details = [f"{empty} empty"] if empty else []
+    if shown:
+        details.append("e.g. " + ", ".join(f"'{value}'" for value in shown))
+    print(f"Warning: Skipped {skipped} non-numeric values in column '{column}' ({'; '.join(details)})")
+
+def report_rejects(column: str, rejects: List[str], examples: int = REJECT_EXAMPLES) -> None:
+    """
+    Print one summary line for the non-numeric values skipped in a column
     
-    return {
-        "avg": round(avg_value, 2),
-        "min": min_value,
-        "max": max_value,
-        "count": len(numerical_values)
-    }
+    Args:
+        column (str): Column name
+        rejects (List[str]): Rejected values
+        examples (int): Number of distinct rejected values to show
+    """
+    shown = list(dict.fromkeys(value for value in rejects if value))[:examples]
+    print_skipped(column, len(rejects), rejects.count(''), shown)
+
+def report_skipped(column: str, stats: 'RunningStatistics') -> None:
+    """
+    Print one summary line for the cells a streaming accumulator skipped
+    
+    The line is the same as report_rejects prints for the same cells.
+    
+    Args:
+        column (str): Column name
+        stats (RunningStatistics): Accumulator with null and non-numeric counts
+    """
+    skipped = stats.null_count + stats.invalid_count
+    if skipped:
+        print_skipped(column, skipped, stats.null_count, stats.invalid_examples)
+
+def parse_cell(value: str, kind: Optional[str] = None) -> Optional[float]:
+    """
+    Convert a stripped cell value to a number for a streaming accumulator
+    
+    With a planned kind the value is converted as convert_values does: with
+    float for numeric columns, and through the cached is_numeric check for
+    the rest, whose values are mostly not numbers.
+    
+    Args:
+        value (str): Stripped cell value
+        kind (Optional[str]): Planned column kind (see infer_schema), or None
+            without a schema
+    
+    Returns:
+        Optional[float]: The number, or None if the value is not numeric
+    """
+    if kind in NUMERIC_KINDS:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    if kind is not None:
+        return float(value) if is_numeric(value) else None
+    return convert_to_number(value) if is_numeric(value) else None
+
+def number_text(number: float) -> str:
+    """
+    Format a number the way NumericColumn writes its cells back as text
+    
+    Args:
+        number (float): Finite number
+    
+    Returns:
+        str: Text of the number, without a fraction for whole numbers
+    """
+    return str(int(number)) if number.is_integer() else repr(number)
+
+def canonical_number(value: str) -> Optional[float]:
+    """
+    Parse a cell only if number_text gives back exactly the same text
+    
+    Cells such as '007', '5.0', ' 5', '1e3', 'nan' or 'inf' are numeric but
+    would not survive the round trip, or would be converted differently by
+    the row-based functions, so they are not treated as canonical.
+    
+    Args:
+        value (str): Raw cell value
+    
+    Returns:
+        Optional[float]: The number, or None when the cell is not canonical
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(number) or 'e' in value or number_text(number) != value:
+        return None
+    return number
+
+class NumericColumn:
+    """
+    Column of numbers stored in a compact typed array
+    
+    Only cells in canonical form (see canonical_number) are stored as numbers,
+    so every cell gives back its original text. Any other cell is kept as NaN
+    in the array and its raw text is remembered in a sparse raw dictionary.
+    """
+    
+    def __init__(self):
+        self.values = array('d')
+        self.raw = {}
+    
+    def append(self, value: str) -> None:
+        """
+        Parse a raw cell value and append it to the column
+        
+        Args:
+            value (str): Raw cell value
+        """
+        number = canonical_number(value)
+        if number is None:
+            self.raw[len(self.values)] = value
+            number = math.nan
+        self.values.append(number)
+    
+    def text(self, index: int) -> str:
+        """
+        Get the text representation of a cell
+        
+        Args:
+            index (int): Row index
+        
+        Returns:
+            str: Cell value as text, exactly as it was read
+        """
+        if index in self.raw:
+            return self.raw[index]
+        return number_text(self.values[index])
+
+class CategoricalColumn:
+    """
+    Column of strings stored as dictionary-encoded integer codes
+    """
+    
+    def __init__(self):
+        self.codes = array('L')
+        self.categories = []
+        self.lookup = {}
+    
+    def append(self, value: str) -> None:
+        """
+        Encode a raw cell value and append it to the column
+        
+        Args:
+            value (str): Raw cell value
+        """
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+    
+    def text(self, index: int) -> str:
+        """
+        Get the text representation of a cell
+        
+        Args:
+            index (int): Row index
+        
+        Returns:
+            str: Cell value as text
+        """
+        return self.categories[self.codes[index]]
+
+class ColumnarData:
+    """
+    CSV data stored as one typed column per field
+    
+    An optional selection of row indices makes filtered results cheap views
+    over the same columns. Iterating or indexing yields row dictionaries, so
+    the display functions work unchanged.
+    """
+    
+    def __init__(self, fieldnames: List[str], columns: Dict[str, Any], num_rows: int,
+                 selection: Optional[array] = None):
+        self.fieldnames = fieldnames
+        self.columns = columns
+        self.num_rows = num_rows
+        self.selection = selection
+    
+    def row_indices(self) -> Iterable[int]:
+        """
+        Get the indices of the selected rows
+        
+        Returns:
+            Iterable[int]: Row indices in file order
+        """
+        return range(self.num_rows) if self.selection is None else self.selection
+    
+    def select(self, indices: Iterable[int]) -> 'ColumnarData':
+        """
+        Create a view containing only the given rows
+        
+        Args:
+            indices (Iterable[int]): Row indices to keep
+        
+        Returns:
+            ColumnarData: View over the same columns
+        """
+        return ColumnarData(self.fieldnames, self.columns, self.num_rows, array('L', indices))
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Materialize a single row as a dictionary
+        
+        Args:
+            index (int): Row index
+        
+        Returns:
+            Dict[str, Any]: Row as a dictionary
+        """
+        return {name: self.columns[name].text(index) for name in self.fieldnames}
+    
+    def __len__(self) -> int:
+        return len(self.row_indices())
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.row(index) for index in self.row_indices())
+    
+    def __getitem__(self, position: int) -> Dict[str, Any]:
+        return self.row(self.row_indices()[position])
+
+def read_csv_columns(filename: str, where: Optional[str] = None,
+                     schema: Optional[Dict[str, str]] = None) -> ColumnarData:
+    """
+    Read CSV file into typed columns, parsing every value exactly once
+    
+    The type of each column is taken from the schema when one is given, and
+    otherwise chosen from the first data row: columns whose first value is
+    numeric become NumericColumn, the rest CategoricalColumn.
+    
+    Args:
+        filename (str): Path to the CSV file
+        where (Optional[str]): Condition rows must satisfy (see compile_predicate)
+        schema (Optional[Dict[str, str]]): Column kind per column (see infer_schema)
+    
+    Returns:
+        ColumnarData: Columnar representation of the file
+    """
+    try:
+        with open_text(filename) as csvfile:
+            reader = csv.reader(csvfile)
+            fieldnames = next(reader, [])
+            predicate = compile_predicate(where, fieldnames) if where else None
+            columns = {}
+            appenders = []
+            num_rows = 0
+            
+            for record in reader:
+                if not record or (predicate and not predicate(record)):
+                    continue
+                if len(record) < len(fieldnames):
+                    record += [''] * (len(fieldnames) - len(record))
+                
+                if not appenders:
+                    for name, value in zip(fieldnames, record):
+                        numeric = (schema[name] in NUMERIC_KINDS if schema and name in schema
+                                   else is_numeric(value.strip()))
+                        column = NumericColumn() if numeric else CategoricalColumn()
+                        columns[name] = column
+                        appenders.append(column.append)
+                
+                for append, value in zip(appenders, record):
+                    append(value)
+                num_rows += 1
+            
+            for name in fieldnames:
+                columns.setdefault(name, CategoricalColumn())
+            
+            return ColumnarData(fieldnames, columns, num_rows)
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
+
+def column_cache_dir(filename: str) -> str:
+    """
+    Get the directory holding the binary column cache of a CSV file
+    
+    Args:
+        filename (str): Path to the CSV file
+    
+    Returns:
+        str: Path of the cache directory
+    """
+    return f"{filename}.colcache"
+
+def _file_digest(filename: str) -> str:
+    """
+    Hash the contents of a file without loading it into memory
+    
+    Args:
+        filename (str): Path to the file
+    
+    Returns:
+        str: Hex digest of the contents
+    """
+    digest = hashlib.blake2b()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _map_array(path: str, typecode: str) -> Union[memoryview, array]:
+    """
+    Memory-map a file written with array.tofile as a typed, read-only view
+    
+    Args:
+        path (str): Path of the column file
+        typecode (str): Array typecode the file was written with
+    
+    Returns:
+        Union[memoryview, array]: Typed view over the file contents
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return array(typecode)
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast(typecode)
+
+def write_column_cache(filename: str, data: ColumnarData, digest: Optional[str] = None) -> str:
+    """
+    Write columnar data to a binary cache next to the CSV file
+    
+    Every column is stored as the raw bytes of its typed array (values for
+    numeric columns, codes for categorical ones). A JSON manifest, written
+    last, records the source size, mtime and content hash, the column types,
+    categories and rejected cells.
+    
+    Args:
+        filename (str): Path to the CSV file the data was read from
+        data (ColumnarData): Unfiltered columnar data
+        digest (Optional[str]): Content hash of the source, computed if not given
+    
+    Returns:
+        str: Path of the cache directory
+    """
+    cache_dir = column_cache_dir(filename)
+    manifest_path = os.path.join(cache_dir, 'manifest.json')
+    os.makedirs(cache_dir, exist_ok=True)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    
+    source = os.stat(filename)
+    columns = []
+    for position, name in enumerate(data.fieldnames):
+        column = data.columns[name]
+        entry = {'name': name, 'file': f"{position}.bin"}
+        if isinstance(column, NumericColumn):
+            values = column.values
+            entry.update(kind='numeric', raw=column.raw)
+        else:
+            values = column.codes
+            entry.update(kind='categorical', categories=column.categories)
+        entry.update(typecode=values.typecode if isinstance(values, array) else values.format,
+                     itemsize=values.itemsize)
+        
+        with open(os.path.join(cache_dir, entry['file']), 'wb') as column_file:
+            column_file.write(values)
+        columns.append(entry)
+    
+    manifest = {
+        'source': os.path.abspath(filename),
+        'source_size': source.st_size,
+        'source_mtime_ns': source.st_mtime_ns,
+        'source_digest': digest or _file_digest(filename),
+        'num_rows': data.num_rows,
+        'fieldnames': data.fieldnames,
+        'columns': columns
+    }
+    with open(manifest_path, 'w') as manifest_file:
+        json.dump(manifest, manifest_file)
+    
+    return cache_dir
+
+def read_column_cache(filename: str) -> Optional[ColumnarData]:
+    """
+    Load columnar data from the binary cache, memory-mapping every column
+    
+    The cache is used when the source has the recorded size and either the
+    recorded mtime or, if only the mtime changed, the recorded content hash.
+    
+    Args:
+        filename (str): Path to the CSV file
+    
+    Returns:
+        Optional[ColumnarData]: Cached data, or None when there is no valid cache
+    """
+    cache_dir = column_cache_dir(filename)
+    manifest_path = os.path.join(cache_dir, 'manifest.json')
+    try:
+        source = os.stat(filename)
+        with open(manifest_path, 'r') as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    
+    if manifest['source_size'] != source.st_size:
+        return None
+    if manifest['source_mtime_ns'] != source.st_mtime_ns:
+        # Touched but maybe not modified: compare contents before giving up
+        if manifest['source_digest'] != _file_digest(filename):
+            return None
+        manifest['source_mtime_ns'] = source.st_mtime_ns
+        with open(manifest_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+    
+    columns = {}
+    for entry in manifest['columns']:
+        if array(entry['typecode']).itemsize != entry['itemsize']:
+            return None
+        if entry['kind'] == 'numeric' and 'raw' not in entry:
+            # Written by an older version that did not keep the raw cell text
+            return None
+        values = _map_array(os.path.join(cache_dir, entry['file']), entry['typecode'])
+        if entry['kind'] == 'numeric':
+            column = NumericColumn()
+            column.values = values
+            column.raw = {int(index): value for index, value in entry['raw'].items()}
+        else:
+            column = CategoricalColumn()
+            column.codes = values
+            column.categories = entry['categories']
+            column.lookup = {value: code for code, value in enumerate(column.categories)}
+        columns[entry['name']] = column
+    
+    return ColumnarData(manifest['fieldnames'], columns, manifest['num_rows'])
+
+def read_csv_columns_cached(filename: str, schema: Optional[Dict[str, str]] = None) -> ColumnarData:
+    """
+    Read CSV file into typed columns, using the binary column cache when possible
+    
+    The first read parses the CSV file and writes the cache; later reads of
+    an unchanged file memory-map the cached columns and skip parsing entirely.
+    
+    Args:
+        filename (str): Path to the CSV file
+        schema (Optional[Dict[str, str]]): Column kind per column, used when parsing
+    
+    Returns:
+        ColumnarData: Columnar representation of the file
+    """
+    data = read_column_cache(filename)
+    if data is not None:
+        print(f"Using column cache: {column_cache_dir(filename)}")
+        return data
+    
+    data = read_csv_columns(filename, schema=schema)
+    try:
+        cache_dir = write_column_cache(filename, data)
+        print(f"Column cache written to: {cache_dir}")
+    except OSError as e:
+        print(f"Warning: Could not write column cache: {e}")
+    return data
+
+def extract_column_values(data: ColumnarData, column: str,
+                          rejects: Optional[List[str]] = None) -> List[float]:
+    """
+    Extract the numerical values of a column from columnar data
+    
+    Numeric columns are already parsed, so only raw (non-canonical) cells need
+    any work. Categorical columns parse each distinct category once and then
+    map codes. Cells are converted like the list path of calculate_statistics:
+    with convert_values when collecting rejects (the schema path) and with
+    convert_to_number otherwise.
+    
+    Args:
+        data (ColumnarData): Columnar CSV data
+        column (str): Column name to extract
+        rejects (Optional[List[str]]): Collects skipped values instead of warning for each
+    
+    Returns:
+        List[float]: Numerical values of the selected rows
+    """
+    col = data.columns[column]
+    
+    def parse(value):
+        value = value.strip()
+        if not is_numeric(value):
+            return None
+        return float(value) if rejects is not None else convert_to_number(value)
+    
+    if isinstance(col, NumericColumn):
+        values = col.values
+        if data.selection is not None:
+            values = map(values.__getitem__, data.selection)
+        if not col.raw:
+            return list(values)
+        
+        numerical_values = list(itertools.filterfalse(math.isnan, values))
+        selected = None if data.selection is None else set(data.selection)
+        for index in sorted(col.raw):
+            if selected is None or index in selected:
+                value = parse(col.raw[index])
+                if value is not None:
+                    numerical_values.append(value)
+                elif rejects is not None:
+                    rejects.append(col.raw[index].strip())
+                else:
+                    print(f"Warning: Non-numeric value '{col.raw[index].strip()}' found in column '{column}', skipping...")
+        return numerical_values
+    
+    parsed = [parse(value) for value in col.categories]
+    codes = col.codes
+    if data.selection is not None:
+        codes = map(codes.__getitem__, data.selection)
+    
+    numerical_values = []
+    for code in codes:
+        value = parsed[code]
+        if value is None:
+            if rejects is not None:
+                rejects.append(col.categories[code].strip())
+            else:
+                print(f"Warning: Non-numeric value '{col.categories[code].strip()}' found in column '{column}', skipping...")
+        else:
+            numerical_values.append(value)
+    return numerical_values
+
+def calculate_statistics(data: Union[List[Dict[str, Any]], ColumnarData], column: str,
+                         schema: Optional[Dict[str, str]] = None) -> Dict[str, float]:
+    """
+    Calculate average, min, and max for a numerical column
+    
+    With a schema the column is converted by the converter of its planned
+    kind and skipped values are reported in one summary line instead of one
+    warning per value.
+    
+    Args:
+        data (Union[List[Dict[str, Any]], ColumnarData]): CSV data as list of dictionaries
+            or as typed columns
+        column (str): Column name to analyze
+        schema (Optional[Dict[str, str]]): Column kind per column (see infer_schema)
+    
+    Returns:
+        Dict[str, float]: Dictionary with avg, min, max values
+    """
+    if not data:
+        return {"avg": 0, "min": 0, "max": 0, "count": 0}
+    
+    # Check if column exists
+    if column not in data[0]:
+        print(f"Error: Column '{column}' not found in CSV file.")
+        available_columns = list(data[0].keys())
+        print(f"Available columns: {', '.join(available_columns)}")
+        sys.exit(1)
+    
+    # Extract numerical values from the column
+    rejects = [] if schema is not None else None
+    if isinstance(data, ColumnarData):
+        numerical_values = extract_column_values(data, column, rejects)
+    elif schema is not None:
+        numerical_values, rejects = convert_values([row[column] for row in data],
+                                                   schema.get(column, 'string'))
+    else:
+        numerical_values = []
+        for row in data:
+            value = row[column].strip()
+            if is_numeric(value):
+                numerical_values.append(convert_to_number(value))
+            else:
+                print(f"Warning: Non-numeric value '{value}' found in column '{column}', skipping...")
+    
+    if rejects:
+        report_rejects(column, rejects)
+    
+    if not numerical_values:
+        print(f"Error: No numerical values found in column '{column}'")
+        sys.exit(1)
+    
+    # Calculate statistics
+    avg_value = math.fsum(numerical_values) / len(numerical_values)
+    min_value = min(numerical_values)
+    max_value = max(numerical_values)
+    
+    return {
+        "avg": round(avg_value, 2),
+        "min": min_value,
+        "max": max_value,
+        "count": len(numerical_values)
+    }
+
+def _add_exact(partials: List[float], value: float) -> None:
+    """
+    Add a value to a list of non-overlapping partial sums (Shewchuk's algorithm)
+    
+    math.fsum(partials) is then the correctly rounded sum of every value
+    added, no matter in which order or in how many pieces they were added.
+    
+    Args:
+        partials (List[float]): Partial sums, updated in place
+        value (float): Value to add
+    """
+    i = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[i] = low
+            i += 1
+        value = high
+    partials[i:] = [value]
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile sketch with bounded memory
+    
+    Values are buffered in levels where an item on level i stands for 2**i
+    values. When a level fills up it is sorted and every other item is
+    promoted to the next level, so memory grows only with the logarithm of
+    the number of values.
+    """
+    
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.levels = [[]]
+        self.count = 0
+        self._offset = 0
+    
+    def add(self, value: float) -> None:
+        """
+        Add a single value to the sketch
+        
+        Args:
+            value (float): Value to add
+        """
+        self.levels[0].append(value)
+        self.count += 1
+        if len(self.levels[0]) >= self.capacity:
+            self._compact()
+    
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Merge another sketch into this one
+        
+        Args:
+            other (QuantileSketch): Sketch to merge in
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.count += other.count
+        self._compact()
+    
+    def _compact(self) -> None:
+        """
+        Halve every full level by promoting alternate items to the next level
+        """
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self.capacity:
+                items.sort()
+                kept = [items.pop()] if len(items) % 2 else []
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                # Alternate which half survives to avoid a systematic bias
+                self.levels[level + 1].extend(items[self._offset::2])
+                self._offset ^= 1
+                self.levels[level] = kept
+            level += 1
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the value at quantile q
+        
+        Args:
+            q (float): Quantile between 0 and 1
+        
+        Returns:
+            Optional[float]: Estimated value, or None when the sketch is empty
+        """
+        weighted = sorted((value, 1 << level) for level, items in enumerate(self.levels) for value in items)
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0] if weighted else None
+
+class RunningStatistics:
+    """
+    Constant-memory accumulator for count, mean, variance, min and max
+    
+    Mean and variance are updated with Welford's algorithm, so values can be
+    fed one at a time without keeping them around. The sum is tracked exactly,
+    so the reported average does not depend on the order of the values, and
+    accumulators built over separate chunks can be merged. Extended
+    accumulators also count null and non-numeric cells and keep a
+    QuantileSketch for approximate percentiles.
+    """
+    
+    def __init__(self, extended: bool = False):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.partials = []
+        self.min = None
+        self.max = None
+        self.null_count = 0
+        self.invalid_count = 0
+        self.invalid_examples = []
+        self.sketch = QuantileSketch() if extended else None
+    
+    def add(self, value: float) -> None:
+        """
+        Add a single value to the running statistics
+        
+        Args:
+            value (float): Value to add
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        _add_exact(self.partials, value)
+        if self.sketch is not None:
+            self.sketch.add(value)
+        
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+    
+    def add_invalid(self, value: str) -> None:
+        """
+        Count a non-numeric cell, keeping the first distinct ones as examples
+        
+        Args:
+            value (str): Stripped, non-empty cell value
+        """
+        self.invalid_count += 1
+        if len(self.invalid_examples) < REJECT_EXAMPLES and value not in self.invalid_examples:
+            self.invalid_examples.append(value)
+    
+    def merge(self, other: 'RunningStatistics') -> None:
+        """
+        Merge statistics accumulated over another chunk of data into this one
+        
+        Args:
+            other (RunningStatistics): Statistics to merge in
+        """
+        self.null_count += other.null_count
+        self.invalid_count += other.invalid_count
+        for value in other.invalid_examples:
+            if len(self.invalid_examples) < REJECT_EXAMPLES and value not in self.invalid_examples:
+                self.invalid_examples.append(value)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        if other.count == 0:
+            return
+        
+        # Chan et al. pairwise update for mean and sum of squared deviations
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        
+        for partial in other.partials:
+            _add_exact(self.partials, partial)
+        
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+    
+    @property
+    def total(self) -> float:
+        """
+        Correctly rounded sum of the values seen so far
+        """
+        return math.fsum(self.partials)
+    
+    @property
+    def variance(self) -> float:
+        """
+        Sample variance of the values seen so far
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Convert to the same format returned by calculate_statistics
+        
+        Extended accumulators add stddev, variance, null and non-numeric
+        counts and the p50/p90/p99 estimates.
+        
+        Returns:
+            Dict[str, float]: Dictionary with avg, min, max values
+        """
+        stats = {
+            "avg": round(self.total / self.count, 2) if self.count else 0,
+            "min": self.min,
+            "max": self.max,
+            "count": self.count
+        }
+        if self.sketch is not None:
+            stats.update({
+                "stddev": round(math.sqrt(self.variance), 2),
+                "variance": round(self.variance, 2),
+                "null_count": self.null_count,
+                "invalid_count": self.invalid_count,
+                "p50": self.sketch.quantile(0.5),
+                "p90": self.sketch.quantile(0.9),
+                "p99": self.sketch.quantile(0.99)
+            })
+        return stats
+
+def check_columns(checks: Iterable[Tuple[Optional[str], str]], available: Iterable[str]) -> None:
+    """
+    Exit with an error message if a required column is missing
+    
+    Args:
+        checks (Iterable[Tuple[Optional[str], str]]): (column name, label) pairs;
+            pairs without a name are ignored
+        available (Iterable[str]): Column names present in the file
+    """
+    available = list(available)
+    for name, label in checks:
+        if name and name not in available:
+            print(f"Error: {label} '{name}' not found in CSV file.")
+            print(f"Available columns: {', '.join(available)}")
+            sys.exit(1)
+
+def accumulate_columns(rows: Iterable[Dict[str, Any]], columns: List[str],
+                       filter_column: Optional[str] = None,
+                       filter_value: Optional[str] = None,
+                       on_match: Optional[Callable[[Dict[str, Any]], None]] = None,
+                       extended: bool = False,
+                       schema: Optional[Dict[str, str]] = None) -> Tuple[Dict[str, RunningStatistics], int]:
+    """
+    Feed streaming rows into one RunningStatistics accumulator per column
+    
+    All columns are accumulated in the same pass over the rows. In extended
+    mode or with a schema, empty cells are counted as nulls and other
+    non-numeric cells as invalid, instead of printing a warning for each of
+    them (see report_skipped).
+    
+    Args:
+        rows (Iterable[Dict[str, Any]]): Row source, e.g. iter_csv_rows(filename)
+        columns (List[str]): Column names to analyze
+        filter_column (Optional[str]): Column to filter by
+        filter_value (Optional[str]): Value to filter for
+        on_match (Optional[Callable]): Called with every row that passes the filter
+        extended (bool): Track nulls and percentiles as well
+        schema (Optional[Dict[str, str]]): Column kind per column (see infer_schema)
+    
+    Returns:
+        Tuple[Dict[str, RunningStatistics], int]: Accumulated statistics per column
+            and number of rows read
+    """
+    stats = {column: RunningStatistics(extended) for column in columns}
+    kinds = {column: schema.get(column, 'string') if schema is not None else None for column in columns}
+    rows_read = 0
+    wanted = filter_value.lower() if filter_column else None
+    
+    for row in rows:
+        if rows_read == 0:
+            # Check columns exist using the first row
+            check_columns([(column, "Column") for column in columns] + [(filter_column, "Filter column")],
+                          row.keys())
+        rows_read += 1
+        
+        if filter_column and row[filter_column].strip().lower() != wanted:
+            continue
+        if on_match:
+            on_match(row)
+        
+        for column, column_stats in stats.items():
+            value = (row[column] or '').strip()
+            number = parse_cell(value, kinds[column])
+            if number is not None:
+                column_stats.add(number)
+            elif not extended and schema is None:
+                print(f"Warning: Non-numeric value '{value}' found in column '{column}', skipping...")
+            elif value:
+                column_stats.add_invalid(value)
+            else:
+                column_stats.null_count += 1
+    
+    return stats, rows_read
+
+def accumulate_statistics(rows: Iterable[Dict[str, Any]], column: str,
+                          filter_column: Optional[str] = None,
+                          filter_value: Optional[str] = None,
+                          on_match: Optional[Callable[[Dict[str, Any]], None]] = None,
+                          schema: Optional[Dict[str, str]] = None) -> Tuple[RunningStatistics, int]:
+    """
+    Feed streaming rows into a RunningStatistics accumulator
+    
+    Args:
+        rows (Iterable[Dict[str, Any]]): Row source, e.g. iter_csv_rows(filename)
+        column (str): Column name to analyze
+        filter_column (Optional[str]): Column to filter by
+        filter_value (Optional[str]): Value to filter for
+        on_match (Optional[Callable]): Called with every row that passes the filter
+        schema (Optional[Dict[str, str]]): Column kind per column (see infer_schema)
+    
+    Returns:
+        Tuple[RunningStatistics, int]: Accumulated statistics and number of rows read
+    """
+    stats, rows_read = accumulate_columns(rows, [column], filter_column, filter_value, on_match,
+                                          schema=schema)
+    return stats[column], rows_read
+
+def accumulate_groups(rows: Iterable[Dict[str, Any]], group_column: str, columns: List[str],
+                      filter_column: Optional[str] = None,
+                      filter_value: Optional[str] = None,
+                      extended: bool = False,
+                      schema: Optional[Dict[str, str]] = None
+                      ) -> Tuple[Dict[str, Dict[str, RunningStatistics]], int]:
+    """
+    Hash-aggregate streaming rows into per-group statistics in one pass
+    
+    Each distinct (stripped) value of the group column gets its own set of
+    RunningStatistics accumulators. Null and non-numeric cells are counted
+    rather than reported one by one.
+    
+    Args:
+        rows (Iterable[Dict[str, Any]]): Row source, e.g. iter_csv_rows(filename)
+        group_column (str): Column whose values define the groups
+        columns (List[str]): Column names to analyze
+        filter_column (Optional[str]): Column to filter by
+        filter_value (Optional[str]): Value to filter for
+        extended (bool): Track percentiles as well
+        schema (Optional[Dict[str, str]]): Column kind per column (see infer_schema)
+    
+    Returns:
+        Tuple[Dict[str, Dict[str, RunningStatistics]], int]: Statistics per group and
+            column, and number of rows read
+    """
+    groups = {}
+    kinds = {column: schema.get(column, 'string') if schema is not None else None for column in columns}
+    rows_read = 0
+    wanted = filter_value.lower() if filter_column else None
+    
+    for row in rows:
+        if rows_read == 0:
+            check_columns([(column, "Column") for column in columns]
+                          + [(group_column, "Group column"), (filter_column, "Filter column")], row.keys())
+        rows_read += 1
+        
+        if filter_column and row[filter_column].strip().lower() != wanted:
+            continue
+        
+        key = (row[group_column] or '').strip()
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {column: RunningStatistics(extended) for column in columns}
+        
+        for column, column_stats in group.items():
+            value = (row[column] or '').strip()
+            number = parse_cell(value, kinds[column])
+            if number is not None:
+                column_stats.add(number)
+            elif value:
+                column_stats.add_invalid(value)
+            else:
+                column_stats.null_count += 1
+    
+    return groups, rows_read
+
+def merge_groups(target: Dict[str, Dict[str, RunningStatistics]],
+                 partial: Dict[str, Dict[str, RunningStatistics]]) -> None:
+    """
+    Merge partial per-group statistics into a running result
+    
+    Args:
+        target (Dict[str, Dict[str, RunningStatistics]]): Result, updated in place
+        partial (Dict[str, Dict[str, RunningStatistics]]): Statistics to merge in
+    """
+    for key, group in partial.items():
+        if key not in target:
+            target[key] = group
+            continue
+        for column, column_stats in group.items():
+            target[key][column].merge(column_stats)
+
+def calculate_statistics_streaming(rows: Iterable[Dict[str, Any]], column: str,
+                                   filter_column: Optional[str] = None,
+                                   filter_value: Optional[str] = None,
+                                   on_match: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                   schema: Optional[Dict[str, str]] = None
+                                   ) -> Tuple[Dict[str, float], int]:
+    """
+    Calculate statistics for a numerical column while rows stream by
+    
+    Rows are filtered and accumulated one at a time, so memory use does not
+    depend on the size of the input. With a schema the skipped values are
+    reported as one summary line, as in calculate_statistics.
+    
+    Args:
+        rows (Iterable[Dict[str, Any]]): Row source, e.g. iter_csv_rows(filename)
+        column (str): Column name to analyze
+        filter_column (Optional[str]): Column to filter by
+        filter_value (Optional[str]): Value to filter for
+        on_match (Optional[Callable]): Called with every row that passes the filter
+        schema (Optional[Dict[str, str]]): Column kind per column (see infer_schema)
+    
+    Returns:
+        Tuple[Dict[str, float], int]: Statistics dictionary and number of rows read
+    """
+    stats, rows_read = accumulate_statistics(rows, column, filter_column, filter_value, on_match, schema)
+    report_skipped(column, stats)
+    return stats.to_dict(), rows_read
+
+def _count_quotes(binary_file, start: int, end: int) -> int:
+    """
+    Count the double quote bytes between two offsets of a file
+    
+    Args:
+        binary_file: File opened in binary mode
+        start (int): First byte offset
+        end (int): Byte offset to stop at
+    
+    Returns:
+        int: Number of quote characters in the range
+    """
+    binary_file.seek(start)
+    count = 0
+    remaining = end - start
+    while remaining > 0:
+        block = binary_file.read(min(remaining, 1 << 20))
+        if not block:
+            break
+        count += block.count(b'"')
+        remaining -= len(block)
+    return count
+
+def split_byte_ranges(filename: str, chunks: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    Split the data part of a CSV file into byte ranges aligned to record boundaries
+    
+    Every range starts at the beginning of a record and ends right after a
+    newline (or at the end of the file). A newline only ends a record when
+    an even number of quote characters precedes it (escaped quotes come in
+    pairs), so quoted fields spanning several lines are never split.
+    
+    Args:
+        filename (str): Path to the CSV file
+        chunks (int): Desired number of ranges
+    
+    Returns:
+        Tuple[List[str], List[Tuple[int, int]]]: Header fieldnames and (start, end) ranges
+    """
+    with open(filename, 'rb') as csvfile:
+        header = csvfile.readline()
+        data_start = csvfile.tell()
+        size = os.fstat(csvfile.fileno()).st_size
+        step = max((size - data_start) // max(chunks, 1), 1)
+        
+        boundaries = [data_start]
+        position = data_start
+        quotes = 0
+        for i in range(1, chunks):
+            target = data_start + i * step - 1
+            if target < position:
+                continue
+            quotes += _count_quotes(csvfile, position, target)
+            position = target
+            
+            # Move the split point forward to the next newline outside quotes
+            csvfile.seek(position)
+            for line in iter(csvfile.readline, b''):
+                quotes += line.count(b'"')
+                position += len(line)
+                if quotes % 2 == 0:
+                    break
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+        boundaries.append(size)
+    
+    fieldnames = next(csv.reader([header.decode('utf-8')]), [])
+    return fieldnames, list(zip(boundaries, boundaries[1:]))
+
+def _read_lines(binary_file, end: int) -> Iterator[str]:
+    """
+    Yield decoded lines from the current position up to a byte offset
+    
+    Args:
+        binary_file: File opened in binary mode
+        end (int): Byte offset to stop at
+    
+    Yields:
+        str: Each line, including its line terminator
+    """
+    position = binary_file.tell()
+    for line in binary_file:
+        if position >= end:
+            break
+        position += len(line)
+        yield line.decode('utf-8')
+
+class ScanTask(NamedTuple):
+    """
+    Work description for one byte range of a parallel scan
+    """
+    filename: str
+    fieldnames: List[str]
+    start: int
+    end: int
+    columns: List[str]
+    filter_column: Optional[str] = None
+    filter_value: Optional[str] = None
+    where: Optional[str] = None
+    keep_rows: bool = False
+    extended: bool = False
+    group_by: Optional[str] = None
+    schema: Optional[Dict[str, str]] = None
+
+def _scan_byte_range(task: ScanTask) -> Tuple[Dict[str, Any], int, int, str, List[Dict[str, Any]]]:
+    """
+    Parse, filter and accumulate one byte range (runs inside a worker process)
+    
+    Args:
+        task (ScanTask): Byte range and what to compute over it
+    
+    Returns:
+        Tuple: Partial statistics per column (per group and column when
+            grouping), rows read, rows matched, captured warnings and matching
+            rows (when kept)
+    """
+    predicate = compile_predicate(task.where, task.fieldnames) if task.where else None
+    matched_rows = []
+    match_count = 0
+    
+    def on_match(row):
+        nonlocal match_count
+        match_count += 1
+        if task.keep_rows:
+            matched_rows.append(row)
+    
+    # Warnings are captured so the parent can print them in file order
+    output = io.StringIO()
+    with open(task.filename, 'rb') as csvfile, contextlib.redirect_stdout(output):
+        csvfile.seek(task.start)
+        rows = rows_to_dicts(csv.reader(_read_lines(csvfile, task.end)), task.fieldnames, predicate)
+        if task.group_by:
+            stats, rows_read = accumulate_groups(rows, task.group_by, task.columns, task.filter_column,
+                                                 task.filter_value, task.extended, task.schema)
+        else:
+            stats, rows_read = accumulate_columns(rows, task.columns, task.filter_column,
+                                                  task.filter_value, on_match, task.extended, task.schema)
+    
+    return stats, rows_read, match_count, output.getvalue(), matched_rows
+
+def display_statistics(stats: Dict[str, float], column: str) -> None:
+    """
+    Display statistics in a formatted way
+    
+    Args:
+        stats (Dict[str, float]): Statistics dictionary
+        column (str): Column name
+    """
+    print(f"\nStatistics for column '{column}':")
+    print("-" * 40)
+    print(f"Average: {stats['avg']}")
+    print(f"Minimum: {stats['min']}")
+    print(f"Maximum: {stats['max']}")
+    print(f"Count: {stats['count']} values")
+    
+    if 'stddev' in stats:
+        print(f"Std Dev: {stats['stddev']}")
+        print(f"Variance: {stats['variance']}")
+        print(f"Null values: {stats['null_count']}")
+        print(f"Non-numeric values: {stats['invalid_count']}")
+        print(f"Percentiles (approx.): p50={stats['p50']}, p90={stats['p90']}, p99={stats['p99']}")
+
+def display_group_statistics(groups: Dict[str, Dict[str, RunningStatistics]], group_column: str,
+                             column: str) -> None:
+    """
+    Display per-group statistics for one column as a table
+    
+    Args:
+        groups (Dict[str, Dict[str, RunningStatistics]]): Statistics per group and column
+        group_column (str): Column the rows were grouped by
+        column (str): Column to display
+    """
+    extended = any(group[column].sketch is not None for group in groups.values())
+    headers = ["Count", "Average", "Minimum", "Maximum"]
+    if extended:
+        headers += ["Std Dev", "P50", "P90", "P99"]
+    
+    print(f"\nStatistics for column '{column}' grouped by '{group_column}':")
+    header_line = f"{group_column:15} | " + " | ".join(f"{header:>12}" for header in headers)
+    print(header_line)
+    print("-" * len(header_line))
+    
+    for key in sorted(groups):
+        stats = groups[key][column].to_dict()
+        if not stats['count']:
+            continue
+        values = [stats['count'], stats['avg'], stats['min'], stats['max']]
+        if extended:
+            values += [stats['stddev'], stats['p50'], stats['p90'], stats['p99']]
+        print(f"{key:15} | " + " | ".join(f"{value:>12}" for value in values))
+
+def filter_columns(data: ColumnarData, filter_column: str, filter_value: str) -> ColumnarData:
+    """
+    Filter columnar data based on column value without materializing rows
+    
+    Categorical columns compare each distinct category once and then match
+    codes. Numeric columns store canonical cells only, so those match by value
+    exactly when the filter value is itself canonical; raw cells compare text.
+    
+    Args:
+        data (ColumnarData): Columnar CSV data
+        filter_column (str): Column to filter by
+        filter_value (str): Value to filter for
+    
+    Returns:
+        ColumnarData: View containing the matching rows
+    """
+    col = data.columns[filter_column]
+    wanted = filter_value.lower()
+    indices = data.row_indices()
+    
+    if isinstance(col, CategoricalColumn):
+        matching = {code for code, value in enumerate(col.categories) if value.strip().lower() == wanted}
+        codes = col.codes if data.selection is None else map(col.codes.__getitem__, indices)
+        return data.select(itertools.compress(indices, map(matching.__contains__, codes)))
+    
+    matches = []
+    target = canonical_number(wanted)
+    if target is not None:
+        values = col.values if data.selection is None else map(col.values.__getitem__, indices)
+        matches = list(itertools.compress(indices, map(target.__eq__, values)))
+    
+    selected = None if data.selection is None else set(indices)
+    raw_matches = [index for index, value in col.raw.items()
+                   if value.strip().lower() == wanted and (selected is None or index in selected)]
+    return data.select(sorted(matches + raw_matches) if raw_matches else matches)
+
+def filter_rows(data: Union[List[Dict[str, Any]], ColumnarData], filter_column: str,
+                filter_value: str) -> Union[List[Dict[str, Any]], ColumnarData]:
+    """
+    Filter rows based on column value
+    
+    Args:
+        data (Union[List[Dict[str, Any]], ColumnarData]): CSV data as list of dictionaries
+            or as typed columns
+        filter_column (str): Column to filter by
+        filter_value (str): Value to filter for
+    
+    Returns:
+        Union[List[Dict[str, Any]], ColumnarData]: Filtered data, in the same form as the input
+    """
+    if not data:
+        return []
+    
+    # Check if filter column exists
+    if filter_column not in data[0]:
+        print(f"Error: Filter column '{filter_column}' not found in CSV file.")
+        available_columns = list(data[0].keys())
+        print(f"Available columns: {', '.join(available_columns)}")
+        sys.exit(1)
+    
+    if isinstance(data, ColumnarData):
+        return filter_columns(data, filter_column, filter_value)
+    
+    # Filter rows
+    filtered_data = []
+    for row in data:
+        if row[filter_column].strip().lower() == filter_value.lower():
+            filtered_data.append(row)
+    
+    return filtered_data
+
+def filter_rows_mmap(filename: str, filter_column: str, filter_value: str) -> List[Dict[str, Any]]:
+    """
+    Filter rows of a CSV file by searching its raw bytes through a memory map
+    
+    The file is never decoded as a whole: a case-insensitive byte search finds
+    candidate matches, and only the records containing them are decoded and
+    tokenized to confirm the match in the filter column. A record starts after
+    the last newline before the match that follows an even number of quotes,
+    so quoted fields spanning several lines are handled as in filter_rows.
+    Falls back to a full scan when the filter value cannot be searched for as
+    plain ASCII bytes.
+    
+    Args:
+        filename (str): Path to the CSV file
+        filter_column (str): Column to filter by
+        filter_value (str): Value to filter for
+    
+    Returns:
+        List[Dict[str, Any]]: Filtered data
+    """
+    wanted = filter_value.lower()
+    if not filter_value.strip() or not filter_value.isascii() or '"' in filter_value:
+        return filter_rows(read_csv_file(filename), filter_column, filter_value)
+    
+    try:
+        with open(filename, 'rb') as csvfile:
+            if os.fstat(csvfile.fileno()).st_size == 0:
+                return []
+            
+            with mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                header_end = mapped.find(b'\n')
+                data_start = len(mapped) if header_end == -1 else header_end + 1
+                fieldnames = next(csv.reader([mapped[:data_start].decode('utf-8')]), [])
+                
+                if filter_column not in fieldnames:
+                    print(f"Error: Filter column '{filter_column}' not found in CSV file.")
+                    print(f"Available columns: {', '.join(fieldnames)}")
+                    sys.exit(1)
+                
+                pattern = re.compile(re.escape(filter_value.encode('ascii')), re.IGNORECASE)
+                filtered_data = []
+                position = data_start
+                
+                while True:
+                    match = pattern.search(mapped, position)
+                    if match is None:
+                        break
+                    
+                    # Step back from the match to the start of its record; position
+                    # always is a record start, so counting quotes from there works
+                    record_start = mapped.rfind(b'\n', position, match.start()) + 1 or position
+                    quotes = _count_quotes(mapped, position, record_start)
+                    while quotes % 2:
+                        previous = mapped.rfind(b'\n', position, record_start - 1) + 1 or position
+                        quotes -= _count_quotes(mapped, previous, record_start)
+                        record_start = previous
+                    
+                    # Decode only that record, however many lines it spans
+                    mapped.seek(record_start)
+                    lines = (line.decode('utf-8') for line in iter(mapped.readline, b''))
+                    row = next(csv.DictReader(lines, fieldnames=fieldnames), None)
+                    position = mapped.tell()
+                    if row and (row[filter_column] or '').strip().lower() == wanted:
+                        filtered_data.append(row)
+                
+                return filtered_data
+    except FileNotFoundError:
+        print(f"Error: File '{filename}' not found.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        sys.exit(1)
+
+def index_path(filename: str, column: str) -> str:
+    """
+    Get the path of the sidecar index file for a column
+    
+    Args:
+        filename (str): Path to the CSV file
+        column (str): Indexed column
+    
+    Returns:
+        str: Path of the index file
+    """
+    return f"{filename}.{column}.idx"
 
-def display_statistics(stats: Dict[str, float], column: str) -> None:
+def _index_bucket(value: str, buckets: int) -> int:
     """
-    Display statistics in a formatted way
+    Get the hash bucket of a normalized value (stable across processes)
     
     Args:
-        stats (Dict[str, float]): Statistics dictionary
-        column (str): Column name
+        value (str): Normalized column value
+        buckets (int): Number of buckets in the index
+    
+    Returns:
+        int: Bucket number
     """
-    print(f"\nStatistics for column '{column}':")
-    print("-" * 40)
-    print(f"Average: {stats['avg']}")
-    print(f"Minimum: {stats['min']}")
-    print(f"Maximum: {stats['max']}")
-    print(f"Count: {stats['count']} values")
+    digest = hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') % buckets
 
-def filter_rows(data: List[Dict[str, Any]], filter_column: str, filter_value: str) -> List[Dict[str, Any]]:
+def build_index(filename: str, column: str) -> str:
     """
-    Filter rows based on column value
+    Build a sidecar hash index mapping each value of a column to its row offsets
+    
+    The index file starts with a small JSON header line holding the source
+    file size and mtime, the fieldnames and the number of hash buckets. A
+    table of (position, length) pairs, one per bucket, follows; each bucket
+    is a short JSON object mapping its normalized values to the position and
+    number of their offsets. The byte offsets of the records come last as
+    one packed array, grouped by value. A lookup reads the header, one table
+    entry, one bucket and the offsets of the matches only.
+    
+    Offsets are the positions at which the csv reader starts each record, so
+    records with quoted newlines are indexed correctly.
+    
+    Args:
+        filename (str): Path to the CSV file
+        column (str): Column to index
+    
+    Returns:
+        str: Path of the written index file
+    """
+    offsets_by_value = {}
+    
+    with open(filename, 'rb') as csvfile:
+        header = csvfile.readline()
+        fieldnames = next(csv.reader([header.decode('utf-8')]), [])
+        if column not in fieldnames:
+            print(f"Error: Column '{column}' not found in CSV file.")
+            print(f"Available columns: {', '.join(fieldnames)}")
+            sys.exit(1)
+        
+        consumed = csvfile.tell()
+        
+        def lines():
+            nonlocal consumed
+            for line in csvfile:
+                consumed += len(line)
+                yield line.decode('utf-8')
+        
+        # The csv reader pulls only the lines of the record it is parsing, so
+        # the bytes consumed before a record give its starting offset
+        record_start = consumed
+        column_index = fieldnames.index(column)
+        for fields in csv.reader(lines()):
+            if fields:
+                value = fields[column_index] if column_index < len(fields) else ''
+                offsets_by_value.setdefault(value.strip().lower(), array('Q')).append(record_start)
+            record_start = consumed
+        
+        source = os.fstat(csvfile.fileno())
+    
+    buckets = max(1, len(offsets_by_value) // 8)
+    bucket_values = [{} for _ in range(buckets)]
+    start = 0
+    for value, offsets in offsets_by_value.items():
+        bucket_values[_index_bucket(value, buckets)][value] = [start, len(offsets)]
+        start += len(offsets)
+    
+    table = array('Q')
+    blobs = []
+    position = 0
+    for values in bucket_values:
+        blob = json.dumps(values).encode('utf-8')
+        table.extend((position, len(blob)))
+        blobs.append(blob)
+        position += len(blob)
+    
+    manifest = {
+        'source_size': source.st_size,
+        'source_mtime_ns': source.st_mtime_ns,
+        'column': column,
+        'fieldnames': fieldnames,
+        'buckets': buckets,
+        'directory_size': position
+    }
+    
+    path = index_path(filename, column)
+    with open(path, 'wb') as index_file:
+        index_file.write(json.dumps(manifest).encode('utf-8') + b'\n')
+        table.tofile(index_file)
+        index_file.writelines(blobs)
+        for offsets in offsets_by_value.values():
+            offsets.tofile(index_file)
+    
+    return path
+
+def filter_rows_indexed(filename: str, filter_column: str, filter_value: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Filter rows using a sidecar index built by build_index
+    
+    Only the header, one hash bucket and the matching offsets are read from
+    the index, and only the matching records from the CSV file, so the cost
+    depends on the number of matches rather than on the file size.
     
     Args:
-        data (List[Dict[str, Any]]): CSV data as list of dictionaries
+        filename (str): Path to the CSV file
         filter_column (str): Column to filter by
         filter_value (str): Value to filter for
-        
+    
     Returns:
-        List[Dict[str, Any]]: Filtered data
+        Optional[List[Dict[str, Any]]]: Filtered data, or None when there is no
+            up-to-date index for the column
     """
-    if not data:
-        return []
+    path = index_path(filename, filter_column)
+    try:
+        source = os.stat(filename)
+        index_file = open(path, 'rb')
+    except OSError:
+        return None
     
-    # Check if filter column exists
-    if filter_column not in data[0]:
-        print(f"Error: Filter column '{filter_column}' not found in CSV file.")
-        available_columns = list(data[0].keys())
-        print(f"Available columns: {', '.join(available_columns)}")
-        sys.exit(1)
+    with index_file:
+        try:
+            manifest = json.loads(index_file.readline())
+            buckets = manifest['buckets']
+        except (ValueError, KeyError):
+            # Missing or written in an older format
+            return None
+        if (manifest['source_size'] != source.st_size
+                or manifest['source_mtime_ns'] != source.st_mtime_ns):
+            return None
+        
+        wanted = filter_value.lower()
+        table_start = index_file.tell()
+        entry = array('Q')
+        index_file.seek(table_start + _index_bucket(wanted, buckets) * 2 * entry.itemsize)
+        entry.fromfile(index_file, 2)
+        
+        directory_start = table_start + buckets * 2 * entry.itemsize
+        index_file.seek(directory_start + entry[0])
+        match = json.loads(index_file.read(entry[1])).get(wanted)
+        if match is None:
+            return []
+        
+        start, count = match
+        offsets = array('Q')
+        index_file.seek(directory_start + manifest['directory_size'] + start * offsets.itemsize)
+        offsets.fromfile(index_file, count)
     
-    # Filter rows
     filtered_data = []
-    for row in data:
-        if row[filter_column].strip().lower() == filter_value.lower():
-            filtered_data.append(row)
+    with open(filename, 'rb') as csvfile:
+        for offset in offsets:
+            csvfile.seek(offset)
+            reader = csv.DictReader(_read_lines(csvfile, source.st_size), fieldnames=manifest['fieldnames'])
+            filtered_data.append(next(reader))
     
     return filtered_data
 
@@ -198,6 +2090,18 @@ Examples:
   python csv_parser.py data.csv --column salary
   python csv_parser.py data.csv --column age --filter department Engineering
   python csv_parser.py data.csv --column salary --filter name "John Smith"
+  python csv_parser.py data.csv --column age --where "salary > 50000 and department == 'Engineering'"
+  python csv_parser.py huge.csv --column salary --filter department HR --stream
+  python csv_parser.py data.csv --column salary --filter department HR --columnar
+  python csv_parser.py data.csv --column salary --filter department HR --cache
+  python csv_parser.py dirty.csv --column salary --schema --sample-rows 5000
+  python csv_parser.py huge.csv --column salary --workers 8
+  python csv_parser.py huge.csv --column salary --filter department HR --mmap
+  python csv_parser.py huge.csv --build-index department
+  python csv_parser.py export.csv.gz --column salary --filter department HR --stream
+  python csv_parser.py data.csv --column age salary years_experience
+  python csv_parser.py data.csv --column all --filter department Engineering
+  python csv_parser.py data.csv --column salary age --group-by department
         """
     )
     
@@ -208,8 +2112,9 @@ Examples:
     
     parser.add_argument(
         '--column', '-c',
-        required=True,
-        help='Column name to calculate statistics for (must contain numerical data)'
+        nargs='+',
+        help='Column name(s) to calculate statistics for (must contain numerical data), '
+             'or "all" to profile every numerical column in one pass'
     )
     
     parser.add_argument(
@@ -219,14 +2124,428 @@ Examples:
         help='Filter rows by column value (format: --filter column_name value)'
     )
     
+    parser.add_argument(
+        '--where',
+        metavar='EXPRESSION',
+        help='Only use rows matching a condition, e.g. "salary > 50000 and department == \'HR\'"'
+    )
+    
     parser.add_argument(
         '--show-data', '-s',
         action='store_true',
         help='Show filtered data in addition to statistics'
     )
     
+    parser.add_argument(
+        '--group-by', '-g',
+        metavar='COLUMN',
+        help='Calculate statistics for every distinct value of COLUMN in a single pass'
+    )
+    
+    parser.add_argument(
+        '--extended', '-x',
+        action='store_true',
+        help='Also report stddev, variance, null count and approximate percentiles'
+    )
+    
+    parser.add_argument(
+        '--columnar',
+        action='store_true',
+        help='Load the file into typed columns instead of a list of row dictionaries'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Like --columnar, but keep the parsed columns in a binary cache next to the file '
+             'so later runs skip CSV parsing'
+    )
+    
+    parser.add_argument(
+        '--schema',
+        action='store_true',
+        help='Infer a parse plan per column from the first rows, save it next to the file '
+             'and report skipped values as one summary instead of one warning each'
+    )
+    
+    parser.add_argument(
+        '--sample-rows',
+        type=int,
+        default=1000,
+        help='Rows sampled to infer the --schema plan (default: 1000)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Process rows one at a time with constant memory instead of loading the whole file'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Scan the file in parallel with N worker processes'
+    )
+    
+    parser.add_argument(
+        '--mmap',
+        action='store_true',
+        help='Search the raw bytes of a memory-mapped file for --filter matches instead of loading it'
+    )
+    
+    parser.add_argument(
+        '--build-index',
+        metavar='COLUMN',
+        help='Build a sidecar index for COLUMN so later --filter queries on it skip the full scan'
+    )
+    
     return parser
 
+def run_group_by(args: argparse.Namespace, columns: List[str],
+                 schema: Optional[Dict[str, str]] = None) -> None:
+    """
+    Execute the CSV parser computing statistics for every group in one pass
+    
+    With --workers each byte range is hash-aggregated in its own process
+    and the partial group tables are merged.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        columns (List[str]): Columns to analyze, or ['all']
+        schema (Optional[Dict[str, str]]): Column kind per column, from --schema
+    """
+    print(f"Grouping CSV file: {args.filename} by '{args.group_by}'")
+    if args.where:
+        print(f"Applying condition: {args.where}")
+    
+    if not os.path.exists(args.filename):
+        print(f"Error: File '{args.filename}' not found.")
+        sys.exit(1)
+    
+    filter_column, filter_value = args.filter if args.filter else (None, None)
+    if args.filter:
+        print(f"Applying filter: {filter_column} = '{filter_value}'")
+    
+    fieldnames = read_csv_header(args.filename)
+    if columns == ['all']:
+        columns = [name for name in fieldnames if name != args.group_by]
+    check_columns([(column, "Column") for column in columns]
+                  + [(args.group_by, "Group column"), (filter_column, "Filter column")], fieldnames)
+    
+    if args.workers > 1:
+        # Only reached for uncompressed files, see main
+        _, ranges = split_byte_ranges(args.filename, args.workers * 4)
+        tasks = [ScanTask(args.filename, fieldnames, start, end, columns, filter_column, filter_value,
+                          args.where, extended=args.extended, group_by=args.group_by, schema=schema)
+                 for start, end in ranges]
+        with multiprocessing.Pool(min(args.workers, len(tasks))) as pool:
+            results = pool.map(_scan_byte_range, tasks)
+        
+        groups = {}
+        total_rows = 0
+        for partial, rows_read, _, _, _ in results:
+            merge_groups(groups, partial)
+            total_rows += rows_read
+    else:
+        groups, total_rows = accumulate_groups(iter_csv_rows(args.filename, args.where), args.group_by,
+                                               columns, filter_column, filter_value, args.extended, schema)
+    
+    if total_rows == 0:
+        print("Error: CSV file is empty or could not be read.")
+        sys.exit(1)
+    
+    print(f"Successfully streamed {total_rows} rows of data into {len(groups)} groups.")
+    
+    if not groups:
+        print("No data remaining after filtering. Cannot calculate statistics.")
+        sys.exit(1)
+    
+    analyzed = [column for column in columns if any(group[column].count for group in groups.values())]
+    skipped = [column for column in columns if column not in analyzed]
+    if not analyzed:
+        print(f"Error: No numerical values found in columns: {', '.join(columns)}")
+        sys.exit(1)
+    
+    for column in analyzed:
+        display_group_statistics(groups, args.group_by, column)
+    
+    invalid = sum(group[column].invalid_count for group in groups.values() for column in analyzed)
+    if invalid:
+        print(f"\nSkipped {invalid} non-numeric values")
+    if skipped:
+        print(f"\nSkipped columns without numerical values: {', '.join(skipped)}")
+    
+    print(f"\nSummary: Aggregated {len(analyzed)} columns over {len(groups)} groups "
+          f"{describe_scope(args, total_rows)}")
+
+def describe_scope(args: argparse.Namespace, total_rows: int) -> str:
+    """
+    Describe which rows the statistics were calculated over
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        total_rows (int): Number of rows read
+    
+    Returns:
+        str: Text for the summary line
+    """
+    conditions = []
+    if args.filter:
+        conditions.append(f"{args.filter[0]} = '{args.filter[1]}'")
+    if args.where:
+        conditions.append(args.where)
+    if conditions:
+        return "where " + " and ".join(conditions)
+    return f"across all {total_rows} rows"
+
+def run_profile(args: argparse.Namespace, columns: List[str],
+                schema: Optional[Dict[str, str]] = None) -> None:
+    """
+    Execute the CSV parser for several columns with extended statistics
+    
+    Every column is profiled in a single pass over the file, in parallel
+    when --workers is given.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        columns (List[str]): Columns to profile, or ['all']
+        schema (Optional[Dict[str, str]]): Column kind per column, from --schema
+    """
+    print(f"Profiling CSV file: {args.filename}")
+    if args.where:
+        print(f"Applying condition: {args.where}")
+    
+    if not os.path.exists(args.filename):
+        print(f"Error: File '{args.filename}' not found.")
+        sys.exit(1)
+    
+    filter_column, filter_value = args.filter if args.filter else (None, None)
+    if args.filter:
+        print(f"Applying filter: {filter_column} = '{filter_value}'")
+    
+    fieldnames = read_csv_header(args.filename)
+    if columns == ['all']:
+        columns = fieldnames
+    
+    check_columns([(column, "Column") for column in columns] + [(filter_column, "Filter column")], fieldnames)
+    
+    stats = {column: RunningStatistics(extended=True) for column in columns}
+    total_rows = 0
+    match_count = 0
+    matched_rows = []
+    
+    if args.workers > 1:
+        # Only reached for uncompressed files, see main
+        _, ranges = split_byte_ranges(args.filename, args.workers * 4)
+        tasks = [ScanTask(args.filename, fieldnames, start, end, columns, filter_column, filter_value,
+                          args.where, args.show_data, True, schema=schema) for start, end in ranges]
+        with multiprocessing.Pool(min(args.workers, len(tasks))) as pool:
+            results = pool.map(_scan_byte_range, tasks)
+        
+        for partials, rows_read, matches, _, rows in results:
+            for column in columns:
+                stats[column].merge(partials[column])
+            total_rows += rows_read
+            match_count += matches
+            matched_rows.extend(rows)
+    else:
+        def on_match(row):
+            nonlocal match_count
+            match_count += 1
+            if args.show_data:
+                matched_rows.append(row)
+        
+        stats, total_rows = accumulate_columns(iter_csv_rows(args.filename, args.where), columns,
+                                               filter_column, filter_value, on_match, True, schema)
+    
+    if total_rows == 0:
+        print("Error: CSV file is empty or could not be read.")
+        sys.exit(1)
+    
+    print(f"Successfully streamed {total_rows} rows of data.")
+    
+    if args.filter:
+        if args.show_data:
+            display_filtered_data(matched_rows, filter_column, filter_value)
+        if match_count == 0:
+            print("No data remaining after filtering. Cannot calculate statistics.")
+            sys.exit(1)
+    
+    profiled = [column for column in columns if stats[column].count]
+    skipped = [column for column in columns if not stats[column].count]
+    if not profiled:
+        print(f"Error: No numerical values found in columns: {', '.join(columns)}")
+        sys.exit(1)
+    
+    for column in profiled:
+        display_statistics(stats[column].to_dict(), column)
+    
+    if skipped:
+        print(f"\nSkipped columns without numerical values: {', '.join(skipped)}")
+    
+    print(f"\nSummary: Profiled {len(profiled)} columns {describe_scope(args, total_rows)}")
+
+def run_filtered(args: argparse.Namespace, filtered_data: List[Dict[str, Any]],
+                 schema: Optional[Dict[str, str]] = None) -> None:
+    """
+    Display filtered rows and their statistics when the rows were found
+    without loading the whole file
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        filtered_data (List[Dict[str, Any]]): Rows matching --filter
+        schema (Optional[Dict[str, str]]): Column kind per column, from --schema
+    """
+    filter_column, filter_value = args.filter
+    
+    if args.show_data:
+        display_filtered_data(filtered_data, filter_column, filter_value)
+    
+    if not filtered_data:
+        print("No data remaining after filtering. Cannot calculate statistics.")
+        sys.exit(1)
+    
+    stats = calculate_statistics(filtered_data, args.column, schema)
+    display_statistics(stats, args.column)
+    
+    print(f"\nSummary: Analyzed {stats['count']} values from column '{args.column}' "
+          f"where {filter_column} = '{filter_value}'")
+
+def run_mmap_filter(args: argparse.Namespace, schema: Optional[Dict[str, str]] = None) -> None:
+    """
+    Execute the CSV parser using the memory-mapped byte-level filter
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        schema (Optional[Dict[str, str]]): Column kind per column, from --schema
+    """
+    filter_column, filter_value = args.filter
+    print(f"Searching CSV file: {args.filename}")
+    print(f"Applying filter: {filter_column} = '{filter_value}'")
+    run_filtered(args, filter_rows_mmap(args.filename, filter_column, filter_value), schema)
+
+def run_parallel(args: argparse.Namespace, schema: Optional[Dict[str, str]] = None) -> None:
+    """
+    Execute the CSV parser over record-aligned byte ranges in a process pool
+    
+    Each worker returns partial statistics that are merged in file order, so
+    the output matches the single-process path.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        schema (Optional[Dict[str, str]]): Column kind per column, from --schema
+    """
+    print(f"Reading CSV file: {args.filename}")
+    if args.where:
+        print(f"Applying condition: {args.where}")
+    
+    if not os.path.exists(args.filename):
+        print(f"Error: File '{args.filename}' not found.")
+        sys.exit(1)
+    
+    filter_column, filter_value = args.filter if args.filter else (None, None)
+    fieldnames, ranges = split_byte_ranges(args.filename, args.workers * 4)
+    
+    check_columns([(filter_column, "Filter column"), (args.column, "Column")], fieldnames)
+    
+    tasks = [ScanTask(args.filename, fieldnames, start, end, [args.column], filter_column, filter_value,
+                      args.where, args.show_data, schema=schema) for start, end in ranges]
+    with multiprocessing.Pool(min(args.workers, len(tasks))) as pool:
+        results = pool.map(_scan_byte_range, tasks)
+    
+    stats = RunningStatistics()
+    total_rows = 0
+    match_count = 0
+    warnings = []
+    matched_rows = []
+    for partials, rows_read, matches, output, rows in results:
+        stats.merge(partials[args.column])
+        total_rows += rows_read
+        match_count += matches
+        warnings.append(output)
+        matched_rows.extend(rows)
+    
+    if total_rows == 0:
+        print("Error: CSV file is empty or could not be read.")
+        sys.exit(1)
+    
+    print(f"Successfully loaded {total_rows} rows of data.")
+    
+    if args.filter:
+        print(f"Applying filter: {filter_column} = '{filter_value}'")
+        if args.show_data:
+            display_filtered_data(matched_rows, filter_column, filter_value)
+        if match_count == 0:
+            print("No data remaining after filtering. Cannot calculate statistics.")
+            sys.exit(1)
+    
+    sys.stdout.write(''.join(warnings))
+    if schema is not None:
+        report_skipped(args.column, stats)
+    
+    if stats.count == 0:
+        print(f"Error: No numerical values found in column '{args.column}'")
+        sys.exit(1)
+    
+    display_statistics(stats.to_dict(), args.column)
+    
+    print(f"\nSummary: Analyzed {stats.count} values from column '{args.column}' "
+          f"{describe_scope(args, total_rows)}")
+
+def run_streaming(args: argparse.Namespace, schema: Optional[Dict[str, str]] = None) -> None:
+    """
+    Execute the CSV parser in streaming mode
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        schema (Optional[Dict[str, str]]): Column kind per column, from --schema
+    """
+    print(f"Streaming CSV file: {args.filename}")
+    if args.where:
+        print(f"Applying condition: {args.where}")
+    
+    filter_column, filter_value = args.filter if args.filter else (None, None)
+    if args.filter:
+        print(f"Applying filter: {filter_column} = '{filter_value}'")
+    
+    # Matching rows are only kept when they need to be shown
+    matched_rows = []
+    match_count = 0
+    
+    def on_match(row):
+        nonlocal match_count
+        match_count += 1
+        if args.show_data:
+            matched_rows.append(row)
+    
+    stats, rows_read = calculate_statistics_streaming(
+        iter_csv_rows(args.filename, args.where), args.column, filter_column, filter_value, on_match, schema
+    )
+    
+    if rows_read == 0:
+        print("Error: CSV file is empty or could not be read.")
+        sys.exit(1)
+    
+    print(f"Successfully streamed {rows_read} rows of data.")
+    
+    if args.show_data and args.filter:
+        display_filtered_data(matched_rows, filter_column, filter_value)
+    
+    if match_count == 0:
+        print("No data remaining after filtering. Cannot calculate statistics.")
+        sys.exit(1)
+    
+    if stats['count'] == 0:
+        print(f"Error: No numerical values found in column '{args.column}'")
+        sys.exit(1)
+    
+    display_statistics(stats, args.column)
+    
+    print(f"\nSummary: Analyzed {stats['count']} values from column '{args.column}' "
+          f"{describe_scope(args, rows_read)}")
+
 def main():
     """
     Main function to execute the CSV parser
@@ -235,9 +2554,84 @@ def main():
     parser = create_argument_parser()
     args = parser.parse_args()
     
+    try:
+        compression = detect_compression(args.filename)
+    except FileNotFoundError:
+        print(f"Error: File '{args.filename}' not found.")
+        sys.exit(1)
+    
+    if compression:
+        # Byte offsets into the decompressed data cannot be seeked to directly
+        if args.build_index:
+            print(f"Error: Cannot index a {compression} compressed file, decompress it first.")
+            sys.exit(1)
+        if args.mmap or args.workers > 1:
+            print(f"Note: '{args.filename}' is {compression} compressed, reading it sequentially "
+                  f"instead of with --mmap or --workers.")
+            args.mmap = False
+            args.workers = 1
+    
+    if args.build_index:
+        path = build_index(args.filename, args.build_index)
+        print(f"Index for column '{args.build_index}' written to '{path}'")
+        return
+    
+    if not args.column:
+        parser.error("the following arguments are required: --column/-c")
+    
+    if args.where:
+        if args.mmap:
+            parser.error("--mmap cannot be combined with --where")
+        try:
+            compile_predicate(args.where, read_csv_header(args.filename))
+        except ValueError as e:
+            print(f"Error: Invalid --where expression: {e}")
+            sys.exit(1)
+    
+    # Every mode below converts and reports skipped values by the same plan
+    schema = load_or_infer_schema(args.filename, args.sample_rows) if args.schema else None
+    
+    if args.group_by:
+        run_group_by(args, args.column, schema)
+        return
+    
+    if len(args.column) > 1 or args.column == ['all'] or args.extended:
+        run_profile(args, args.column, schema)
+        return
+    args.column = args.column[0]
+    
+    if args.filter and args.workers <= 1 and not args.where:
+        filtered_data = filter_rows_indexed(args.filename, *args.filter)
+        if filtered_data is not None:
+            print(f"Using index: {index_path(args.filename, args.filter[0])}")
+            print(f"Applying filter: {args.filter[0]} = '{args.filter[1]}'")
+            run_filtered(args, filtered_data, schema)
+            return
+    
+    if args.mmap:
+        if not args.filter:
+            parser.error("--mmap requires --filter")
+        run_mmap_filter(args, schema)
+        return
+    
+    if args.workers > 1:
+        run_parallel(args, schema)
+        return
+    
+    if args.stream:
+        run_streaming(args, schema)
+        return
+    
     # Read CSV file
     print(f"Reading CSV file: {args.filename}")
-    data = read_csv_file(args.filename)
+    if args.where:
+        print(f"Applying condition: {args.where}")
+    if args.cache and not args.where:
+        data = read_csv_columns_cached(args.filename, schema)
+    elif args.columnar or args.cache:
+        data = read_csv_columns(args.filename, args.where, schema)
+    else:
+        data = read_csv_file(args.filename, args.where)
     
     if not data:
         print("Error: CSV file is empty or could not be read.")
@@ -264,16 +2658,12 @@ def main():
         data_for_stats = data
     
     # Calculate and display statistics
-    stats = calculate_statistics(data_for_stats, args.column)
+    stats = calculate_statistics(data_for_stats, args.column, schema)
     display_statistics(stats, args.column)
     
     # Show summary
-    if args.filter:
-        print(f"\nSummary: Analyzed {stats['count']} values from column '{args.column}' "
-              f"where {args.filter[0]} = '{args.filter[1]}'")
-    else:
-        print(f"\nSummary: Analyzed {stats['count']} values from column '{args.column}' "
-              f"across all {len(data)} rows")
+    print(f"\nSummary: Analyzed {stats['count']} values from column '{args.column}' "
+          f"{describe_scope(args, len(data))}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Date Dimension - Derived calendar attributes for date strings, parsed once
+
+Sales files repeat the same few hundred dates over millions of rows, so each
+distinct date string is parsed a single time and its month, weekday, ISO
+week and quarter are kept in a bounded memoization table. Enriching a column
+of dates then costs one dictionary lookup per row.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional
+
+DATE_FORMAT = '%Y-%m-%d'
+DATE_CACHE_SIZE = 8192
+
+class DateParts(NamedTuple):
+    """Calendar attributes of a single date"""
+    year: Optional[int]
+    month: str
+    month_number: Optional[int]
+    day_of_week: str
+    iso_year: Optional[int]
+    iso_week: Optional[int]
+    quarter: Optional[int]
+
+UNKNOWN_DATE = DateParts(None, 'Unknown', None, 'Unknown', None, None, None)
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def date_parts(date_string: str, date_format: str = DATE_FORMAT) -> DateParts:
+    """
+    Get the calendar attributes of a date string
+
+    Results are memoized, so repeated dates are not parsed again. Strings
+    that do not match the format give UNKNOWN_DATE.
+
+    Args:
+        date_string (str): Date to parse, e.g. '2024-01-31'
+        date_format (str): strptime format of the date
+
+    Returns:
+        DateParts: Year, month name and number, weekday name, ISO year and
+            week, and quarter
+    """
+    try:
+        date_obj = datetime.strptime(date_string, date_format)
+    except (TypeError, ValueError):
+        return UNKNOWN_DATE
+
+    iso_year, iso_week, _ = date_obj.isocalendar()
+    return DateParts(
+        year=date_obj.year,
+        month=date_obj.strftime('%B'),
+        month_number=date_obj.month,
+        day_of_week=date_obj.strftime('%A'),
+        iso_year=iso_year,
+        iso_week=iso_week,
+        quarter=(date_obj.month - 1) // 3 + 1
+    )
+
+def enrich_dates(dates: Iterable[str], date_format: str = DATE_FORMAT) -> List[DateParts]:
+    """
+    Get the calendar attributes of every date in a column
+
+    Args:
+        dates (Iterable[str]): Date strings
+        date_format (str): strptime format of the dates
+
+    Returns:
+        List[DateParts]: Attributes in the same order as the dates
+    """
+    lookup = {}
+    result = []
+    for date_string in dates:
+        parts = lookup.get(date_string)
+        if parts is None:
+            parts = lookup[date_string] = date_parts(date_string, date_format)
+        result.append(parts)
+    return result
+
+def add_date_columns(df, column: str = 'Date', date_format: str = DATE_FORMAT):
+    """
+    Add Month, Day_of_Week, ISO_Week and Quarter columns to a pandas DataFrame
+
+    Only the distinct values of the date column are parsed; the rows are then
+    filled in with Series.map.
+
+    Args:
+        df (pandas.DataFrame): Data with a column of date strings
+        column (str): Name of the date column
+        date_format (str): strptime format of the dates
+
+    Returns:
+        pandas.DataFrame: The same DataFrame with the added columns
+    """
+    dates = df[column].astype(str)
+    lookup = {value: date_parts(value, date_format) for value in dates.unique()}
+
+    for name, attribute in (('Month', 'month'), ('Day_of_Week', 'day_of_week'),
+                            ('ISO_Week', 'iso_week'), ('Quarter', 'quarter')):
+        df[name] = dates.map({value: getattr(parts, attribute) for value, parts in lookup.items()})
+    return df
@@ -1,6 +1,7 @@
-import json
 from datetime import datetime
 
+import json_codec
+
 def create_library_data():
     """
     Create a dictionary representing library data
@@ -62,7 +63,7 @@ def dict_to_json_string(data, indent=None):
     Convert dictionary to JSON string
     """
     try:
-        json_string = json.dumps(data, indent=indent)
+        json_string = json_codec.dumps(data, indent=indent)
         return json_string
     except TypeError as e:
         print(f"Error converting to JSON: {e}")
@@ -74,7 +75,7 @@ def write_json_to_file(data, filename):
     """
     try:
         with open(filename, 'w') as file:
-            json.dump(data, file, indent=4)
+            json_codec.dump(data, file, indent=4)
         print(f"Successfully wrote data to {filename}")
         return True
     except Exception as e:
@@ -117,7 +118,7 @@ def main():
         print("=" * 40)
         try:
             with open("library_data.json", 'r') as file:
-                loaded_data = json.load(file)
+                loaded_data = json_codec.load(file)
                 print(f"Successfully loaded {len(loaded_data)} keys from file")
                 print(f"Library name from file: {loaded_data['library_name']}")
         except Exception as e:
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+JSON Codec - Fast JSON parsing and serialization with a stdlib fallback
+
+Uses orjson when it is installed and the standard json module otherwise.
+Results are the same with either backend: anything orjson rejects (NaN,
+lone surrogates, invalid documents) is handed to json, so errors are the
+familiar json.JSONDecodeError, and so are documents with a run of 19 or
+more digits, since orjson reads integers beyond 64 bits as floats. orjson
+is only used for serialization where its output is byte-identical to
+json.dumps. The known difference is that orjson serializes UUIDs and
+enums, which json.dumps rejects.
+
+Parsing a large document allocates millions of containers, which triggers
+repeated cyclic garbage collection passes over everything built so far;
+parsed JSON cannot contain reference cycles, so collection is paused while
+parsing documents of GC_PAUSE_SIZE or more with either backend. Small
+documents, such as JSON Lines records, leave the collector alone.
+"""
+
+import gc
+import json
+from typing import Any, IO, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+JSONDecodeError = json.JSONDecodeError
+
+GC_PAUSE_SIZE = 1 << 20
+
+if orjson is not None:
+    # Types orjson would serialize but json.dumps rejects are passed through,
+    # so they raise and go to the stdlib encoder like everything else
+    _ORJSON_OPTIONS = (orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS |
+                       orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS)
+
+# orjson may format exponents differently from json.dumps ('1e16' vs
+# '1e+16'), and reads integers that do not fit in 64 bits as floats. With
+# every digit mapped to '0', a digit followed by an exponent or a long run
+# of digits is found with bytes.find, which is far faster than a regex search.
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_LONG_DIGIT_RUN = b'0' * 19
+
+def _has_long_digit_run(data: Any) -> bool:
+    """
+    Check whether JSON text may contain an integer orjson cannot represent
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8', 'surrogatepass')
+    return _LONG_DIGIT_RUN in data.translate(_DIGITS_TO_ZERO)
+
+def loads(data: Any) -> Any:
+    """
+    Parse a JSON document from a str or bytes
+
+    Args:
+        data (Any): JSON text as str, bytes or bytearray
+
+    Returns:
+        Any: Parsed value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    # The collector is process-wide, so it is only paused for large documents
+    collecting = len(data) >= GC_PAUSE_SIZE and gc.isenabled()
+    if collecting:
+        gc.disable()
+    try:
+        if orjson is not None and not _has_long_digit_run(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(data)
+    finally:
+        if collecting:
+            gc.enable()
+
+def load(file: IO) -> Any:
+    """
+    Parse a JSON document from a text or binary file
+
+    Args:
+        file (IO): Open file positioned at the start of the document
+
+    Returns:
+        Any: Parsed value
+    """
+    return loads(file.read())
+
+def _matches_json(output: bytes) -> bool:
+    """
+    Check that orjson output cannot differ from json.dumps with ensure_ascii
+
+    Non-ASCII text would be escaped by json, exponents may be formatted
+    differently, and orjson also writes null for NaN and Infinity.
+    """
+    if not output.isascii() or b'null' in output:
+        return False
+    digits = output.translate(_DIGITS_TO_ZERO)
+    return b'0e' not in digits and b'0E' not in digits
+
+def dumps(obj: Any, indent: Optional[int] = None, **kwargs) -> str:
+    """
+    Serialize a value to a JSON string exactly as json.dumps would
+
+    orjson is only tried for indent=2 without other options, and its output
+    is kept only when it cannot differ from json's; otherwise json.dumps runs.
+
+    Args:
+        obj (Any): Value to serialize
+        indent (Optional[int]): Indentation, as for json.dumps
+        **kwargs: Other json.dumps options; any option disables orjson
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None and indent == 2 and not kwargs:
+        try:
+            output = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            output = None
+        if output is not None and _matches_json(output):
+            return output.decode('ascii')
+    return json.dumps(obj, indent=indent, **kwargs)
+
+def dump(obj: Any, file: IO, indent: Optional[int] = None, **kwargs) -> None:
+    """
+    Serialize a value to a text file exactly as json.dump would
+
+    Args:
+        obj (Any): Value to serialize
+        file (IO): File opened for writing text
+        indent (Optional[int]): Indentation, as for json.dump
+        **kwargs: Other json.dump options
+    """
+    file.write(dumps(obj, indent=indent, **kwargs))
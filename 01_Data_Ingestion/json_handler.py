@@ -1,6 +1,15 @@
+import functools
+import io
 import json
 import os
+import re
+import threading
+import time
+from collections import Counter, deque
 from datetime import datetime
+from multiprocessing.pool import Pool, ThreadPool
+
+import json_codec
 
 # Custom Exception Classes
 class JSONFileError(Exception):
@@ -15,13 +24,562 @@ class JSONStructureError(JSONFileError):
     """Exception raised when JSON structure is invalid"""
     pass
 
+READ_CHUNK_SIZE = 1 << 16
+JSONL_CHUNK_SIZE = 16 << 20
+# Chunks queued per worker process ahead of the one being consumed
+JSONL_CHUNKS_PER_WORKER = 2
+# Messages of skipped records kept in the ledger entry of their file
+RECORD_ERROR_EXAMPLES = 5
+
+# Runs of characters that cannot open or close a container or a string
+_PLAIN_RUN = re.compile(r'[^"\[\]{}]+')
+# Characters that may still continue a number cut off at the end of the buffer
+_NUMBER_TAIL = re.compile(r'[0-9eE.+-]*')
+# Rest of a string literal after its opening quote, up to the closing quote
+_STRING_REST = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+# Decode errors this close to the end of the buffer may be a value cut off by
+# the chunk boundary (a partial literal or \\uXXXX escape) rather than bad input
+_TRUNCATION_MARGIN = 6
+
+class JSONStream:
+    """
+    Incremental reader over a JSON text file
+    
+    Only a window of the file is kept in memory. Values are decoded one at
+    a time with JSONDecoder.raw_decode, and values that are not needed are
+    skipped by scanning their brackets and strings without building them.
+    """
+    
+    def __init__(self, file, chunk_size=READ_CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+    
+    def _fill(self, size=None):
+        """
+        Drop the consumed part of the buffer and read more of the file
+        """
+        if self.eof:
+            return False
+        chunk = self.file.read(size or self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.offset += self.pos
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+    
+    def peek(self):
+        """
+        Skip whitespace and return the next character ('' at end of file)
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos:self.pos + 1]
+    
+    def expect(self, characters):
+        """
+        Consume the next non-whitespace character, which must be one of characters
+        """
+        char = self.peek()
+        if not char or char not in characters:
+            found = repr(char) if char else 'end of file'
+            raise json.JSONDecodeError(f"Expecting one of {characters!r}, found {found}",
+                                       self.buffer, self.pos)
+        self.pos += 1
+        return char
+    
+    def read_value(self):
+        """
+        Decode the next complete JSON value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if self.eof or not _NUMBER_TAIL.fullmatch(self.buffer, end):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                truncated = (e.pos >= len(self.buffer) - _TRUNCATION_MARGIN
+                             or e.msg.startswith('Unterminated string'))
+                if self.eof or not truncated:
+                    raise json.JSONDecodeError(e.msg, e.doc, e.pos) from None
+            # Grow geometrically so large values are not re-decoded too often
+            self._fill(max(self.chunk_size, len(self.buffer)))
+    
+    def skip_value(self):
+        """
+        Move past the next JSON value without decoding it
+        """
+        if self.peek() not in '[{':
+            self.read_value()
+            return
+        
+        depth = 0
+        while True:
+            if self.pos >= len(self.buffer) and not self._fill():
+                raise json.JSONDecodeError("Unterminated container", self.buffer, self.pos)
+            char = self.buffer[self.pos]
+            if char == '"':
+                match = _STRING_REST.match(self.buffer, self.pos + 1)
+                while match is None or match.end() == len(self.buffer):
+                    if not self._fill(max(self.chunk_size, len(self.buffer))):
+                        if match is None:
+                            raise json.JSONDecodeError("Unterminated string", self.buffer, self.pos)
+                        break
+                    match = _STRING_REST.match(self.buffer, self.pos + 1)
+                self.pos = match.end()
+                continue
+            if char in '[{':
+                depth += 1
+            elif char in ']}':
+                depth -= 1
+                if depth == 0:
+                    self.pos += 1
+                    return
+            else:
+                match = _PLAIN_RUN.match(self.buffer, self.pos)
+                self.pos = match.end()
+                continue
+            self.pos += 1
+    
+    def enter(self, path):
+        """
+        Move to the value at path, a sequence of object keys and array indexes
+        """
+        for step in path:
+            if isinstance(step, int):
+                self.expect('[')
+                for _ in range(step):
+                    self.skip_value()
+                    self.expect(',')
+                continue
+            
+            self.expect('{')
+            while True:
+                if self.peek() == '}':
+                    raise JSONStructureError(f"Key '{step}' not found")
+                key = self.read_value()
+                self.expect(':')
+                if key == step:
+                    break
+                self.skip_value()
+                self.expect(',}')
+                if self.buffer[self.pos - 1] == '}':
+                    raise JSONStructureError(f"Key '{step}' not found")
+    
+    def iter_array(self):
+        """
+        Yield the elements of the array starting at the current position
+        """
+        if self.peek() != '[':
+            raise JSONStructureError(f"Expected an array, found {self.peek() or 'end of file'!r}")
+        self.pos += 1
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if self.expect(',]') == ']':
+                return
+
+def iter_json_array(file, path=(), chunk_size=READ_CHUNK_SIZE):
+    """
+    Yield the elements of a JSON array one at a time from a text file
+    
+    Memory use is proportional to the largest element, not to the document.
+    path selects a nested array, e.g. ('departments', 0, 'employees');
+    the default is the top-level array.
+    """
+    stream = JSONStream(file, chunk_size)
+    try:
+        stream.enter(path)
+        yield from stream.iter_array()
+    except json.JSONDecodeError as e:
+        # Report positions within the whole file rather than the buffer
+        raise json.JSONDecodeError(e.msg, '', stream.offset + e.pos) from None
+
+SCHEMA_CACHE_SIZE = 256
+
+def _type_name(value):
+    """
+    Name the types in a schema for its fingerprint (json.dumps default)
+    """
+    if isinstance(value, type):
+        return f"{value.__module__}.{value.__qualname__}"
+    raise TypeError(f"Unsupported schema value {value!r}")
+
+class _SchemaKey:
+    """
+    Cache key comparing schemas by their canonical JSON form
+    
+    Equal schemas share one compiled validator, even when they are
+    different objects, e.g. copies unpickled in every task.
+    """
+    
+    __slots__ = ('schema', 'fingerprint')
+    
+    def __init__(self, schema):
+        self.schema = schema
+        self.fingerprint = json.dumps(schema, sort_keys=True, default=_type_name)
+    
+    def __eq__(self, other):
+        return self.fingerprint == other.fingerprint
+    
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+def compile_schema(schema):
+    """
+    Turn a schema into a reusable validator function
+    
+    Supported schema keys:
+        required_fields: fields that must be present
+        field_types: field -> type (or tuple of types) its value must have
+        fields: field -> schema of a nested dictionary
+        items: field -> schema of every dictionary in a list
+    
+    The validator takes (data, location) and returns a list with every
+    violation found, empty when the data is valid; it never raises. The
+    most recently used SCHEMA_CACHE_SIZE schemas are kept compiled, keyed
+    by their contents.
+    """
+    return _compile_schema(_SchemaKey(schema))
+
+@functools.lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _compile_schema(key):
+    schema = key.schema
+    required = list(schema.get('required_fields', ()))
+    types = [(field, expected_type,
+              ' or '.join(t.__name__ for t in expected_type) if isinstance(expected_type, tuple)
+              else expected_type.__name__)
+             for field, expected_type in schema.get('field_types', {}).items()]
+    nested = [(field, compile_schema(subschema)) for field, subschema in schema.get('fields', {}).items()]
+    items = [(field, compile_schema(subschema)) for field, subschema in schema.get('items', {}).items()]
+    
+    def validate(data, location):
+        if not isinstance(data, dict):
+            return [f"Expected dictionary in '{location}', got {type(data).__name__}"]
+        
+        violations = []
+        missing_fields = [field for field in required if field not in data]
+        if missing_fields:
+            violations.append(f"Missing required fields in '{location}': {missing_fields}")
+        
+        for field, expected_type, type_name in types:
+            if field in data and not isinstance(data[field], expected_type):
+                violations.append(f"Field '{field}' in '{location}' should be {type_name}, "
+                                  f"got {type(data[field]).__name__}")
+        
+        for field, validator in nested:
+            if field in data:
+                violations.extend(validator(data[field], f"{location}.{field}"))
+        
+        for field, validator in items:
+            if field not in data:
+                continue
+            values = data[field]
+            if not isinstance(values, list):
+                violations.append(f"Field '{field}' in '{location}' should be list, got {type(values).__name__}")
+                continue
+            for index, value in enumerate(values):
+                violations.extend(validator(value, f"{location}.{field}[{index}]"))
+        
+        return violations
+    
+    return validate
+
+def _load_file(filename, validator=None):
+    """
+    Read, parse and validate one JSON file without raising (runs in a worker)
+    
+    Returns:
+        tuple: (filename, data, error_type, message); data is None and
+            error_type is set when the file could not be loaded
+    """
+    try:
+        with open(filename, 'r') as file:
+            data = json_codec.load(file)
+    except FileNotFoundError:
+        return filename, None, 'file_not_found', f"JSON file '{filename}' does not exist"
+    except json.JSONDecodeError as e:
+        return (filename, None, 'json_decode_error',
+                f"Invalid JSON in '{filename}' at line {e.lineno}, column {e.colno}: {e.msg}")
+    except Exception as e:
+        return (filename, None, 'unexpected_error',
+                f"Unexpected error processing '{filename}': {type(e).__name__}: {e}")
+    
+    if validator:
+        violations = validator(data, filename)
+        if violations:
+            return filename, None, 'validation_error', '; '.join(violations)
+    return filename, data, None, None
+
+# Validator of the schema a worker process was started with (see _init_load_worker)
+_worker_validator = None
+
+def _init_load_worker(schema):
+    """
+    Compile the schema once per worker process (Pool initializer)
+    """
+    global _worker_validator
+    _worker_validator = compile_schema(schema) if schema else None
+
+def _load_file_in_worker(filename):
+    """
+    Load one JSON file with the validator of the worker process
+    """
+    return _load_file(filename, _worker_validator)
+
+def iter_jsonl_lines(lines, first_line=1, offset=0, validator=None):
+    """
+    Parse JSON Lines one line at a time, isolating malformed lines
+    
+    lines is any iterable of byte strings, such as a file opened in binary
+    mode; offset is the byte position of its first line. Blank lines are
+    skipped, and a bad line is reported instead of stopping the iteration.
+    
+    Yields:
+        tuple: (line_number, offset, record, error); error is None for a
+            valid line, otherwise (error_type, message) and record is None
+    """
+    for line_number, line in enumerate(lines, first_line):
+        if line.strip():
+            try:
+                record = json_codec.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, offset, None, ('json_decode_error', f"{e.msg} at column {e.colno}")
+            except ValueError as e:
+                yield line_number, offset, None, ('json_decode_error', str(e))
+            else:
+                violations = validator(record, "record") if validator else None
+                if violations:
+                    yield line_number, offset, None, ('validation_error', '; '.join(violations))
+                else:
+                    yield line_number, offset, record, None
+        offset += len(line)
+
+def jsonl_chunks(filename, chunk_size=JSONL_CHUNK_SIZE):
+    """
+    Split a file into (start, end) byte ranges of about chunk_size that end on a newline
+    """
+    size = os.path.getsize(filename)
+    bounds = [0]
+    with open(filename, 'rb') as file:
+        while bounds[-1] < size:
+            file.seek(bounds[-1] + chunk_size - 1)
+            file.readline()
+            bounds.append(min(file.tell(), size))
+    return list(zip(bounds, bounds[1:]))
+
+def _parse_jsonl_chunk(task):
+    """
+    Parse one byte range of a JSONL file (runs in a worker process)
+    
+    Returns:
+        tuple: (results, line_count); line numbers in the results count
+            from the start of the range
+    """
+    filename, start, end, schema = task
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    
+    validator = compile_schema(schema) if schema else None
+    results = list(iter_jsonl_lines(io.BytesIO(data), 1, start, validator))
+    return results, data.count(b'\n') + (not data.endswith(b'\n'))
+
+def iter_jsonl(filename, schema=None, workers=None, chunk_size=JSONL_CHUNK_SIZE):
+    """
+    Parse a JSON Lines file, optionally in parallel, isolating malformed lines
+    
+    With workers, the file is split into newline-aligned chunks that are
+    parsed by a process pool; results still come back in file order with
+    line numbers counted from the start of the file. Only a few chunks per
+    worker are in flight, so parsed records do not pile up in memory when
+    the caller consumes them more slowly than the workers produce them.
+    
+    Yields:
+        tuple: (line_number, offset, record, error) as for iter_jsonl_lines
+    """
+    if not workers or workers <= 1:
+        validator = compile_schema(schema) if schema else None
+        with open(filename, 'rb') as file:
+            yield from iter_jsonl_lines(file, validator=validator)
+        return
+    
+    chunks = iter(jsonl_chunks(filename, chunk_size))
+    pending = deque()
+    
+    def submit():
+        chunk = next(chunks, None)
+        if chunk is not None:
+            pending.append(pool.apply_async(_parse_jsonl_chunk, ((filename, *chunk, schema),)))
+    
+    lines_before = 0
+    with Pool(workers) as pool:
+        for _ in range(JSONL_CHUNKS_PER_WORKER * workers):
+            submit()
+        while pending:
+            results, line_count = pending.popleft().get()
+            submit()
+            for line_number, offset, record, error in results:
+                yield lines_before + line_number, offset, record, error
+            lines_before += line_count
+
+class RecordErrors:
+    """
+    Errors of the records skipped within one file: counts per error type
+    and the first RECORD_ERROR_EXAMPLES messages
+    """
+    
+    def __init__(self):
+        self.counts = Counter()
+        self.examples = []
+    
+    def add(self, error_type, message):
+        self.counts[error_type] += 1
+        if len(self.examples) < RECORD_ERROR_EXAMPLES:
+            self.examples.append(message)
+    
+    def details(self):
+        """
+        Get the ledger entry details (see ProcessingLedger.record)
+        """
+        if not self.counts:
+            return {}
+        return {'record_errors': dict(self.counts), 'record_error_examples': self.examples}
+
+class ProcessingLedger:
+    """
+    Processing status of files in bounded memory
+    
+    Running counters per status and error type make summaries O(1), and only
+    the most recent `history_size` entries are kept. Records skipped inside
+    a file are counted separately, so the file counters count files only. When `spill_log` is
+    given, every entry is also appended to that file as one JSON line, so
+    the full history stays available on disk; close the ledger, or use it
+    as a context manager, to close that file.
+    """
+    
+    def __init__(self, history_size=1000, spill_log=None):
+        self.status_counts = Counter()
+        self.error_counts = Counter()
+        self.record_error_counts = Counter()
+        self.recent = deque(maxlen=history_size)
+        self.spill_log = spill_log
+        self._spill_file = open(spill_log, 'a', buffering=1) if spill_log else None
+        self._lock = threading.Lock()
+    
+    def record(self, filename, status, error_type=None, message=None, record_errors=None, **details):
+        """
+        Record the status of one file (safe to call from several threads)
+        
+        record_errors maps error types to the number of records of the file
+        skipped because of them.
+        """
+        if record_errors:
+            details['record_errors'] = record_errors
+        entry = (time.time(), filename, status, error_type, message, details)
+        with self._lock:
+            self.status_counts[status] += 1
+            if error_type:
+                self.error_counts[error_type] += 1
+            if record_errors:
+                self.record_error_counts.update(record_errors)
+            self.recent.append(entry)
+            if self._spill_file:
+                self._spill_file.write(json_codec.dumps(self._as_dict(entry)) + '\n')
+    
+    @staticmethod
+    def _as_dict(entry):
+        timestamp, filename, status, error_type, message, details = entry
+        result = {
+            'filename': filename,
+            'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+            'status': status
+        }
+        if error_type:
+            result['error_type'] = error_type
+            result['message'] = message
+        result.update(details)
+        return result
+    
+    def entries(self):
+        """
+        Get the recent entries, oldest first, as dictionaries
+        """
+        with self._lock:
+            recent = list(self.recent)
+        return [self._as_dict(entry) for entry in recent]
+    
+    def summary(self):
+        """
+        Get the counts of processed, successful and failed files, and of
+        the records skipped inside them
+        """
+        with self._lock:
+            total = sum(self.status_counts.values())
+            successful = self.status_counts['success']
+            error_types = dict(self.error_counts)
+            record_error_types = dict(self.record_error_counts)
+        return {
+            'total_processed': total,
+            'successful': successful,
+            'failed': total - successful,
+            'error_types': error_types,
+            'invalid_records': sum(record_error_types.values()),
+            'record_error_types': record_error_types
+        }
+    
+    def close(self):
+        """
+        Close the spill log
+        """
+        with self._lock:
+            if self._spill_file:
+                self._spill_file.close()
+                self._spill_file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 class JSONProcessor:
     """
     Advanced JSON processor with custom exception handling
     """
     
-    def __init__(self):
-        self.processed_files = []
+    def __init__(self, history_size=1000, spill_log=None):
+        self.ledger = ProcessingLedger(history_size, spill_log)
+    
+    def close(self):
+        """
+        Close the ledger's spill log
+        """
+        self.ledger.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    @property
+    def processed_files(self):
+        """
+        Recent processing entries (the full history is in the ledger's spill log)
+        """
+        return self.ledger.entries()
     
     def load_json_with_validation(self, filename, schema=None):
         """
@@ -34,18 +592,14 @@ class JSONProcessor:
             
             # Read and parse JSON
             with open(filename, 'r') as file:
-                data = json.load(file)
+                data = json_codec.load(file)
             
             # Validate against schema if provided
             if schema:
                 self._validate_schema(data, schema, filename)
             
             # Track processed files
-            self.processed_files.append({
-                'filename': filename,
-                'timestamp': datetime.now().isoformat(),
-                'status': 'success'
-            })
+            self._log_success(filename)
             
             print(f"Successfully loaded and validated JSON from '{filename}'")
             return data
@@ -68,34 +622,170 @@ class JSONProcessor:
             self._log_error(filename, 'unexpected_error', error_msg)
             raise JSONFileError(error_msg)
     
+    def load_many(self, paths, schema=None, workers=None, executor='thread', ordered=True):
+        """
+        Load and validate many JSON files concurrently
+        
+        Files are read, parsed and validated by a pool of threads or of
+        processes; with many small files 'process' uses every core, while
+        'thread' avoids pickling the results. Worker processes receive the
+        schema once, when they start. Results are yielded in input
+        order, or as soon as they are ready with ordered=False, and every
+        file's status is recorded. Failures do not stop the other files.
+        
+        Yields:
+            tuple: (filename, data, error); data is None and error holds the
+                message when the file could not be loaded
+        """
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+        
+        paths = list(paths)
+        if executor == 'thread':
+            pool = ThreadPool(workers)
+            load = functools.partial(_load_file, validator=compile_schema(schema) if schema else None)
+        else:
+            pool = Pool(workers, initializer=_init_load_worker, initargs=(schema,))
+            load = _load_file_in_worker
+        
+        with pool:
+            # Batch small files per task to keep the pool overhead low
+            chunksize = max(1, min(64, len(paths) // (4 * (workers or os.cpu_count() or 1))))
+            results = (pool.imap if ordered else pool.imap_unordered)(load, paths, chunksize)
+            
+            for filename, data, error_type, message in results:
+                if error_type:
+                    self._log_error(filename, error_type, message)
+                else:
+                    self._log_success(filename)
+                yield filename, data, message
+    
+    def iter_json_with_validation(self, filename, schema=None, path=()):
+        """
+        Stream the records of a JSON array file, validating each one
+        
+        Records are yielded one at a time (see iter_json_array), so huge
+        files are never loaded whole. Records failing the schema are skipped
+        and counted in the file's single ledger entry, with the first few
+        messages; invalid JSON, or a file that cannot be read or decoded,
+        stops the iteration with JSONFileError.
+        """
+        valid = invalid = 0
+        record_errors = RecordErrors()
+        try:
+            if not os.path.exists(filename):
+                raise FileNotFoundError(f"JSON file '{filename}' does not exist")
+            
+            validator = compile_schema(schema) if schema else None
+            with open(filename, 'r') as file:
+                for index, record in enumerate(iter_json_array(file, path)):
+                    if validator:
+                        violations = validator(record, f"{filename}[{index}]")
+                        if violations:
+                            record_errors.add('validation_error', '; '.join(violations))
+                            invalid += 1
+                            continue
+                    valid += 1
+                    yield record
+            
+            self._log_success(filename, records=valid, invalid_records=invalid, **record_errors.details())
+            print(f"Successfully streamed {valid} records from '{filename}' ({invalid} invalid)")
+        
+        except FileNotFoundError as e:
+            self._log_error(filename, 'file_not_found', str(e))
+            raise JSONFileError(f"File error: {e}")
+        
+        except json.JSONDecodeError as e:
+            error_msg = f"Invalid JSON in '{filename}' at character {e.pos}: {e.msg}"
+            self._log_error(filename, 'json_decode_error', error_msg, **record_errors.details())
+            raise JSONFileError(error_msg)
+        
+        except JSONStructureError as e:
+            error_msg = f"Unexpected structure in '{filename}': {e}"
+            self._log_error(filename, 'structure_error', error_msg, **record_errors.details())
+            raise JSONFileError(error_msg)
+        
+        except OSError as e:
+            error_msg = f"Could not read '{filename}': {e}"
+            self._log_error(filename, 'file_error', error_msg, **record_errors.details())
+            raise JSONFileError(error_msg)
+        
+        except UnicodeDecodeError as e:
+            error_msg = f"Could not decode '{filename}' as {e.encoding}: {e.reason}"
+            self._log_error(filename, 'encoding_error', error_msg, **record_errors.details())
+            raise JSONFileError(error_msg)
+    
+    def iter_jsonl_with_validation(self, filename, schema=None, workers=None, chunk_size=JSONL_CHUNK_SIZE):
+        """
+        Stream the records of a JSON Lines file, validating each one
+        
+        Malformed or invalid lines are skipped, so one bad line does not fail
+        the file; they are counted in the file's single ledger entry, with
+        the line number and byte offset of the first few. A file that cannot
+        be read is logged as failed and raises JSONFileError. With workers,
+        large files are parsed in parallel (see iter_jsonl).
+        """
+        valid = invalid = 0
+        record_errors = RecordErrors()
+        try:
+            if not os.path.exists(filename):
+                raise FileNotFoundError(f"JSON file '{filename}' does not exist")
+            
+            for line_number, offset, record, error in iter_jsonl(filename, schema, workers, chunk_size):
+                if error:
+                    error_type, message = error
+                    record_errors.add(error_type, f"Line {line_number} (byte offset {offset}): {message}")
+                    invalid += 1
+                    continue
+                valid += 1
+                yield record
+            
+            self._log_success(filename, records=valid, invalid_records=invalid, **record_errors.details())
+            print(f"Successfully streamed {valid} records from '{filename}' ({invalid} invalid)")
+        
+        except FileNotFoundError as e:
+            self._log_error(filename, 'file_not_found', str(e))
+            raise JSONFileError(f"File error: {e}")
+        
+        except OSError as e:
+            error_msg = f"Could not read '{filename}': {e}"
+            self._log_error(filename, 'file_error', error_msg, **record_errors.details())
+            raise JSONFileError(error_msg)
+        
+        except UnicodeDecodeError as e:
+            error_msg = f"Could not decode '{filename}' as {e.encoding}: {e.reason}"
+            self._log_error(filename, 'encoding_error', error_msg, **record_errors.details())
+            raise JSONFileError(error_msg)
+    
+    def validate_batch(self, records, schema, source='batch'):
+        """
+        Validate many records against a schema in one call
+        
+        Returns:
+            list: (index, violations) for every invalid record; empty if all are valid
+        """
+        validator = compile_schema(schema)
+        failures = []
+        for index, record in enumerate(records):
+            violations = validator(record, f"{source}[{index}]")
+            if violations:
+                failures.append((index, violations))
+        return failures
+    
     def _validate_schema(self, data, schema, filename):
         """
         Validate JSON data against a simple schema
+        
+        All violations are reported together in one JSONValidationError.
         """
         try:
             # Check if data is a dictionary
             if not isinstance(data, dict):
                 raise JSONStructureError(f"Expected dictionary, got {type(data).__name__}")
             
-            # Check required fields
-            if 'required_fields' in schema:
-                missing_fields = []
-                for field in schema['required_fields']:
-                    if field not in data:
-                        missing_fields.append(field)
-                
-                if missing_fields:
-                    raise JSONValidationError(f"Missing required fields in '{filename}': {missing_fields}")
-            
-            # Check field types
-            if 'field_types' in schema:
-                for field, expected_type in schema['field_types'].items():
-                    if field in data:
-                        if not isinstance(data[field], expected_type):
-                            raise JSONValidationError(
-                                f"Field '{field}' in '{filename}' should be {expected_type.__name__}, "
-                                f"got {type(data[field]).__name__}"
-                            )
+            violations = compile_schema(schema)(data, filename)
+            if violations:
+                raise JSONValidationError('; '.join(violations))
             
             print(f"Schema validation passed for '{filename}'")
         
@@ -105,32 +795,29 @@ class JSONProcessor:
         except Exception as e:
             raise JSONValidationError(f"Schema validation error: {e}")
     
-    def _log_error(self, filename, error_type, message):
+    def _log_success(self, filename, **details):
         """
-        Log error information
+        Log a successfully processed file (safe to call from several threads)
         """
-        self.processed_files.append({
-            'filename': filename,
-            'timestamp': datetime.now().isoformat(),
-            'status': 'error',
-            'error_type': error_type,
-            'message': message
-        })
+        self.ledger.record(filename, 'success', **details)
     
-    def get_processing_summary(self):
+    def _log_error(self, filename, error_type, message, **details):
         """
-        Get summary of processed files
+        Log error information (safe to call from several threads)
         """
-        total_files = len(self.processed_files)
-        successful = len([f for f in self.processed_files if f['status'] == 'success'])
-        failed = total_files - successful
+        self.ledger.record(filename, 'error', error_type, message, **details)
+    
+    def get_processing_summary(self, include_details=True):
+        """
+        Get summary of processed files
         
-        return {
-            'total_processed': total_files,
-            'successful': successful,
-            'failed': failed,
-            'details': self.processed_files
-        }
+        The counts cover every file processed; 'details' holds only the
+        recent entries kept by the ledger.
+        """
+        summary = self.ledger.summary()
+        if include_details:
+            summary['details'] = self.ledger.entries()
+        return summary
 
 def create_test_files_for_advanced_processing():
     """
@@ -165,13 +852,13 @@ def create_test_files_for_advanced_processing():
     
     # Write test files
     with open("valid_user.json", 'w') as f:
-        json.dump(user_data, f, indent=2)
+        json_codec.dump(user_data, f, indent=2)
     
     with open("invalid_user.json", 'w') as f:
-        json.dump(invalid_user_data, f, indent=2)
+        json_codec.dump(invalid_user_data, f, indent=2)
     
     with open("wrong_types.json", 'w') as f:
-        json.dump(wrong_type_data, f, indent=2)
+        json_codec.dump(wrong_type_data, f, indent=2)
     
     print("Created test files for advanced processing")
 
@@ -192,35 +879,35 @@ if __name__ == "__main__":
         }
     }
     
-    processor = JSONProcessor()
-    
-    print("\n=== Testing valid JSON file ===")
-    try:
-        data = processor.load_json_with_validation("valid_user.json", user_schema)
-        print(f"Loaded data: {data}")
-    except JSONFileError as e:
-        print(f"JSON File Error: {e}")
-    
-    print("\n=== Testing invalid JSON file (missing field) ===")
-    try:
-        data = processor.load_json_with_validation("invalid_user.json", user_schema)
-    except JSONFileError as e:
-        print(f"JSON File Error: {e}")
-    
-    print("\n=== Testing JSON file with wrong types ===")
-    try:
-        data = processor.load_json_with_validation("wrong_types.json", user_schema)
-    except JSONFileError as e:
-        print(f"JSON File Error: {e}")
-    
-    print("\n=== Testing non-existent file ===")
-    try:
-        data = processor.load_json_with_validation("nonexistent.json", user_schema)
-    except JSONFileError as e:
-        print(f"JSON File Error: {e}")
-    
-    print("\n=== Processing Summary ===")
-    summary = processor.get_processing_summary()
-    print(f"Total files processed: {summary['total_processed']}")
-    print(f"Successful: {summary['successful']}")
-    print(f"Failed: {summary['failed']}")
\ No newline at end of file
+    with JSONProcessor() as processor:
+        print("\n=== Testing valid JSON file ===")
+        try:
+            data = processor.load_json_with_validation("valid_user.json", user_schema)
+            print(f"Loaded data: {data}")
+        except JSONFileError as e:
+            print(f"JSON File Error: {e}")
+        
+        print("\n=== Testing invalid JSON file (missing field) ===")
+        try:
+            data = processor.load_json_with_validation("invalid_user.json", user_schema)
+        except JSONFileError as e:
+            print(f"JSON File Error: {e}")
+        
+        print("\n=== Testing JSON file with wrong types ===")
+        try:
+            data = processor.load_json_with_validation("wrong_types.json", user_schema)
+        except JSONFileError as e:
+            print(f"JSON File Error: {e}")
+        
+        print("\n=== Testing non-existent file ===")
+        try:
+            data = processor.load_json_with_validation("nonexistent.json", user_schema)
+        except JSONFileError as e:
+            print(f"JSON File Error: {e}")
+        
+        print("\n=== Processing Summary ===")
+        summary = processor.get_processing_summary()
+        print(f"Total files processed: {summary['total_processed']}")
+        print(f"Successful: {summary['successful']}")
+        print(f"Failed: {summary['failed']}")
+        print(f"Errors by type: {summary['error_types']}")
\ No newline at end of file
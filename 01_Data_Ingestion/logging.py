@@ -6,6 +6,9 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+import json_codec
+from json_handler import iter_jsonl
+
 class ApplicationLogger:
     """
     Advanced logging configuration class
@@ -136,7 +139,7 @@ class DataProcessor:
                     return None
                 
                 self.logger.debug(f"Parsing JSON content from: {filename}")
-                data = json.loads(content)
+                data = json_codec.loads(content)
                 
                 # Validate data structure
                 self._validate_json_data(data, filename)
@@ -169,6 +172,50 @@ class DataProcessor:
         finally:
             self.logger.debug(f"Finished processing attempt for: {filename}")
     
+    def process_jsonl_file(self, filename, workers=None):
+        """
+        Process JSON Lines file with detailed logging
+        
+        Malformed lines are logged with their line number and byte offset
+        and skipped; with workers, large files are parsed in parallel.
+        """
+        self.logger.info(f"Starting JSONL processing for: {filename}")
+        
+        try:
+            if not os.path.exists(filename):
+                raise FileNotFoundError(f"File '{filename}' does not exist")
+            
+            self.logger.debug(f"File size: {os.path.getsize(filename)} bytes")
+            
+            records = []
+            bad_lines = 0
+            for line_number, offset, record, error in iter_jsonl(filename, workers=workers):
+                if error:
+                    self.logger.warning(f"Skipping bad line {line_number} (byte offset {offset}) "
+                                        f"in {filename}: {error[1]}")
+                    bad_lines += 1
+                else:
+                    records.append(record)
+            
+            if bad_lines:
+                self.logger.warning(f"{bad_lines} bad lines skipped in: {filename}")
+            self.processed_count += 1
+            self.logger.info(f"Successfully processed JSONL file: {filename} ({len(records)} records)")
+            return records
+        
+        except FileNotFoundError as e:
+            self.logger.error(f"File not found: {e}")
+            self.error_count += 1
+            raise
+        
+        except Exception as e:
+            self.logger.critical(f"Unexpected error processing {filename}: {type(e).__name__}: {e}")
+            self.error_count += 1
+            raise
+        
+        finally:
+            self.logger.debug(f"Finished processing attempt for: {filename}")
+    
     def _validate_json_data(self, data, filename):
         """
         Validate JSON data structure
@@ -226,10 +273,10 @@ class DataProcessor:
 # Example usage:
 if __name__ == "__main__":
     data_processor = DataProcessor()
-
+    
     # Example file list
     filenames = ["file1.json", "file2.json", "file3.json"]
     results = data_processor.batch_process(filenames)
-
+    
     # Output processing statistics
     print(data_processor.get_statistics())
@@ -1,12 +1,14 @@
 import json
 
+import json_codec
+
 def load_json_data(filename):
     """
     Load JSON data from file
     """
     try:
         with open(filename, 'r') as file:
-            return json.load(file)
+            return json_codec.load(file)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return None
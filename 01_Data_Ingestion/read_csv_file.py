@@ -1,15 +1,127 @@
 #!/usr/bin/env python3
 import csv
+import itertools
+import operator
+import time
+from array import array
 from datetime import datetime
 
-def read_sales_data(filename):
+from compressed_input import open_text
+from date_dimension import enrich_dates
+
+SALES_COLUMNS = ['Date', 'Product', 'Category', 'Quantity', 'Price', 'Sales_Rep']
+
+class SalesBatch:
+    """
+    Sales data stored column by column instead of as one dict per sale
+    
+    Text columns are lists, quantity, price and total are typed arrays, and
+    position i of every column belongs to the same sale.
+    """
+    
+    def __init__(self):
+        self.date = []
+        self.product = []
+        self.category = []
+        self.quantity = array('q')
+        self.price = array('d')
+        self.total = array('d')
+        self.sales_rep = []
+    
+    def __len__(self):
+        return len(self.quantity)
+    
+    def extend(self, rows):
+        """
+        Append a chunk of CSV rows, converting each column in one call
+        
+        Args:
+            rows: Lists of values in SALES_COLUMNS order
+        """
+        if not rows:
+            return
+        date, product, category, quantity, price, sales_rep = zip(*rows)
+        quantity = array('q', map(int, quantity))
+        price = array('d', map(float, price))
+        
+        self.date.extend(date)
+        self.product.extend(product)
+        self.category.extend(category)
+        self.quantity.extend(quantity)
+        self.price.extend(price)
+        self.total.extend(map(operator.mul, quantity, price))
+        self.sales_rep.extend(sales_rep)
+    
+    def date_dimension(self):
+        """
+        Get the calendar attributes (month, weekday, ISO week, quarter) of every sale
+        """
+        return enrich_dates(self.date)
+    
+    def records(self):
+        """
+        Rebuild the per-sale dictionaries returned by the verbose mode
+        """
+        for values in zip(self.date, self.product, self.category, self.quantity,
+                          self.price, self.total, self.sales_rep):
+            yield dict(zip(('date', 'product', 'category', 'quantity', 'price', 'total', 'sales_rep'), values))
+
+def read_sales_batch(filename, chunk_size=100_000, report_every=1_000_000):
+    """
+    Read sales data into a SalesBatch without printing every row
+    
+    Rows are converted a chunk at a time and the throughput is reported
+    every report_every rows.
+    """
+    batch = SalesBatch()
+    
+    with open_text(filename) as csvfile:
+        csv_reader = csv.reader(csvfile)
+        # An empty file has no header either and holds no sales
+        header = next(csv_reader, SALES_COLUMNS)
+        select = operator.itemgetter(*(header.index(column) for column in SALES_COLUMNS))
+        rows = map(select, filter(None, csv_reader))
+        
+        start = time.perf_counter()
+        next_report = report_every
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            batch.extend(chunk)
+            
+            if len(batch) >= next_report:
+                elapsed = time.perf_counter() - start
+                print(f"  {len(batch):,} rows read ({len(batch) / elapsed:,.0f} rows/sec)")
+                next_report += report_every
+    
+    elapsed = time.perf_counter() - start
+    rate = len(batch) / elapsed if elapsed else 0
+    print(f"Total records processed: {len(batch)} ({rate:,.0f} rows/sec)")
+    return batch
+
+def read_sales_data(filename, verbose=True):
     """
     Read sales data from CSV file using csv module
+    
+    The file may be compressed with gzip, bzip2 or xz; it is decompressed
+    while it is read. With verbose=False the rows are not printed and a
+    SalesBatch is returned instead of a list of dicts (see read_sales_batch).
     """
+    if not verbose:
+        try:
+            return read_sales_batch(filename)
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found.")
+            return SalesBatch()
+        except Exception as e:
+            print(f"Error reading CSV file: {e}")
+            return SalesBatch()
+    
     sales_data = []
     
     try:
-        with open(filename, 'r', newline='') as csvfile:
+        with open_text(filename) as csvfile:
             # Create CSV reader object
             csv_reader = csv.DictReader(csvfile)
             
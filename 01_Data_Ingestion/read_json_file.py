@@ -1,13 +1,15 @@
 import json
 import pprint
 
+import json_codec
+
 def read_json_file(filename):
     """
     Read a JSON file and return the parsed data
     """
     try:
         with open(filename, 'r') as file:
-            data = json.load(file)
+            data = json_codec.load(file)
             return data
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
@@ -0,0 +1,322 @@
+import bz2
+import gzip
+import lzma
+import os
+import sys
+
+import pytest
+
+from csv_parser import (
+    read_csv_file, iter_csv_rows, read_csv_columns, calculate_statistics,
+    calculate_statistics_streaming, filter_rows, filter_rows_mmap, filter_rows_indexed,
+    build_index, split_byte_ranges, accumulate_columns, RunningStatistics, QuantileSketch,
+    accumulate_groups, merge_groups, compile_predicate, ScanTask, _scan_byte_range,
+    create_argument_parser, run_profile, run_group_by, main,
+    read_csv_columns_cached, read_column_cache, infer_schema, load_or_infer_schema, load_schema,
+    convert_values, parse_cell
+)
+
+SAMPLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sample_data.csv")
+
+
+def test_streaming_statistics_match_in_memory():
+    data = read_csv_file(SAMPLE_FILE)
+
+    stats, rows_read = calculate_statistics_streaming(iter_csv_rows(SAMPLE_FILE), "salary")
+
+    assert rows_read == len(data)
+    assert stats == calculate_statistics(data, "salary")
+
+
+def test_streaming_statistics_with_filter():
+    data = filter_rows(read_csv_file(SAMPLE_FILE), "department", "engineering")
+    matched = []
+
+    stats, rows_read = calculate_statistics_streaming(
+        iter_csv_rows(SAMPLE_FILE), "age", "department", "engineering", matched.append
+    )
+
+    assert rows_read == 8
+    assert matched == data
+    assert stats == calculate_statistics(data, "age")
+
+
+def test_columnar_loader_matches_row_loader(tmp_path):
+    path = tmp_path / "mixed.csv"
+    path.write_text("a,b,c\n1,x,\n2,y,5\nfoo,x,6\n4,Y,bar\n")
+    rows = read_csv_file(str(path))
+    columns = read_csv_columns(str(path))
+
+    assert list(columns) == rows
+    for column in ("a", "c"):
+        assert calculate_statistics(columns, column) == calculate_statistics(rows, column)
+    for column, value in (("b", "x"), ("b", "y"), ("a", "foo"), ("c", "5")):
+        assert list(filter_rows(columns, column, value)) == filter_rows(rows, column, value)
+
+    # Non-canonical numbers keep their text and the list path's conversions
+    path = tmp_path / "numbers.csv"
+    path.write_text("code,score\n007,1\n7,5.0\n5.0,nan\n1e3,3\n-0, inf\n2.5,1e3\n 8,-1\n")
+    rows = read_csv_file(str(path))
+    columns = read_csv_columns(str(path))
+
+    assert list(columns) == rows
+    schema = {"code": "float", "score": "float"}
+    for column in ("code", "score"):
+        assert calculate_statistics(columns, column) == calculate_statistics(rows, column)
+        assert str(calculate_statistics(columns, column, schema)) == str(calculate_statistics(rows, column, schema))
+    for value in ("7", "007", "5.0", "5", "1e3", "1000", "-0", "0", "nan", "inf", "8", "2.5"):
+        for column in ("code", "score"):
+            assert list(filter_rows(columns, column, value)) == filter_rows(rows, column, value)
+
+    read_csv_columns_cached(str(path))
+    assert list(read_column_cache(str(path))) == rows
+
+
+def test_parallel_partials_merge_to_single_process_result():
+    expected = calculate_statistics(read_csv_file(SAMPLE_FILE), "salary")
+    fieldnames, ranges = split_byte_ranges(SAMPLE_FILE, 3)
+
+    merged = RunningStatistics()
+    total_rows = 0
+    for start, end in ranges:
+        partials, rows_read, _, _, _ = _scan_byte_range(
+            ScanTask(SAMPLE_FILE, fieldnames, start, end, ["salary"])
+        )
+        merged.merge(partials["salary"])
+        total_rows += rows_read
+
+    assert len(ranges) == 3
+    assert total_rows == 8
+    assert merged.to_dict() == expected
+
+
+def test_parallel_ranges_do_not_split_quoted_newlines(tmp_path):
+    path = tmp_path / "multiline.csv"
+    path.write_text("name,notes,amount\n" + "".join(
+        f'r{i},"line one\nline ""two""\n, three",{i}\n' if i % 3 == 0 else f"r{i},plain,{i}\n"
+        for i in range(400)))
+    expected, expected_rows = calculate_statistics_streaming(iter_csv_rows(str(path)), "amount")
+
+    for chunks in (2, 4, 7, 16):
+        fieldnames, ranges = split_byte_ranges(str(path), chunks)
+        merged = RunningStatistics()
+        total_rows = 0
+        for start, end in ranges:
+            partials, rows_read, _, warnings, _ = _scan_byte_range(
+                ScanTask(str(path), fieldnames, start, end, ["amount"])
+            )
+            assert warnings == ""
+            merged.merge(partials["amount"])
+            total_rows += rows_read
+        assert total_rows == expected_rows == 400
+        assert merged.to_dict() == expected
+
+
+def test_mmap_filter_matches_filter_rows(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("name,team\nAnn,hr\nHrishi,Sales\nBob, HR \nCara,\"hr\"\nDan,Ops")
+    rows = read_csv_file(str(path))
+
+    for column, value in (("team", "HR"), ("name", "dan"), ("team", "ops"), ("team", "x")):
+        assert filter_rows_mmap(str(path), column, value) == filter_rows(rows, column, value)
+
+
+def test_mmap_filter_skips_lines_inside_quoted_fields(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text('name,notes,department,salary\n'
+                    'a,"line1\nx,y,HR,999",Sales,100\n'
+                    'b,"HR\n""q"",\nHR",HR,200\n'
+                    'c,plain,HR,300\n')
+    rows = read_csv_file(str(path))
+
+    for value in ("HR", "Sales", "x", "999"):
+        assert filter_rows_mmap(str(path), "department", value) == filter_rows(rows, "department", value)
+    assert [row["name"] for row in filter_rows_mmap(str(path), "department", "HR")] == ["b", "c"]
+    assert [row["name"] for row in filter_rows_mmap(str(path), "notes", "plain")] == ["c"]
+
+
+def test_sidecar_index_lookup_and_invalidation(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text(open(SAMPLE_FILE).read())
+    rows = read_csv_file(str(path))
+
+    assert filter_rows_indexed(str(path), "department", "HR") is None
+
+    build_index(str(path), "department")
+    for value in ("engineering", "HR", "Legal"):
+        assert filter_rows_indexed(str(path), "department", value) == filter_rows(rows, "department", value)
+
+    with open(path, "a") as csvfile:
+        csvfile.write("\nEve Adams,30,61000,HR,4")
+    assert filter_rows_indexed(str(path), "department", "HR") is None
+
+
+def test_sidecar_index_with_many_values_and_quoted_newlines(tmp_path):
+    path = tmp_path / "notes.csv"
+    path.write_text("id,name,notes\n" + "".join(
+        f'{i},n{i % 300},"first\nsecond {i}"\n' if i % 4 == 0 else f"{i},n{i % 300},plain\n"
+        for i in range(1200)))
+    rows = read_csv_file(str(path))
+
+    build_index(str(path), "name")
+    for value in ("n0", "N7", "n299", "missing"):
+        assert filter_rows_indexed(str(path), "name", value) == filter_rows(rows, "name", value)
+
+
+def test_multi_column_extended_statistics_single_pass():
+    stats, rows_read = accumulate_columns(iter_csv_rows(SAMPLE_FILE), ["age", "salary"], extended=True)
+    age = stats["age"].to_dict()
+
+    assert rows_read == 8
+    assert stats["salary"].to_dict()["count"] == 8
+    assert age["avg"] == calculate_statistics(read_csv_file(SAMPLE_FILE), "age")["avg"]
+    assert age["variance"] == 45.14
+    assert age["null_count"] == 0
+    assert (age["p50"], age["p90"], age["p99"]) == (32.0, 45.0, 45.0)
+
+
+def test_quantile_sketch_stays_bounded_and_merges():
+    first, second = QuantileSketch(capacity=64), QuantileSketch(capacity=64)
+    for value in range(50000):
+        (first if value % 2 else second).add(float(value))
+    first.merge(second)
+
+    assert first.count == 50000
+    assert sum(len(level) for level in first.levels) < 64 * len(first.levels)
+    assert abs(first.quantile(0.5) - 25000) < 2500
+    assert abs(first.quantile(0.99) - 49500) < 2500
+
+
+def test_where_predicate_is_applied_while_reading():
+    rows = read_csv_file(SAMPLE_FILE, where="salary > 55000 and department == 'engineering'")
+    assert [row["name"] for row in rows] == ["Bob Johnson", "Frank Miller"]
+
+    rows = read_csv_file(SAMPLE_FILE, where="not (30 <= age < 40) and department in ('HR', 'Marketing')")
+    assert [row["name"] for row in rows] == ["Alice Brown"]
+
+    assert list(iter_csv_rows(SAMPLE_FILE, where="age > 40")) == read_csv_file(SAMPLE_FILE, where="age > 40")
+
+
+def test_where_predicate_rejects_unsafe_or_unknown_expressions():
+    fieldnames = ["name", "age"]
+    for expression in ("__import__('os')", "agee > 3", "age >", "age > name"):
+        with pytest.raises(ValueError):
+            compile_predicate(expression, fieldnames)
+
+
+def test_group_by_single_pass_and_parallel_merge():
+    data = read_csv_file(SAMPLE_FILE)
+    groups, rows_read = accumulate_groups(iter_csv_rows(SAMPLE_FILE), "department", ["salary"])
+
+    assert rows_read == 8
+    assert sorted(groups) == ["Engineering", "HR", "Marketing"]
+    for department, group in groups.items():
+        expected = calculate_statistics(filter_rows(data, "department", department), "salary")
+        assert group["salary"].to_dict() == expected
+
+    fieldnames, ranges = split_byte_ranges(SAMPLE_FILE, 3)
+    merged = {}
+    for start, end in ranges:
+        partial, _, _, _, _ = _scan_byte_range(
+            ScanTask(SAMPLE_FILE, fieldnames, start, end, ["salary"], group_by="department")
+        )
+        merge_groups(merged, partial)
+    assert {key: group["salary"].to_dict() for key, group in merged.items()} == \
+        {key: group["salary"].to_dict() for key, group in groups.items()}
+
+
+def test_column_cache_round_trip_and_invalidation(tmp_path):
+    path = tmp_path / "mixed.csv"
+    path.write_text("a,b,c\n1,x,\n2,y,5\nfoo,x,6\n4,Y,bar\n")
+    expected = list(read_csv_columns(str(path)))
+
+    assert read_column_cache(str(path)) is None
+    assert list(read_csv_columns_cached(str(path))) == expected
+
+    cached = read_column_cache(str(path))
+    assert list(cached) == expected
+    assert list(filter_rows(cached, "b", "X")) == filter_rows(expected, "b", "X")
+    assert calculate_statistics(cached, "c") == calculate_statistics(expected, "c")
+
+    os.utime(path, ns=(0, 0))
+    assert list(read_column_cache(str(path))) == expected
+
+    path.write_text("a,b,c\n1,x,\n2,y,5\nfoo,x,6\n5,Y,bar\n")
+    assert read_column_cache(str(path)) is None
+
+
+def test_schema_plan_is_saved_and_rejects_are_summarized(tmp_path, capsys, monkeypatch):
+    path = tmp_path / "dirty.csv"
+    path.write_text("name,score,team\n" + "".join(
+        f"p{i},{'n/a' if i % 10 == 0 else i / 2},{'ab'[i % 2]}\n" for i in range(40)))
+    rows = read_csv_file(str(path))
+
+    assert infer_schema(str(path)) == {"name": "string", "score": "float", "team": "categorical"}
+    schema = load_or_infer_schema(str(path))
+    assert load_schema(str(path)) == schema
+    capsys.readouterr()
+
+    stats = calculate_statistics(rows, "score", schema)
+    output = capsys.readouterr().out
+    assert output.count("Warning") == 1
+    assert "Skipped 4 non-numeric values" in output
+    assert stats == calculate_statistics(rows, "score")
+    assert calculate_statistics(read_csv_columns(str(path), schema=schema), "score", schema) == stats
+    capsys.readouterr()
+
+    streamed, _ = calculate_statistics_streaming(iter_csv_rows(str(path)), "score", schema=schema)
+    output = capsys.readouterr().out
+    assert output.count("Warning") == 1
+    assert "Skipped 4 non-numeric values" in output
+    assert streamed == stats
+
+    for argv in (["--stream"], ["--workers", "2"], ["--filter", "team", "a"], ["--filter", "team", "a", "--mmap"],
+                 ["-x"], ["-g", "team"]):
+        monkeypatch.setattr(sys, "argv", ["csv_parser.py", str(path), "-c", "score", "--schema"] + argv)
+        main()
+        output = capsys.readouterr().out
+        assert "found in column" not in output
+        assert output.count("Skipped") <= 1
+
+
+def test_schema_plan_drives_parsing_and_warnings(tmp_path, capsys, monkeypatch):
+    values = ['1', ' 2.5', '', 'n/a', '1e3', '?', 'inf', 'abc', '-4', 'n/a', '0x10', '7']
+    for kind in ('int', 'float', 'categorical', 'string'):
+        parsed = [parse_cell(value.strip(), kind) for value in values]
+        assert [number for number in parsed if number is not None] == convert_values(values, kind)[0]
+
+    path = tmp_path / "dirty.csv"
+    path.write_text("name,score\n" + "".join(f"p{i},{values[i % len(values)]}\n" for i in range(2000)))
+    schema = load_or_infer_schema(str(path), 10)
+    assert load_schema(str(path), 10) == schema
+    assert load_schema(str(path), 20) is None
+    capsys.readouterr()
+    load_or_infer_schema(str(path), 20)
+    assert "Schema inferred from the first 20 rows" in capsys.readouterr().out
+    assert load_schema(str(path), 10) is None
+
+    warnings = set()
+    for argv in ([], ["--stream"], ["--workers", "2"], ["--workers", "3", "-x"]):
+        monkeypatch.setattr(sys, "argv", ["csv_parser.py", str(path), "-c", "score", "--schema"] + argv)
+        main()
+        warnings.update(line for line in capsys.readouterr().out.splitlines() if line.startswith("Warning"))
+    assert warnings == {"Warning: Skipped 1000 non-numeric values in column 'score' (167 empty; e.g. 'n/a', '?', 'abc')"}
+
+
+@pytest.mark.parametrize("opener", [gzip.open, bz2.open, lzma.open])
+def test_compressed_files_are_read_without_unpacking(tmp_path, capsys, opener):
+    path = tmp_path / "data.bin"
+    with open(SAMPLE_FILE, "rb") as source, opener(path, "wb") as target:
+        target.write(source.read())
+
+    assert read_csv_file(str(path)) == read_csv_file(SAMPLE_FILE)
+    assert list(iter_csv_rows(str(path), where="age > 30")) == read_csv_file(SAMPLE_FILE, where="age > 30")
+
+    for argv, run in ((["-c", "salary", "-x"], run_profile), (["-c", "all"], run_profile),
+                      (["-c", "salary", "-g", "department"], run_group_by)):
+        outputs = []
+        for filename in (SAMPLE_FILE, str(path)):
+            args = create_argument_parser().parse_args([filename] + argv)
+            run(args, args.column)
+            outputs.append(capsys.readouterr().out.replace(filename, "FILE"))
+        assert outputs[0] == outputs[1]
@@ -0,0 +1,53 @@
+import pytest
+
+from date_dimension import DATE_CACHE_SIZE, DateParts, UNKNOWN_DATE, add_date_columns, date_parts, enrich_dates
+
+
+@pytest.mark.parametrize("date_string, date_format, expected", [
+    ('2024-01-31', '%Y-%m-%d', DateParts(2024, 'January', 1, 'Wednesday', 2024, 5, 1)),
+    ('2024-12-30', '%Y-%m-%d', DateParts(2024, 'December', 12, 'Monday', 2025, 1, 4)),
+    ('2021-01-03', '%Y-%m-%d', DateParts(2021, 'January', 1, 'Sunday', 2020, 53, 1)),
+    ('29/02/2024', '%d/%m/%Y', DateParts(2024, 'February', 2, 'Thursday', 2024, 9, 1)),
+    ('2023-07-01', '%Y-%m-%d', DateParts(2023, 'July', 7, 'Saturday', 2023, 26, 3)),
+])
+def test_date_parts_parses_calendar_attributes(date_string, date_format, expected):
+    assert date_parts(date_string, date_format) == expected
+
+
+@pytest.mark.parametrize("date_string", ['', 'not a date', '2023-02-29', '2024-13-01', '31/01/2024', ' 2024-01-31',
+                                         None, 20240131])
+def test_bad_or_empty_dates_are_unknown(date_string):
+    assert date_parts(date_string) is UNKNOWN_DATE
+
+
+def test_date_parts_parses_each_date_once():
+    date_parts.cache_clear()
+    for _ in range(3):
+        date_parts('2024-03-15')
+        date_parts('15/03/2024', '%d/%m/%Y')
+        date_parts('bad')
+    info = date_parts.cache_info()
+    assert (info.misses, info.hits, info.currsize, info.maxsize) == (3, 6, 3, DATE_CACHE_SIZE)
+    assert date_parts('2024-03-15') == date_parts('15/03/2024', '%d/%m/%Y')
+
+
+def test_enrich_dates_keeps_order_and_looks_up_repeats_locally():
+    dates = ['2024-01-01', 'bad', '2024-01-02', '', '2024-01-01'] * 100
+    date_parts.cache_clear()
+    parts = enrich_dates(dates)
+    assert (date_parts.cache_info().misses, date_parts.cache_info().hits) == (4, 0)
+    assert parts == [date_parts(date_string) for date_string in dates]
+    assert [part.day_of_week for part in parts[:5]] == ['Monday', 'Unknown', 'Tuesday', 'Unknown', 'Monday']
+    assert enrich_dates([]) == []
+
+
+def test_add_date_columns():
+    pandas = pytest.importorskip("pandas")
+    df = pandas.DataFrame({'Date': ['2024-01-31', 'bad', '2024-12-30', '2024-01-31'], 'Sales': [1, 2, 3, 4]})
+
+    assert add_date_columns(df) is df
+    assert df['Month'].tolist() == ['January', 'Unknown', 'December', 'January']
+    assert df['Day_of_Week'].tolist() == ['Wednesday', 'Unknown', 'Monday', 'Wednesday']
+    assert df['ISO_Week'].tolist()[2] == 1
+    assert df['Quarter'].tolist()[2] == 4
+    assert df['ISO_Week'].isna().tolist() == [False, True, False, False]
@@ -0,0 +1,76 @@
+import gc
+import io
+import json
+
+import pytest
+
+import json_codec
+
+DOCUMENTS = [
+    '18446744073709551616',
+    '[-9223372036854775809, 9223372036854775807, 18446744073709551615, -9999999999999999999]',
+    '{"id": 123456789012345678901234567890, "small": 12, "nested": {"list": [1.5, -2e-3, 1E+16]}}',
+    '0.12345678901234567890123',
+    '[1e400, NaN, Infinity, -Infinity]',
+    '{"text": "caf\\u00e9 \\ud83d\\ude00", "raw": "é中", "lone": "\\ud800"}',
+    '[true, false, null, "", [], {}]',
+    '  {"a": {"b": {"c": [0, -0, 0.0, -0.0]}}}  ',
+]
+
+INVALID_DOCUMENTS = ['', '[1, 2', '{"a" 1}', '[1,]', 'nul', '"\\x"']
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "orjson" and json_codec.orjson is None:
+        pytest.skip("orjson is not installed")
+    if request.param == "json":
+        monkeypatch.setattr(json_codec, "orjson", None)
+    return request.param
+
+
+def same(left, right):
+    # NaN != NaN, so compare the stdlib serialization instead
+    return json.dumps(left) == json.dumps(right) and type(left) is type(right)
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_loads_matches_json(backend, document):
+    expected = json.loads(document)
+    assert same(json_codec.loads(document), expected)
+    assert same(json_codec.loads(document.encode('utf-8', 'surrogatepass')), expected)
+    assert same(json_codec.loads(bytearray(document.encode('utf-8', 'surrogatepass'))), expected)
+    assert same(json_codec.load(io.StringIO(document)), expected)
+
+
+@pytest.mark.parametrize("document", INVALID_DOCUMENTS)
+def test_loads_raises_json_errors(backend, document):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(document)
+    with pytest.raises(json_codec.JSONDecodeError) as error:
+        json_codec.loads(document)
+    assert (error.value.msg, error.value.pos) == (expected.value.msg, expected.value.pos)
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_dumps_matches_json(backend, document):
+    value = json.loads(document)
+    for options in ({}, {'indent': 2}, {'indent': 4}, {'indent': 2, 'sort_keys': True},
+                    {'indent': 2, 'ensure_ascii': False}):
+        assert json_codec.dumps(value, **options) == json.dumps(value, **options)
+        output = io.StringIO()
+        json_codec.dump(value, output, **options)
+        assert output.getvalue() == json.dumps(value, **options)
+
+
+def test_gc_is_only_paused_for_large_documents(backend, monkeypatch):
+    pauses = []
+    monkeypatch.setattr(gc, "disable", lambda: pauses.append(True))
+    for line in ['{"id": %d, "name": "user"}' % index for index in range(100)]:
+        json_codec.loads(line)
+    assert pauses == []
+
+    document = json.dumps([{"id": index, "values": [index] * 10} for index in range(json_codec.GC_PAUSE_SIZE // 50)])
+    assert json_codec.loads(document) == json.loads(document)
+    assert pauses == [True]
+    assert gc.isenabled()
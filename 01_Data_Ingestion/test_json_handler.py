@@ -0,0 +1,273 @@
+import io
+import json
+import pickle
+import threading
+import time
+from collections import Counter
+from multiprocessing.pool import ThreadPool
+
+import pytest
+
+import json_handler
+from json_handler import (JSONProcessor, JSONFileError, JSONValidationError, JSONStructureError, JSONStream,
+                          RECORD_ERROR_EXAMPLES, compile_schema, _compile_schema, iter_json_array, iter_jsonl)
+
+USER_SCHEMA = {
+    'required_fields': ['id', 'name', 'email'],
+    'field_types': {'id': int, 'name': str, 'score': (int, float), 'active': bool},
+    'fields': {'address': {'required_fields': ['city'], 'field_types': {'zip': str}}},
+    'items': {'orders': {'required_fields': ['sku'], 'field_types': {'quantity': int}}}
+}
+
+
+@pytest.mark.parametrize("data", [
+    {'id': 1, 'name': 'Ann', 'email': 'ann@example.com'},
+    {'name': 7, 'score': 'high', 'active': 1},
+    {'id': 1, 'name': 'Ann', 'email': 'a', 'address': {'zip': 12345}, 'orders': [{'sku': 'x'}, {'quantity': 1.5}]},
+    {'id': 1, 'name': 'Ann', 'email': 'a', 'address': [], 'orders': {}},
+])
+def test_compiled_schema_reports_the_same_violations(data, capsys):
+    violations = compile_schema(USER_SCHEMA)(data, 'user.json')
+    try:
+        JSONProcessor()._validate_schema(data, USER_SCHEMA, 'user.json')
+    except JSONValidationError as e:
+        assert str(e) == '; '.join(violations)
+    else:
+        assert violations == []
+    capsys.readouterr()
+
+
+def test_schema_cache_is_keyed_by_contents():
+    validator = compile_schema(USER_SCHEMA)
+    size = _compile_schema.cache_info().currsize
+
+    for _ in range(1000):
+        assert compile_schema(pickle.loads(pickle.dumps(USER_SCHEMA))) is validator
+    assert _compile_schema.cache_info().currsize == size
+
+    changed = dict(USER_SCHEMA, required_fields=['id'])
+    assert compile_schema(changed) is not validator
+    assert compile_schema(changed)({'id': 1}, 'user.json') == []
+    assert _compile_schema.cache_info().currsize <= _compile_schema.cache_info().maxsize
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_many_matches_sequential_loading(tmp_path, capsys, executor):
+    paths = []
+    for index in range(40):
+        path = tmp_path / f"user{index}.json"
+        if index % 7 == 3:
+            path.write_text('{"id": 1, "name": ')
+        else:
+            user = {'id': index, 'name': f"user{index}", 'email': f"u{index}@example.com"}
+            if index % 5 == 4:
+                del user['email']
+            path.write_text(json.dumps(user))
+        paths.append(str(path))
+    paths.append(str(tmp_path / "missing.json"))
+
+    sequential = JSONProcessor()
+    expected = []
+    for path in paths:
+        try:
+            expected.append((path, sequential.load_json_with_validation(path, USER_SCHEMA), False))
+        except JSONFileError:
+            expected.append((path, None, True))
+
+    processor = JSONProcessor()
+    results = [(path, data, error is not None)
+               for path, data, error in processor.load_many(paths, USER_SCHEMA, workers=3, executor=executor)]
+    assert results == expected
+    assert processor.get_processing_summary(False) == sequential.get_processing_summary(False)
+
+    unordered = processor.load_many(paths, USER_SCHEMA, workers=3, executor=executor, ordered=False)
+    assert sorted((path, error is not None) for path, _, error in unordered) == \
+        sorted((path, failed) for path, _, failed in expected)
+    capsys.readouterr()
+
+
+def test_ledger_keeps_recent_entries_and_full_counts(tmp_path):
+    spill_log = tmp_path / "ledger.jsonl"
+    with JSONProcessor(history_size=5, spill_log=str(spill_log)) as processor:
+        for index in range(12):
+            if index % 3:
+                processor._log_success(f"file{index}.json", records=index)
+            else:
+                processor._log_error(f"file{index}.json", 'validation_error' if index % 2 else 'file_not_found',
+                                     f"problem {index}")
+
+        summary = processor.get_processing_summary()
+        assert summary['total_processed'] == 12
+        assert summary['successful'] == 8
+        assert summary['failed'] == 4
+        assert summary['error_types'] == {'file_not_found': 2, 'validation_error': 2}
+        assert [entry['filename'] for entry in summary['details']] == [f"file{index}.json" for index in range(7, 12)]
+        assert processor.processed_files == summary['details']
+    assert processor.ledger._spill_file is None
+
+    spilled = [json.loads(line) for line in spill_log.read_text().splitlines()]
+    assert [entry['filename'] for entry in spilled] == [f"file{index}.json" for index in range(12)]
+    assert spilled[-5:] == summary['details']
+    assert spilled[1]['records'] == 1
+    assert spilled[3] == dict(spilled[3], status='error', error_type='validation_error', message='problem 3')
+    assert 'error_type' not in spilled[1]
+
+
+def write_jsonl(path, count, bad_every):
+    lines = []
+    for index in range(count):
+        if index % bad_every == 1:
+            lines.append('{"id": %d, "name": ' % index)
+        elif index % bad_every == 2:
+            lines.append(json.dumps({'id': index, 'name': f"user{index}"}))
+        elif index % bad_every == 3:
+            lines.append('')
+        else:
+            lines.append(json.dumps({'id': index, 'name': f"user{index}", 'email': f"u{index}@example.com",
+                                     'score': index / 4}))
+    path.write_text('\n'.join(lines) + '\n')
+
+
+def test_iter_jsonl_parallel_matches_serial_and_isolates_errors(tmp_path):
+    path = tmp_path / "users.jsonl"
+    write_jsonl(path, 500, 9)
+
+    serial = list(iter_jsonl(str(path), USER_SCHEMA))
+    assert list(iter_jsonl(str(path), USER_SCHEMA, workers=3, chunk_size=1000)) == serial
+
+    data = path.read_bytes()
+    for line_number, offset, record, error in serial:
+        line = data[offset:data.index(b'\n', offset)]
+        assert data[:offset].count(b'\n') == line_number - 1
+        assert (record is None) == (error is not None)
+        if record is not None:
+            assert record == json.loads(line)
+    errors = Counter(error[0] for _, _, _, error in serial if error)
+    assert errors == {'json_decode_error': 56, 'validation_error': 56}
+    assert len(serial) == 500 - 56
+
+
+def test_jsonl_bad_lines_are_counted_per_file(tmp_path, capsys):
+    path = tmp_path / "users.jsonl"
+    write_jsonl(path, 500, 9)
+
+    with JSONProcessor() as processor:
+        records = list(processor.iter_jsonl_with_validation(str(path), USER_SCHEMA, workers=2, chunk_size=4096))
+        summary = processor.get_processing_summary()
+    assert len(records) == 500 - 56 - 112
+    assert (summary['total_processed'], summary['successful'], summary['failed']) == (1, 1, 0)
+    assert summary['invalid_records'] == 112
+    assert summary['record_error_types'] == {'json_decode_error': 56, 'validation_error': 56}
+    entry, = summary['details']
+    assert entry['invalid_records'] == 112
+    assert len(entry['record_error_examples']) == RECORD_ERROR_EXAMPLES
+    assert entry['record_error_examples'][0].startswith("Line 2 (byte offset ")
+
+    array = tmp_path / "users.json"
+    array.write_text(json.dumps({'users': [json.loads(line) for line in path.read_text().splitlines()
+                                           if line and line.endswith('}')]}))
+    with JSONProcessor() as processor:
+        assert len(list(processor.iter_json_with_validation(str(array), USER_SCHEMA, ('users',)))) == len(records)
+        summary = processor.get_processing_summary()
+    assert (summary['total_processed'], summary['failed'], summary['invalid_records']) == (1, 0, 56)
+    capsys.readouterr()
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_unreadable_files_are_logged_as_failed(tmp_path, capsys, workers):
+    (tmp_path / "bad.json").write_bytes(b'{"users": [{"id": 1, "name": "caf\xe9"}]}')
+    (tmp_path / "bad.jsonl").write_bytes(b'{"id": 1, "name": "caf\xe9", "email": "x"}\n'
+                                         b'{"id": 2, "name": "b", "email": "y"}\n')
+
+    with JSONProcessor() as processor:
+        with pytest.raises(JSONFileError, match="Could not read"):
+            list(processor.iter_jsonl_with_validation(str(tmp_path), USER_SCHEMA, workers=workers))
+        with pytest.raises(JSONFileError, match="Could not read"):
+            list(processor.iter_json_with_validation(str(tmp_path), USER_SCHEMA, ('users',)))
+        with pytest.raises(JSONFileError, match="Could not decode"):
+            list(processor.iter_json_with_validation(str(tmp_path / "bad.json"), USER_SCHEMA, ('users',)))
+        records = list(processor.iter_jsonl_with_validation(str(tmp_path / "bad.jsonl"), USER_SCHEMA,
+                                                            workers=workers))
+        summary = processor.get_processing_summary()
+
+    assert [record['id'] for record in records] == [2]
+    assert (summary['total_processed'], summary['successful'], summary['failed']) == (4, 1, 3)
+    assert summary['error_types'] == {'file_error': 2, 'encoding_error': 1}
+    assert summary['record_error_types'] == {'json_decode_error': 1}
+    capsys.readouterr()
+
+
+def test_parallel_jsonl_limits_chunks_in_flight(tmp_path, monkeypatch):
+    path = tmp_path / "users.jsonl"
+    write_jsonl(path, 2000, 9)
+    started = []
+    lock = threading.Lock()
+
+    def parse_chunk(task):
+        with lock:
+            started.append(task[1])
+        return _parse_jsonl_chunk(task)
+
+    _parse_jsonl_chunk = json_handler._parse_jsonl_chunk
+    monkeypatch.setattr(json_handler, "Pool", ThreadPool)
+    monkeypatch.setattr(json_handler, "_parse_jsonl_chunk", parse_chunk)
+
+    chunks = len(json_handler.jsonl_chunks(str(path), 1000))
+    limit = json_handler.JSONL_CHUNKS_PER_WORKER * 2
+    records = iter_jsonl(str(path), USER_SCHEMA, workers=2, chunk_size=1000)
+    next(records)
+    time.sleep(0.2)
+    assert len(started) <= limit + 1 < chunks
+
+    assert len(list(records)) + 1 == len(list(iter_jsonl(str(path), USER_SCHEMA)))
+    assert len(started) == chunks
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+def test_json_stream_reads_values_across_chunk_boundaries(chunk_size):
+    document = {
+        'meta': {'skip': [1, {'a': '[not] {a} "container"'}, 'esc\\"aped ] }'], 'n': -12.5e3},
+        'departments': [
+            {'name': 'R&D', 'employees': [{'id': 1, 'tags': ['x', 'y']}, {'id': 22, 'tags': []}]},
+            {'name': 'Ops', 'employees': [{'id': 333, 'salary': 123456789012, 'note': "é\n"}]}
+        ],
+        'numbers': [0, 1.5, -2e-3, 123456789, True, None, "tail"]
+    }
+    text = json.dumps(document, indent=2)
+
+    def elements(path):
+        return list(iter_json_array(io.StringIO(text), path, chunk_size))
+
+    assert elements(('numbers',)) == document['numbers']
+    assert elements(('departments', 1, 'employees')) == document['departments'][1]['employees']
+    assert elements(('departments',)) == document['departments']
+    assert list(iter_json_array(io.StringIO(' [ ] '), (), chunk_size)) == []
+
+    stream = JSONStream(io.StringIO(text), chunk_size)
+    stream.enter(('meta',))
+    stream.expect('{')
+    assert stream.read_value() == 'skip'
+    stream.expect(':')
+    stream.skip_value()
+    stream.expect(',')
+    assert stream.read_value() == 'n'
+    stream.expect(':')
+    assert stream.read_value() == -12.5e3
+
+    with pytest.raises(JSONStructureError):
+        elements(('missing',))
+    with pytest.raises(JSONStructureError):
+        elements(('meta',))
+    with pytest.raises(json.JSONDecodeError) as error:
+        list(iter_json_array(io.StringIO('[1, 2, {"a": }]'), (), chunk_size))
+    assert error.value.pos == 13
+
+
+def test_json_stream_fails_on_a_bad_element_without_reading_to_the_end():
+    text = '[{"id": 1}, {"id": }, ' + ', '.join('{"id": %d, "name": "user%d"}' % (i, i) for i in range(20000)) + ']'
+    source = io.StringIO(text)
+
+    with pytest.raises(json.JSONDecodeError) as error:
+        list(iter_json_array(source, (), 4096))
+    assert error.value.pos == 19
+    assert source.tell() <= 2 * 4096 < len(text)
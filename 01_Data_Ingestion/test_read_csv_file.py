@@ -0,0 +1,83 @@
+import gzip
+from array import array
+
+import pytest
+
+from read_csv_file import SALES_COLUMNS, SalesBatch, read_sales_batch, read_sales_data
+
+HEADER = "Date,Product,Category,Quantity,Price,Sales_Rep\n"
+
+
+def sales_rows(start, stop):
+    return "".join(f"2024-01-{i % 28 + 1:02d},P{i % 3},C{i % 2},{i % 5 + 1},{i * 1.25},R{i % 4}\n"
+                   for i in range(start, stop))
+
+
+def column_lengths(batch):
+    return {len(getattr(batch, name)) for name in
+            ('date', 'product', 'category', 'quantity', 'price', 'total', 'sales_rep')}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100_000])
+def test_batch_matches_verbose_records(tmp_path, capsys, chunk_size):
+    path = tmp_path / "sales.csv"
+    path.write_text(HEADER + sales_rows(0, 50) + "\n" + sales_rows(50, 60))
+    expected = read_sales_data(str(path))
+
+    batch = read_sales_batch(str(path), chunk_size, report_every=20)
+    assert len(batch) == 60
+    assert column_lengths(batch) == {60}
+    assert (batch.quantity.typecode, batch.price.typecode, batch.total.typecode) == ('q', 'd', 'd')
+    assert all(type(value) is str for value in batch.date + batch.product + batch.category + batch.sales_rep)
+    assert list(batch.records()) == expected
+    assert [parts.day_of_week for parts in batch.date_dimension()[:2]] == ['Monday', 'Tuesday']
+    assert "Total records processed: 60 (" in capsys.readouterr().out
+
+
+def test_batch_reads_reordered_and_compressed_columns(tmp_path, capsys):
+    path = tmp_path / "sales.csv.gz"
+    with gzip.open(path, "wt") as sales_file:
+        sales_file.write("Sales_Rep,Extra,Price,Quantity,Category,Product,Date\nR1,x,2.5,3,C1,P1,2024-02-01\n")
+
+    batch = read_sales_batch(str(path))
+    assert list(batch.records()) == [{'date': '2024-02-01', 'product': 'P1', 'category': 'C1', 'quantity': 3,
+                                      'price': 2.5, 'total': 7.5, 'sales_rep': 'R1'}]
+    capsys.readouterr()
+
+
+def test_bad_numeric_cell_keeps_columns_aligned():
+    batch = SalesBatch()
+    batch.extend([row.split(',') for row in sales_rows(0, 10).splitlines()])
+    for bad_row in (['2024-01-01', 'P1', 'C1', 'many', '2.5', 'R1'], ['2024-01-01', 'P1', 'C1', '2', '', 'R1'],
+                    ['2024-01-01', 'P1', 'C1', '2.5', '1', 'R1']):
+        with pytest.raises(ValueError):
+            batch.extend([['2024-01-02', 'P2', 'C2', '1', '1.0', 'R2'], bad_row])
+    assert column_lengths(batch) == {10}
+    assert batch.quantity == array('q', [i % 5 + 1 for i in range(10)])
+
+
+def test_bad_numeric_cell_is_reported(tmp_path, capsys):
+    path = tmp_path / "sales.csv"
+    path.write_text(HEADER + sales_rows(0, 10) + "2024-01-01,P1,C1,many,2.5,R1\n")
+
+    with pytest.raises(ValueError):
+        read_sales_batch(str(path))
+    batch = read_sales_data(str(path), verbose=False)
+    assert len(batch) == 0 and column_lengths(batch) == {0}
+    assert "Error reading CSV file: invalid literal for int()" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("text", ["", HEADER, HEADER + "\n\n"])
+def test_empty_file_gives_empty_batch(tmp_path, capsys, text):
+    path = tmp_path / "sales.csv"
+    path.write_text(text)
+
+    batch = read_sales_data(str(path), verbose=False)
+    assert isinstance(batch, SalesBatch)
+    assert len(batch) == 0 and column_lengths(batch) == {0}
+    assert list(batch.records()) == [] and batch.date_dimension() == []
+    assert "Total records processed: 0" in capsys.readouterr().out
+
+    assert len(read_sales_data(str(tmp_path / "missing.csv"), verbose=False)) == 0
+    assert "not found" in capsys.readouterr().out
+    assert SALES_COLUMNS == HEADER.strip().split(',')
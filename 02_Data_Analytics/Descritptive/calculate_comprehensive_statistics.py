@@ -1,83 +1,429 @@
 #!/usr/bin/env python3
+import argparse
 import csv
+import functools
+import glob
+import hashlib
+import json
+import multiprocessing
+import os
 from collections import defaultdict
 
-def calculate_sales_statistics(filename):
+from heavy_hitters import HeavyHitters
+from ingestion import date_parts
+
+WINDOW_PERIODS = ('day', 'week', 'month')
+
+@functools.lru_cache(maxsize=8192)
+def window_labels(date):
     """
-    Calculate comprehensive statistics from sales data
+    Get the tumbling day, ISO week and month window a date string falls into
+    
+    Returns:
+        dict: Window label per period, e.g. {'day': '2024-01-31',
+            'week': '2024-W05', 'month': '2024-01'}; 'Unknown' for invalid dates
+    """
+    parts = date_parts(date)
+    if parts.year is None:
+        return dict.fromkeys(WINDOW_PERIODS, 'Unknown')
+    return {
+        'day': date,
+        'week': f"{parts.iso_year}-W{parts.iso_week:02d}",
+        'month': f"{parts.year}-{parts.month_number:02d}"
+    }
+
+class SalesAggregator:
     """
-    sales_data = []
+    Sales statistics updated one sale at a time in a single pass
     
-    # Read the CSV file
-    try:
-        with open(filename, 'r', newline='') as csvfile:
-            csv_reader = csv.DictReader(csvfile)
-            
-            for row in csv_reader:
-                quantity = int(row['Quantity'])
-                price = float(row['Price'])
-                total = quantity * price
-                
-                sale_record = {
-                    'date': row['Date'],
-                    'product': row['Product'],
-                    'category': row['Category'],
-                    'quantity': quantity,
-                    'price': price,
-                    'total': total,
-                    'sales_rep': row['Sales_Rep']
-                }
-                sales_data.append(sale_record)
-                
-    except FileNotFoundError:
-        print(f"Error: File '{filename}' not found.")
-        return None
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return None
+    Rows, column batches or whole files can be fed in any number of steps,
+    and the running state can be saved to a checkpoint file so that a new
+    day's file only adds its own sales on top of the stored totals. Files
+    are recorded with the number of bytes read, so rows appended to a
+    checkpointed file are added on the next run as well.
     
-    # Calculate statistics
-    if not sales_data:
-        print("No data to process.")
-        return None
+    With windows (any of WINDOW_PERIODS) the same pass also rolls sales,
+    quantity and transactions up per day, week or month, in total and per
+    rep and product. Rollup cells are keyed by (window, dimension, name).
+    """
+    
+    def __init__(self, windows=()):
+        self.total_records = 0
+        self.total_sales = 0.0
+        self.total_quantity = 0
+        self.sales_by_rep = defaultdict(float)
+        self.quantity_by_rep = defaultdict(int)
+        self.sales_by_product = defaultdict(float)
+        self.quantity_by_product = defaultdict(int)
+        self.transactions_by_rep = defaultdict(int)
+        self.transactions_by_product = defaultdict(int)
+        self.processed_files = {}
+        self.windows = tuple(windows)
+        self.rollups = {period: {} for period in self.windows}
+    
+    def add_sale(self, product, sales_rep, quantity, total, date=None):
+        """
+        Add a single sale to every statistic
+        """
+        self.total_records += 1
+        self.total_sales += total
+        self.total_quantity += quantity
+        self.sales_by_rep[sales_rep] += total
+        self.quantity_by_rep[sales_rep] += quantity
+        self.sales_by_product[product] += total
+        self.quantity_by_product[product] += quantity
+        self.transactions_by_rep[sales_rep] += 1
+        self.transactions_by_product[product] += 1
+        if self.windows:
+            self._add_to_windows(date, product, sales_rep, quantity, total)
+    
+    def _add_to_windows(self, date, product, sales_rep, quantity, total):
+        """
+        Add a single sale to the rollup cells of its windows
+        """
+        labels = window_labels(date)
+        for period in self.windows:
+            table = self.rollups[period]
+            label = labels[period]
+            for key in ((label, 'total', ''), (label, 'rep', sales_rep), (label, 'product', product)):
+                cell = table.get(key)
+                if cell is None:
+                    cell = table[key] = [0.0, 0, 0]
+                cell[0] += total
+                cell[1] += quantity
+                cell[2] += 1
     
-    # Basic statistics
-    total_sales = sum(record['total'] for record in sales_data)
-    total_quantity = sum(record['quantity'] for record in sales_data)
-    average_sale = total_sales / len(sales_data)
+    def add_row(self, row):
+        """
+        Add a sale given as a CSV row dictionary (Date, Product, Sales_Rep, Quantity, Price)
+        """
+        quantity = int(row['Quantity'])
+        self.add_sale(row['Product'], row['Sales_Rep'], quantity, quantity * float(row['Price']),
+                      row.get('Date'))
     
-    # Sales by representative
-    sales_by_rep = defaultdict(float)
-    quantity_by_rep = defaultdict(int)
+    def add_rows(self, rows):
+        """
+        Add every sale of an iterable of CSV row dictionaries
+        """
+        for row in rows:
+            self.add_row(row)
     
-    # Sales by product
-    sales_by_product = defaultdict(float)
-    quantity_by_product = defaultdict(int)
+    def add_batch(self, batch):
+        """
+        Add the sales of a column batch such as read_csv_file.SalesBatch
+        """
+        for sale in zip(batch.product, batch.sales_rep, batch.quantity, batch.total, batch.date):
+            self.add_sale(*sale)
     
-    # Process data for detailed statistics
-    for record in sales_data:
-        rep = record['sales_rep']
-        product = record['product']
+    def _resume_point(self, filename, binary_file):
+        """
+        Check the checkpointed part of an open file and find where new rows start
         
-        sales_by_rep[rep] += record['total']
-        quantity_by_rep[rep] += record['quantity']
+        Returns:
+            tuple: (byte offset, digest of the bytes before it), or None if
+                the file is unchanged since it was checkpointed
         
-        sales_by_product[product] += record['total']
-        quantity_by_product[product] += record['quantity']
-    
-    # Create statistics summary
-    statistics = {
-        'total_records': len(sales_data),
-        'total_sales': total_sales,
-        'total_quantity': total_quantity,
-        'average_sale': average_sale,
-        'sales_by_rep': dict(sales_by_rep),
-        'quantity_by_rep': dict(quantity_by_rep),
-        'sales_by_product': dict(sales_by_product),
-        'quantity_by_product': dict(quantity_by_product)
-    }
+        Raises:
+            ValueError: If the file shrank or its checkpointed part changed
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        entry = self.processed_files.get(os.path.abspath(filename))
+        if entry is None:
+            return 0, digest
+        
+        status = os.fstat(binary_file.fileno())
+        if status.st_size == entry['size'] and status.st_mtime_ns == entry.get('mtime_ns'):
+            return None
+        if status.st_size < entry['size']:
+            raise ValueError(f"'{filename}' is shorter than when it was checkpointed")
+        
+        remaining = entry['size']
+        while remaining > 0:
+            block = binary_file.read(min(remaining, 1 << 20))
+            digest.update(block)
+            remaining -= len(block)
+        if entry.get('digest', digest.hexdigest()) != digest.hexdigest():
+            raise ValueError(f"'{filename}' changed since it was checkpointed")
+        
+        return (entry['size'], digest) if status.st_size > entry['size'] else None
+    
+    def is_processed(self, filename):
+        """
+        Check whether all rows of a file are already included in the totals
+        """
+        with open(filename, 'rb') as binary_file:
+            return self._resume_point(filename, binary_file) is None
+    
+    def add_file(self, filename):
+        """
+        Add the sales of a CSV file that the checkpoint does not contain yet
+        
+        A file that grew since it was checkpointed only has its new rows
+        added; one that shrank or was rewritten raises ValueError, because
+        its earlier rows are already in the totals.
+        
+        Returns:
+            int: Number of sales added (0 if the file was already processed)
+        """
+        records_before = self.total_records
+        with open(filename, 'rb') as binary_file:
+            resume = self._resume_point(filename, binary_file)
+            if resume is None:
+                print(f"Skipping '{filename}': already included in the checkpoint.")
+                return 0
+            position, digest = resume
+            
+            binary_file.seek(0)
+            header_line = binary_file.readline()
+            header = next(csv.reader([header_line.decode('utf-8')]))
+            if position:
+                print(f"Resuming '{filename}' after the {position} bytes in the checkpoint.")
+                binary_file.seek(position)
+            else:
+                digest.update(header_line)
+                position = len(header_line)
+            
+            def lines():
+                nonlocal position
+                for line in binary_file:
+                    digest.update(line)
+                    position += len(line)
+                    yield line.decode('utf-8')
+            
+            product, sales_rep, quantity, price = (header.index(column) for column in
+                                                  ('Product', 'Sales_Rep', 'Quantity', 'Price'))
+            date = header.index('Date') if 'Date' in header else None
+            for row in csv.reader(lines()):
+                if row:
+                    sale_quantity = int(row[quantity])
+                    self.add_sale(row[product], row[sales_rep], sale_quantity,
+                                  sale_quantity * float(row[price]),
+                                  row[date] if date is not None else None)
+            
+            self.processed_files[os.path.abspath(filename)] = {
+                'size': position,
+                'mtime_ns': os.fstat(binary_file.fileno()).st_mtime_ns,
+                'digest': digest.hexdigest()
+            }
+        return self.total_records - records_before
+    
+    def merge(self, other):
+        """
+        Add the state of another aggregator, e.g. one built from another file
+        """
+        self.total_records += other.total_records
+        self.total_sales += other.total_sales
+        self.total_quantity += other.total_quantity
+        for target, source in ((self.sales_by_rep, other.sales_by_rep),
+                               (self.quantity_by_rep, other.quantity_by_rep),
+                               (self.sales_by_product, other.sales_by_product),
+                               (self.quantity_by_product, other.quantity_by_product),
+                               (self.transactions_by_rep, other.transactions_by_rep),
+                               (self.transactions_by_product, other.transactions_by_product)):
+            for key, value in source.items():
+                target[key] += value
+        for period, table in other.rollups.items():
+            own_table = self.rollups.setdefault(period, {})
+            for key, (sales, quantity, transactions) in table.items():
+                cell = own_table.setdefault(key, [0.0, 0, 0])
+                cell[0] += sales
+                cell[1] += quantity
+                cell[2] += transactions
+        self.processed_files.update(other.processed_files)
+    
+    def statistics(self):
+        """
+        Get the current statistics in the format of calculate_sales_statistics
+        """
+        return {
+            'total_records': self.total_records,
+            'total_sales': self.total_sales,
+            'total_quantity': self.total_quantity,
+            'average_sale': self.total_sales / self.total_records if self.total_records else 0.0,
+            'sales_by_rep': dict(self.sales_by_rep),
+            'quantity_by_rep': dict(self.quantity_by_rep),
+            'sales_by_product': dict(self.sales_by_product),
+            'quantity_by_product': dict(self.quantity_by_product),
+            'transactions_by_rep': dict(self.transactions_by_rep),
+            'transactions_by_product': dict(self.transactions_by_product)
+        }
+    
+    def save_checkpoint(self, path):
+        """
+        Write the aggregator state to a JSON checkpoint file
+        
+        The file is written under a temporary name and then renamed, so an
+        interrupted run never leaves a half-written checkpoint behind.
+        """
+        state = self.statistics()
+        del state['average_sale']
+        state['processed_files'] = self.processed_files
+        state['windows'] = list(self.windows)
+        state['rollups'] = {period: [list(key) + cell for key, cell in table.items()]
+                            for period, table in self.rollups.items()}
+        
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as checkpoint_file:
+            json.dump(state, checkpoint_file, indent=2)
+        os.replace(temp_path, path)
+    
+    @classmethod
+    def load_checkpoint(cls, path):
+        """
+        Create an aggregator from a checkpoint written by save_checkpoint
+        """
+        with open(path, 'r') as checkpoint_file:
+            state = json.load(checkpoint_file)
+        
+        aggregator = cls(state.get('windows', ()))
+        aggregator.total_records = state['total_records']
+        aggregator.total_sales = state['total_sales']
+        aggregator.total_quantity = state['total_quantity']
+        aggregator.sales_by_rep.update(state['sales_by_rep'])
+        aggregator.quantity_by_rep.update(state['quantity_by_rep'])
+        aggregator.sales_by_product.update(state['sales_by_product'])
+        aggregator.quantity_by_product.update(state['quantity_by_product'])
+        aggregator.transactions_by_rep.update(state.get('transactions_by_rep', {}))
+        aggregator.transactions_by_product.update(state.get('transactions_by_product', {}))
+        # Checkpoints written before byte offsets were tracked store only the size
+        aggregator.processed_files = {path: entry if isinstance(entry, dict) else {'size': entry}
+                                      for path, entry in state['processed_files'].items()}
+        for period, cells in state.get('rollups', {}).items():
+            aggregator.rollups[period] = {tuple(cell[:3]): cell[3:] for cell in cells}
+        return aggregator
+    
+    def rollup_rows(self):
+        """
+        Get the rollups as a compact time series, one row per window and name
+        
+        Returns:
+            list: Dictionaries with Period, Window, Dimension, Name, Sales,
+                Quantity and Transactions, sorted by period, window and name
+        """
+        rows = []
+        for period in self.windows:
+            for (window, dimension, name), (sales, quantity, transactions) in sorted(self.rollups[period].items()):
+                rows.append({
+                    'Period': period,
+                    'Window': window,
+                    'Dimension': dimension,
+                    'Name': name,
+                    'Sales': round(sales, 2),
+                    'Quantity': quantity,
+                    'Transactions': transactions
+                })
+        return rows
+
+class TopSalesAggregator(SalesAggregator):
+    """
+    SalesAggregator reporting only the top-K reps and products, in bounded memory
+    
+    Sales, quantity and transactions per rep and per product are kept in
+    HeavyHitters trackers: exact while there are few distinct names, and
+    Space-Saving / Count-Min sketches with error bounds once there are more
+    than exact_limit of them.
+    """
+    
+    def __init__(self, top_k=10, capacity=1000, exact_limit=10000):
+        super().__init__()
+        self.top_k = top_k
+        self.trackers = {(dimension, metric): HeavyHitters(max(capacity, 10 * top_k), exact_limit)
+                         for dimension in ('rep', 'product')
+                         for metric in ('sales', 'quantity', 'transactions')}
+    
+    def add_sale(self, product, sales_rep, quantity, total, date=None):
+        """
+        Add a single sale to the totals and to every tracker
+        """
+        self.total_records += 1
+        self.total_sales += total
+        self.total_quantity += quantity
+        for dimension, name in (('rep', sales_rep), ('product', product)):
+            self.trackers[dimension, 'sales'].add(name, total)
+            self.trackers[dimension, 'quantity'].add(name, quantity)
+            self.trackers[dimension, 'transactions'].add(name, 1)
+    
+    def merge(self, other):
+        """
+        Add the state of another TopSalesAggregator with the same parameters
+        """
+        self.total_records += other.total_records
+        self.total_sales += other.total_sales
+        self.total_quantity += other.total_quantity
+        for key, tracker in self.trackers.items():
+            tracker.merge(other.trackers[key])
+        self.processed_files.update(other.processed_files)
+    
+    def statistics(self):
+        """
+        Get the totals and the top-K lists as (name, value, error bound) tuples
+        """
+        statistics = {
+            'total_records': self.total_records,
+            'total_sales': self.total_sales,
+            'total_quantity': self.total_quantity,
+            'average_sale': self.total_sales / self.total_records if self.total_records else 0.0,
+            'exact': all(tracker.is_exact for tracker in self.trackers.values())
+        }
+        for (dimension, metric), tracker in self.trackers.items():
+            statistics[f'top_{metric}_by_{dimension}'] = tracker.top(self.top_k)
+        return statistics
+    
+    def save_checkpoint(self, path):
+        raise ValueError("Checkpoints are not supported in top-K mode")
+
+def find_sales_files(path):
+    """
+    Expand a sales file, a directory of CSV files or a glob pattern into file names
+    """
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, '*.csv')))
+    if glob.has_magic(path):
+        return sorted(glob.glob(path))
+    return [path]
+
+def aggregate_sales_file(filename, factory=SalesAggregator, processed_files=None):
+    """
+    Aggregate one sales file into a partial result (runs inside a worker process)
     
-    # Display statistics
+    When processed_files (see SalesAggregator.processed_files) has an entry
+    for the file, only the rows appended after it are aggregated.
+    """
+    aggregator = factory()
+    path = os.path.abspath(filename)
+    if processed_files and path in processed_files:
+        aggregator.processed_files[path] = processed_files[path]
+    aggregator.add_file(filename)
+    return aggregator
+
+def aggregate_sales_files(filenames, workers=None, factory=SalesAggregator, processed_files=None):
+    """
+    Aggregate many sales files in a process pool and merge the partial results
+    
+    Every worker streams one file at a time into its own aggregator (created
+    by factory), so no worker holds more than one file's running totals.
+    Partials are merged in file order, which keeps the result independent of
+    scheduling. Files with an entry in processed_files resume after it.
+    """
+    total = factory()
+    if processed_files:
+        paths = {os.path.abspath(filename) for filename in filenames}
+        processed_files = {path: entry for path, entry in processed_files.items() if path in paths}
+    if len(filenames) <= 1 or workers == 1:
+        for filename in filenames:
+            total.merge(aggregate_sales_file(filename, factory, processed_files))
+        return total
+    
+    with multiprocessing.Pool(workers) as pool:
+        for partial in pool.imap(functools.partial(aggregate_sales_file, factory=factory,
+                                                   processed_files=processed_files), filenames):
+            total.merge(partial)
+    return total
+
+def display_sales_statistics(statistics):
+    """
+    Print a sales statistics summary
+    """
     print("SALES STATISTICS SUMMARY")
     print("=" * 50)
     print(f"Total Records: {statistics['total_records']}")
@@ -96,12 +442,130 @@ def calculate_sales_statistics(filename):
     for product, sales in statistics['sales_by_product'].items():
         quantity = statistics['quantity_by_product'][product]
         print(f"{product}: ${sales:,.2f} ({quantity} units)")
+
+def write_rollups(aggregator, filename):
+    """
+    Write the time-windowed rollups of an aggregator to a CSV file
+    """
+    with open(filename, 'w', newline='') as csvfile:
+        csv_writer = csv.DictWriter(csvfile, fieldnames=['Period', 'Window', 'Dimension', 'Name',
+                                                         'Sales', 'Quantity', 'Transactions'])
+        csv_writer.writeheader()
+        csv_writer.writerows(aggregator.rollup_rows())
+
+def display_top_sales_statistics(statistics):
+    """
+    Print the summary of a top-K run, with error bounds for estimated values
+    """
+    print("SALES STATISTICS SUMMARY (TOP SELLERS)")
+    print("=" * 50)
+    print(f"Total Records: {statistics['total_records']}")
+    print(f"Total Sales: ${statistics['total_sales']:,.2f}")
+    print(f"Total Quantity Sold: {statistics['total_quantity']:,}")
+    print(f"Average Sale Amount: ${statistics['average_sale']:.2f}")
+    if not statistics['exact']:
+        print("Per-name values are estimates; a value in parentheses is its maximum over-count.")
+    
+    for dimension, title, unit in (('rep', 'REPRESENTATIVES', 'items'), ('product', 'PRODUCTS', 'units')):
+        print(f"\nTOP {title} BY SALES:")
+        print("-" * 30)
+        for name, sales, error in statistics[f'top_sales_by_{dimension}']:
+            bound = f" (-${error:,.2f})" if error else ""
+            print(f"{name}: ${sales:,.2f}{bound}")
+        
+        print(f"\nTOP {title} BY QUANTITY:")
+        print("-" * 30)
+        for name, quantity, error in statistics[f'top_quantity_by_{dimension}']:
+            bound = f" (-{error:,.0f})" if error else ""
+            print(f"{name}: {quantity:,.0f} {unit}{bound}")
+
+def calculate_sales_statistics(filename, checkpoint=None, workers=None, top_k=None,
+                               windows=(), rollup_output="sales_rollups.csv"):
+    """
+    Calculate comprehensive statistics from sales data
+    
+    Every sale is read once and added to a SalesAggregator. With a checkpoint
+    the totals stored by earlier runs are loaded first and the updated state
+    is saved again, so only the new file's sales are processed.
+    
+    The filename may also be a directory or a glob pattern; the files are
+    then aggregated in parallel (see aggregate_sales_files).
+    
+    With top_k only the top-K reps and products are reported, using bounded
+    memory however many distinct names there are (see TopSalesAggregator).
+    
+    With windows the daily, weekly and/or monthly rollups are computed in the
+    same pass and written to rollup_output as a time-series table.
+    """
+    if top_k and (checkpoint or windows):
+        print("Error: Checkpoints and windows cannot be combined with top-K mode.")
+        return None
+    factory = (functools.partial(TopSalesAggregator, top_k) if top_k
+               else functools.partial(SalesAggregator, windows))
+    
+    try:
+        if checkpoint and os.path.exists(checkpoint):
+            aggregator = SalesAggregator.load_checkpoint(checkpoint)
+            print(f"Loaded checkpoint '{checkpoint}' ({aggregator.total_records} records)")
+            if aggregator.windows != tuple(windows):
+                print(f"Error: Checkpoint '{checkpoint}' was created with windows "
+                      f"{list(aggregator.windows)}, not {list(windows)}.")
+                return None
+        else:
+            aggregator = factory()
+        
+        filenames = find_sales_files(filename)
+        if len(filenames) == 1:
+            aggregator.add_file(filenames[0])
+        else:
+            pending = [name for name in filenames if not aggregator.is_processed(name)]
+            print(f"Aggregating {len(pending)} of {len(filenames)} files matching '{filename}'")
+            aggregator.merge(aggregate_sales_files(pending, workers, factory, aggregator.processed_files))
+    
+    except FileNotFoundError as e:
+        print(f"Error: File '{e.filename or filename}' not found.")
+        return None
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return None
+    
+    # Calculate statistics
+    if not aggregator.total_records:
+        print("No data to process.")
+        return None
+    
+    if checkpoint:
+        aggregator.save_checkpoint(checkpoint)
+        print(f"Checkpoint saved to '{checkpoint}'")
+    
+    if windows:
+        write_rollups(aggregator, rollup_output)
+        print(f"Rollups ({', '.join(windows)}) written to '{rollup_output}'")
+    
+    statistics = aggregator.statistics()
+    if top_k:
+        display_top_sales_statistics(statistics)
+    else:
+        display_sales_statistics(statistics)
     
     return statistics
 
 def main():
-    filename = "sales_data.csv"
-    statistics = calculate_sales_statistics(filename)
+    parser = argparse.ArgumentParser(description="Calculate sales statistics")
+    parser.add_argument('filename', nargs='?', default="sales_data.csv",
+                        help='Sales CSV file, directory of CSV files or glob pattern')
+    parser.add_argument('--checkpoint', help='JSON file holding the totals of earlier runs')
+    parser.add_argument('--workers', '-w', type=int, help='Worker processes for many files (default: CPU count)')
+    parser.add_argument('--top', type=int, metavar='K',
+                        help='Only report the top K reps and products, in bounded memory')
+    parser.add_argument('--windows', nargs='+', choices=WINDOW_PERIODS, default=[],
+                        help='Also roll sales up per day, week and/or month')
+    parser.add_argument('--rollup-output', default="sales_rollups.csv",
+                        help='CSV file for the --windows rollups (default: sales_rollups.csv)')
+    args = parser.parse_args()
+    
+    statistics = calculate_sales_statistics(args.filename, args.checkpoint, args.workers, args.top,
+                                            args.windows, args.rollup_output)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 import csv
+import functools
+import os
 from collections import defaultdict
-from datetime import datetime
 
-def process_sales_and_create_summary(input_filename, output_filename):
+from calculate_comprehensive_statistics import (SalesAggregator, TopSalesAggregator,
+                                               aggregate_sales_files, find_sales_files)
+from ingestion import date_parts
+
+# Output buffer of the report files, so rows are written in large blocks
+WRITE_BUFFER_SIZE = 1 << 20
+
+def process_sales_and_create_summary(input_filename, output_filename, workers=None, top_k=None):
     """
     Process sales data and create summary CSV report
+    
+    The input may also be a directory or a glob pattern, in which case the
+    files are aggregated in parallel (see create_summary_from_files). With
+    top_k only the top-K reps and products by sales are reported.
     """
+    filenames = find_sales_files(input_filename)
+    if top_k or len(filenames) != 1 or filenames[0] != input_filename:
+        return create_summary_from_files(filenames, output_filename, workers, top_k)
+    
     sales_data = []
     
     # Read input CSV file
@@ -99,6 +115,40 @@ def process_sales_and_create_summary(input_filename, output_filename):
         print(f"Error writing summary file: {e}")
         return False
 
+def create_summary_from_files(filenames, output_filename, workers=None, top_k=None):
+    """
+    Create the summary CSV report of many sales files with a process pool
+    
+    Each file is reduced to a mergeable partial in a worker, the partials
+    are merged, and the merged totals are written like a single-file summary.
+    With top_k the partials are TopSalesAggregators, which keep memory
+    bounded however many reps and products there are.
+    """
+    if not filenames:
+        print("No data to process.")
+        return False
+    
+    try:
+        factory = functools.partial(TopSalesAggregator, top_k) if top_k else SalesAggregator
+        aggregator = aggregate_sales_files(filenames, workers, factory)
+    except FileNotFoundError as e:
+        print(f"Error: Input file '{e.filename}' not found.")
+        return False
+    except Exception as e:
+        print(f"Error reading input file: {e}")
+        return False
+    
+    if not aggregator.total_records:
+        print("No data to process.")
+        return False
+    
+    try:
+        SummarySink.from_aggregator(aggregator, output_filename).close()
+        return True
+    except Exception as e:
+        print(f"Error writing summary file: {e}")
+        return False
+
 def create_detailed_report(input_filename, detailed_output_filename):
     """
     Create a detailed report with enhanced sales data
@@ -121,14 +171,8 @@ def create_detailed_report(input_filename, detailed_output_filename):
                 price = float(row['Price'])
                 total_amount = quantity * price
                 
-                # Parse date for additional information
-                try:
-                    date_obj = datetime.strptime(row['Date'], '%Y-%m-%d')
-                    month = date_obj.strftime('%B')
-                    day_of_week = date_obj.strftime('%A')
-                except:
-                    month = 'Unknown'
-                    day_of_week = 'Unknown'
+                # Look up the (cached) calendar attributes of the date
+                parts = date_parts(row['Date'])
                 
                 # Write enhanced record
                 csv_writer.writerow({
@@ -139,8 +183,8 @@ def create_detailed_report(input_filename, detailed_output_filename):
                     'Price': price,
                     'Total_Amount': round(total_amount, 2),
                     'Sales_Rep': row['Sales_Rep'],
-                    'Month': month,
-                    'Day_of_Week': day_of_week
+                    'Month': parts.month,
+                    'Day_of_Week': parts.day_of_week
                 })
         
         print(f"Detailed report successfully written to '{detailed_output_filename}'")
@@ -161,19 +205,240 @@ def display_summary_file(filename):
         with open(filename, 'r', newline='') as csvfile:
             csv_reader = csv.DictReader(csvfile)
             
-            # Print header
-            print(f"{'Type':<12} {'Name':<15} {'Total Sales':<12} {'Quantity':<10} {'Transactions':<12} {'Avg Sale':<10}")
-            print("-" * 80)
-            
-            for row in csv_reader:
-                print(f"{row['Type']:<12} {row['Name']:<15} ${float(row['Total_Sales']):<11.2f} "
-                      f"{row['Total_Quantity']:<10} {row['Num_Transactions']:<12} ${float(row['Avg_Sale_Amount']):<9.2f}")
-        
-        print("-" * 80)
+            print_summary_rows(csv_reader)
         
     except Exception as e:
         print(f"Error displaying summary file: {e}")
 
+def print_summary_rows(rows):
+    """
+    Print summary rows (as written to the summary CSV file) as a table
+    """
+    # Print header
+    print(f"{'Type':<12} {'Name':<15} {'Total Sales':<12} {'Quantity':<10} {'Transactions':<12} {'Avg Sale':<10}")
+    print("-" * 80)
+    
+    for row in rows:
+        print(f"{row['Type']:<12} {row['Name']:<15} ${float(row['Total_Sales']):<11.2f} "
+              f"{row['Total_Quantity']:<10} {row['Num_Transactions']:<12} ${float(row['Avg_Sale_Amount']):<9.2f}")
+    
+    print("-" * 80)
+
+def read_sales_records(input_filename):
+    """
+    Parse the sales CSV file once, yielding one record dictionary per sale
+    """
+    with open(input_filename, 'r', newline='') as csvfile:
+        for row in csv.DictReader(csvfile):
+            quantity = int(row['Quantity'])
+            price = float(row['Price'])
+            yield {
+                'date': row['Date'],
+                'product': row['Product'],
+                'category': row['Category'],
+                'quantity': quantity,
+                'price': price,
+                'total': quantity * price,
+                'sales_rep': row['Sales_Rep']
+            }
+
+class SummarySink:
+    """
+    Report sink aggregating sales per representative and per product
+    
+    When closed it writes the same summary CSV as
+    process_sales_and_create_summary and keeps the rows for other sinks.
+    """
+    
+    fieldnames = ['Type', 'Name', 'Total_Sales', 'Total_Quantity', 'Num_Transactions', 'Avg_Sale_Amount']
+    
+    def __init__(self, output_filename):
+        self.output_filename = output_filename
+        self.sales_by_rep = defaultdict(lambda: {'total_sales': 0, 'total_quantity': 0, 'num_transactions': 0})
+        self.sales_by_product = defaultdict(lambda: {'total_sales': 0, 'total_quantity': 0, 'num_transactions': 0})
+        self.rows = []
+        self.written = False
+    
+    @classmethod
+    def from_aggregator(cls, aggregator, output_filename):
+        """
+        Create a summary sink holding the totals of a SalesAggregator
+        
+        For a TopSalesAggregator only the top-K names by sales are included,
+        with an extra Sales_Error_Bound column for estimated values.
+        """
+        sink = cls(output_filename)
+        if isinstance(aggregator, TopSalesAggregator):
+            sink.fieldnames = cls.fieldnames + ['Sales_Error_Bound']
+            for groups, dimension in ((sink.sales_by_rep, 'rep'), (sink.sales_by_product, 'product')):
+                for name, total_sales, error in aggregator.trackers[dimension, 'sales'].top(aggregator.top_k):
+                    groups[name] = {
+                        'total_sales': total_sales,
+                        'total_quantity': round(aggregator.trackers[dimension, 'quantity'].estimate(name)[0]),
+                        'num_transactions': round(aggregator.trackers[dimension, 'transactions'].estimate(name)[0]),
+                        'sales_error_bound': error
+                    }
+            return sink
+        
+        for groups, sales, quantity, transactions in (
+                (sink.sales_by_rep, aggregator.sales_by_rep, aggregator.quantity_by_rep,
+                 aggregator.transactions_by_rep),
+                (sink.sales_by_product, aggregator.sales_by_product, aggregator.quantity_by_product,
+                 aggregator.transactions_by_product)):
+            for name, total_sales in sales.items():
+                groups[name] = {'total_sales': total_sales, 'total_quantity': quantity[name],
+                                'num_transactions': transactions[name]}
+        return sink
+    
+    def add(self, record):
+        for stats in (self.sales_by_rep[record['sales_rep']], self.sales_by_product[record['product']]):
+            stats['total_sales'] += record['total']
+            stats['total_quantity'] += record['quantity']
+            stats['num_transactions'] += 1
+    
+    def close(self):
+        for row_type, groups in (('Sales_Rep', self.sales_by_rep), ('Product', self.sales_by_product)):
+            for name, stats in groups.items():
+                avg_sale = stats['total_sales'] / stats['num_transactions'] if stats['num_transactions'] > 0 else 0
+                self.rows.append({
+                    'Type': row_type,
+                    'Name': name,
+                    'Total_Sales': round(stats['total_sales'], 2),
+                    'Total_Quantity': stats['total_quantity'],
+                    'Num_Transactions': stats['num_transactions'],
+                    'Avg_Sale_Amount': round(avg_sale, 2)
+                })
+                if 'sales_error_bound' in stats:
+                    self.rows[-1]['Sales_Error_Bound'] = round(stats['sales_error_bound'], 2)
+        
+        self.written = True
+        with open(self.output_filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE) as csvfile:
+            csv_writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
+            csv_writer.writeheader()
+            csv_writer.writerows(self.rows)
+        print(f"Summary report successfully written to '{self.output_filename}'")
+    
+    def abort(self):
+        if self.written:
+            remove_report(self.output_filename)
+
+class DetailedReportSink:
+    """
+    Report sink writing every sale with its total, month and day of week
+    
+    The file is opened with the first record, rows go through a large write
+    buffer, and dates are looked up in the date dimension cache.
+    """
+    
+    fieldnames = ['Date', 'Product', 'Category', 'Quantity', 'Price',
+                  'Total_Amount', 'Sales_Rep', 'Month', 'Day_of_Week']
+    
+    def __init__(self, output_filename):
+        self.output_filename = output_filename
+        self.output_file = None
+        self.csv_writer = None
+    
+    def add(self, record):
+        if self.output_file is None:
+            self.output_file = open(self.output_filename, 'w', newline='', buffering=WRITE_BUFFER_SIZE)
+            self.csv_writer = csv.writer(self.output_file)
+            self.csv_writer.writerow(self.fieldnames)
+        
+        parts = date_parts(record['date'])
+        self.csv_writer.writerow((record['date'], record['product'], record['category'], record['quantity'],
+                                  record['price'], round(record['total'], 2), record['sales_rep'],
+                                  parts.month, parts.day_of_week))
+    
+    def close(self):
+        self.output_file.close()
+        print(f"Detailed report successfully written to '{self.output_filename}'")
+    
+    def abort(self):
+        if self.output_file is not None:
+            self.output_file.close()
+            remove_report(self.output_filename)
+
+class ConsoleSummarySink:
+    """
+    Report sink printing the summary table of a SummarySink
+    
+    The table is printed from the rows kept in memory, so the summary file
+    is not read back. It has to be closed after the SummarySink.
+    """
+    
+    def __init__(self, summary_sink):
+        self.summary_sink = summary_sink
+    
+    def add(self, record):
+        pass
+    
+    def close(self):
+        print(f"\nContents of '{self.summary_sink.output_filename}':")
+        print("=" * 80)
+        print_summary_rows(self.summary_sink.rows)
+    
+    def abort(self):
+        pass
+
+def remove_report(filename):
+    """
+    Delete a report that was only partly written, if it exists
+    """
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+
+def run_report_pipeline(input_filename, sinks):
+    """
+    Read the sales file once and hand every parsed record to each sink
+    
+    Sinks have an add(record) method called for every sale and a close()
+    method called, in order, after the last one. If reading or closing
+    fails, abort() is called on every sink instead, which closes its files
+    and deletes what it wrote, so no partial reports are left behind.
+    """
+    completed = False
+    try:
+        try:
+            records = 0
+            for record in read_sales_records(input_filename):
+                for sink in sinks:
+                    sink.add(record)
+                records += 1
+        except FileNotFoundError:
+            print(f"Error: Input file '{input_filename}' not found.")
+            return False
+        except Exception as e:
+            print(f"Error reading input file: {e}")
+            return False
+        
+        if not records:
+            print("No data to process.")
+            return False
+        
+        try:
+            for sink in sinks:
+                sink.close()
+        except Exception as e:
+            print(f"Error writing reports: {e}")
+            return False
+        
+        completed = True
+        return True
+    finally:
+        if not completed:
+            for sink in sinks:
+                sink.abort()
+
+def create_all_reports(input_filename, summary_filename, detailed_filename):
+    """
+    Create the summary and detailed reports and print the summary in one read
+    """
+    summary_sink = SummarySink(summary_filename)
+    sinks = [summary_sink, DetailedReportSink(detailed_filename), ConsoleSummarySink(summary_sink)]
+    return run_report_pipeline(input_filename, sinks)
+
 def main():
     input_file = "sales_data.csv"
     summary_file = "sales_summary.csv"
@@ -182,12 +447,8 @@ def main():
     print("Processing sales data and creating reports...")
     print("=" * 50)
     
-    # Create summary report
-    if process_sales_and_create_summary(input_file, summary_file):
-        display_summary_file(summary_file)
-    
-    # Create detailed report
-    if create_detailed_report(input_file, detailed_file):
+    # Create both reports from a single read of the input file
+    if create_all_reports(input_file, summary_file, detailed_file):
         print(f"\nBoth summary and detailed reports have been created successfully!")
         print(f"Summary report: {summary_file}")
         print(f"Detailed report: {detailed_file}")
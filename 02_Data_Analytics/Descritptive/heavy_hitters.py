@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Heavy hitters - Bounded-memory top-K tracking for high-cardinality keys
+
+SpaceSaving keeps a fixed number of candidate keys with over-estimated
+weights, CountMinSketch estimates the weight of any key in a fixed-size
+table, and HeavyHitters combines them: it counts exactly while there are few
+distinct keys and switches to the sketches once there are too many.
+"""
+
+import hashlib
+import heapq
+import math
+from array import array
+
+class SpaceSaving:
+    """
+    Weighted Space-Saving summary of the heaviest keys of a stream
+    
+    At most `capacity` keys are monitored. A new key replaces the lightest
+    one and inherits its weight as error, so every reported weight is an
+    over-estimate by at most its error. Keys may be of any hashable type:
+    heap entries of equal weight are ordered by insertion, never by key.
+    """
+    
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.heap = []
+        self.pushes = 0
+    
+    def add(self, key, weight=1):
+        counts = self.counts
+        if key in counts:
+            counts[key] += weight
+        elif len(counts) < self.capacity:
+            counts[key] = weight
+            self.errors[key] = 0
+            self._push(weight, key)
+        else:
+            minimum, evicted = self._pop_min()
+            del counts[evicted], self.errors[evicted]
+            counts[key] = minimum + weight
+            self.errors[key] = minimum
+            self._push(minimum + weight, key)
+    
+    def _push(self, weight, key):
+        heapq.heappush(self.heap, (weight, self.pushes, key))
+        self.pushes += 1
+    
+    def _pop_min(self):
+        """
+        Remove and return the lightest monitored key
+        
+        Heap entries are not updated when a key gets heavier, so outdated
+        entries are pushed back with their current weight when they surface.
+        """
+        while True:
+            weight, _, key = heapq.heappop(self.heap)
+            if self.counts[key] == weight:
+                return weight, key
+            self._push(self.counts[key], key)
+    
+    def min_count(self):
+        """
+        Get the weight a key that is not monitored can have at most
+        """
+        if len(self.counts) < self.capacity:
+            return 0
+        weight, key = self._pop_min()
+        self._push(weight, key)
+        return weight
+    
+    def merge(self, other):
+        """
+        Merge another summary with the same capacity into this one
+        """
+        own_min, other_min = self.min_count(), other.min_count()
+        merged = {}
+        for key in self.counts.keys() | other.counts.keys():
+            merged[key] = (self.counts.get(key, own_min) + other.counts.get(key, other_min),
+                           self.errors.get(key, own_min) + other.errors.get(key, other_min))
+        
+        kept = heapq.nlargest(self.capacity, merged.items(), key=lambda item: item[1][0])
+        self.counts = {key: count for key, (count, _) in kept}
+        self.errors = {key: error for key, (_, error) in kept}
+        self.heap = [(count, order, key) for order, (key, count) in enumerate(self.counts.items())]
+        self.pushes = len(self.heap)
+        heapq.heapify(self.heap)
+    
+    def top(self, k):
+        """
+        Get the k heaviest keys as (key, weight, error) tuples
+        """
+        return [(key, count, self.errors[key])
+                for key, count in heapq.nlargest(k, self.counts.items(), key=lambda item: item[1])]
+
+class CountMinSketch:
+    """
+    Count-Min sketch estimating the total weight of any key
+    
+    Estimates never under-count; with probability 1 - e^-depth they exceed
+    the true weight by at most e / width times the total weight added.
+    """
+    
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = array('d', bytes(8 * width * depth))
+        self.total = 0.0
+    
+    def _cells(self, key):
+        digest = hashlib.blake2b(str(key).encode('utf-8'), digest_size=4 * self.depth).digest()
+        return [row * self.width + int.from_bytes(digest[4 * row:4 * row + 4], 'little') % self.width
+                for row in range(self.depth)]
+    
+    def add(self, key, weight=1):
+        table = self.table
+        for cell in self._cells(key):
+            table[cell] += weight
+        self.total += weight
+    
+    def estimate(self, key):
+        table = self.table
+        return min(table[cell] for cell in self._cells(key))
+    
+    def error_bound(self):
+        return math.e / self.width * self.total
+    
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Cannot merge Count-Min sketches of different sizes")
+        for cell, value in enumerate(other.table):
+            self.table[cell] += value
+        self.total += other.total
+
+class HeavyHitters:
+    """
+    Weight per key, exact for few keys and bounded in memory for many
+    
+    Weights are kept in a plain dict until more than `exact_limit` distinct
+    keys have been seen. From then on SpaceSaving tracks the top candidates
+    and CountMinSketch estimates weights, so memory no longer grows with the
+    number of keys.
+    """
+    
+    def __init__(self, capacity=1000, exact_limit=10000, width=2048, depth=4):
+        self.capacity = capacity
+        self.exact_limit = exact_limit
+        self.width = width
+        self.depth = depth
+        self.exact = {}
+        self.candidates = None
+        self.sketch = None
+    
+    @property
+    def is_exact(self):
+        return self.candidates is None
+    
+    def add(self, key, weight=1):
+        if self.candidates is None:
+            self.exact[key] = self.exact.get(key, 0) + weight
+            if len(self.exact) > self.exact_limit:
+                self._switch_to_sketches()
+        else:
+            self.candidates.add(key, weight)
+            self.sketch.add(key, weight)
+    
+    def _switch_to_sketches(self):
+        """
+        Move the exact weights into a SpaceSaving summary and a Count-Min sketch
+        
+        Only the heaviest keys become candidates, with no error: every other
+        key weighs at most the lightest of them, as SpaceSaving requires.
+        """
+        self.candidates = SpaceSaving(self.capacity)
+        self.sketch = CountMinSketch(self.width, self.depth)
+        for key, weight in heapq.nlargest(self.capacity, self.exact.items(), key=lambda item: item[1]):
+            self.candidates.add(key, weight)
+        for key, weight in self.exact.items():
+            self.sketch.add(key, weight)
+        self.exact = {}
+    
+    def estimate(self, key):
+        """
+        Get the estimated weight of a key and its maximum over-estimate
+        
+        Returns:
+            tuple: (weight, error bound); the bound is 0 in exact mode
+        """
+        if self.candidates is None:
+            return self.exact.get(key, 0), 0
+        
+        weight, error = self.sketch.estimate(key), self.sketch.error_bound()
+        if key in self.candidates.counts and self.candidates.counts[key] <= weight:
+            weight, error = self.candidates.counts[key], min(error, self.candidates.errors[key])
+        return weight, error
+    
+    def top(self, k):
+        """
+        Get the k heaviest keys as (key, weight, error bound) tuples
+        """
+        if self.candidates is None:
+            return [(key, weight, 0) for key, weight in
+                    heapq.nlargest(k, self.exact.items(), key=lambda item: item[1])]
+        
+        entries = [(key,) + self.estimate(key) for key, _, _ in self.candidates.top(k)]
+        return sorted(entries, key=lambda entry: entry[1], reverse=True)
+    
+    def merge(self, other):
+        """
+        Merge the weights of another HeavyHitters with the same parameters
+        """
+        if self.candidates is None and other.candidates is None:
+            for key, weight in other.exact.items():
+                self.exact[key] = self.exact.get(key, 0) + weight
+            if len(self.exact) > self.exact_limit:
+                self._switch_to_sketches()
+            return
+        
+        if self.candidates is None:
+            self._switch_to_sketches()
+        if other.candidates is None:
+            for key, weight in other.exact.items():
+                self.add(key, weight)
+        else:
+            self.candidates.merge(other.candidates)
+            self.sketch.merge(other.sketch)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Ingestion - Shared helpers of 01_Data_Ingestion for the analytics scripts
+
+The scripts here run as plain scripts rather than as a package, so the
+ingestion directory is put on the import path in this one place, located
+from this file rather than from the working directory. Scripts import the
+helpers they need from this module.
+"""
+
+import os
+import sys
+
+INGESTION_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                              '..', '..', '01_Data_Ingestion'))
+if INGESTION_DIR not in sys.path:
+    sys.path.append(INGESTION_DIR)
+
+from date_dimension import DateParts, date_parts, enrich_dates
+
+__all__ = ['INGESTION_DIR', 'DateParts', 'date_parts', 'enrich_dates']
@@ -0,0 +1,135 @@
+import functools
+
+import pytest
+
+from calculate_comprehensive_statistics import (SalesAggregator, TopSalesAggregator, aggregate_sales_files,
+                                                calculate_sales_statistics)
+
+HEADER = "Date,Product,Sales_Rep,Quantity,Price\n"
+
+
+def sales_rows(start, stop):
+    return "".join(f"2024-01-{i % 28 + 1:02d},P{i % 3},R{i % 4},{i % 5 + 1},{i * 1.5}\n"
+                   for i in range(start, stop))
+
+
+def aggregate(text, tmp_path):
+    path = tmp_path / "expected.csv"
+    path.write_text(text)
+    aggregator = SalesAggregator(("day", "month"))
+    aggregator.add_file(str(path))
+    return aggregator
+
+
+def test_checkpoint_round_trip(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text(HEADER + sales_rows(0, 50))
+    aggregator = SalesAggregator(("day", "month"))
+    assert aggregator.add_file(str(path)) == 50
+
+    aggregator.save_checkpoint(str(tmp_path / "checkpoint.json"))
+    loaded = SalesAggregator.load_checkpoint(str(tmp_path / "checkpoint.json"))
+    assert loaded.statistics() == aggregator.statistics()
+    assert loaded.rollup_rows() == aggregator.rollup_rows()
+    assert loaded.processed_files == aggregator.processed_files
+    assert loaded.is_processed(str(path))
+    assert loaded.add_file(str(path)) == 0
+
+
+def test_resume_adds_only_appended_rows(tmp_path, capsys):
+    path = tmp_path / "sales.csv"
+    checkpoint = str(tmp_path / "checkpoint.json")
+    path.write_text(HEADER + sales_rows(0, 50))
+    assert calculate_sales_statistics(str(path), checkpoint)["total_records"] == 50
+
+    with open(path, "a") as sales_file:
+        sales_file.write(sales_rows(50, 100))
+    assert calculate_sales_statistics(str(path), checkpoint)["total_records"] == 100
+    assert calculate_sales_statistics(str(path), checkpoint)["total_records"] == 100
+
+    expected = aggregate(HEADER + sales_rows(0, 100), tmp_path)
+    resumed = SalesAggregator.load_checkpoint(checkpoint)
+    assert resumed.statistics() == expected.statistics()
+
+    # Directories go through aggregate_sales_files, which must resume the same way
+    directory = tmp_path / "daily"
+    directory.mkdir()
+    (directory / "a.csv").write_text(HEADER + sales_rows(0, 30))
+    (directory / "b.csv").write_text(HEADER + sales_rows(30, 60))
+    calculate_sales_statistics(str(directory), checkpoint, workers=2)
+    with open(directory / "b.csv", "a") as sales_file:
+        sales_file.write(sales_rows(60, 70))
+    assert calculate_sales_statistics(str(directory), checkpoint, workers=2)["total_records"] == 170
+    capsys.readouterr()
+
+
+def test_shrunk_or_rewritten_file_is_rejected(tmp_path):
+    path = tmp_path / "sales.csv"
+    path.write_text(HEADER + sales_rows(0, 50))
+    aggregator = SalesAggregator()
+    aggregator.add_file(str(path))
+
+    path.write_text(HEADER + sales_rows(0, 40))
+    with pytest.raises(ValueError, match="shorter"):
+        aggregator.add_file(str(path))
+
+    path.write_text(HEADER + sales_rows(1, 60))
+    with pytest.raises(ValueError, match="changed"):
+        aggregator.add_file(str(path))
+    assert aggregator.total_records == 50
+
+
+def test_merge_matches_single_pass(tmp_path):
+    paths = []
+    for index, (start, stop) in enumerate(((0, 40), (40, 90), (90, 100))):
+        paths.append(tmp_path / f"part{index}.csv")
+        paths[-1].write_text(HEADER + sales_rows(start, stop))
+
+    merged = SalesAggregator(("day", "month"))
+    for path in paths:
+        part = SalesAggregator(("day", "month"))
+        part.add_file(str(path))
+        merged.merge(part)
+
+    expected = aggregate(HEADER + sales_rows(0, 100), tmp_path)
+    assert merged.statistics().keys() == expected.statistics().keys()
+    for key, value in expected.statistics().items():
+        assert merged.statistics()[key] == pytest.approx(value)
+    assert merged.rollup_rows() == expected.rollup_rows()
+    assert set(merged.processed_files) == {str(path) for path in paths}
+
+    parallel = aggregate_sales_files([str(path) for path in paths], workers=2)
+    assert parallel.total_records == 100
+    assert parallel.sales_by_rep == pytest.approx(expected.sales_by_rep)
+
+
+def skewed_rows(start, stop):
+    # Every other sale goes to one of three heavy reps, the rest to a rep of its own
+    return "".join(f"2024-01-{i % 28 + 1:02d},P{i % 3},{f'R{i % 3}' if i % 2 else f'X{i}'},{i % 5 + 1},{i % 7 + 1.5}\n"
+                   for i in range(start, stop))
+
+
+def test_top_sales_bound_the_exact_totals(tmp_path):
+    paths = []
+    for index, (start, stop) in enumerate(((0, 300), (300, 600))):
+        paths.append(str(tmp_path / f"part{index}.csv"))
+        (tmp_path / f"part{index}.csv").write_text(HEADER + skewed_rows(start, stop))
+    expected = aggregate(HEADER + skewed_rows(0, 600), tmp_path)
+
+    factory = functools.partial(TopSalesAggregator, 3, 30, 50)
+    for aggregator in (aggregate_sales_files(paths, 1, factory), aggregate_sales_files(paths, 2, factory)):
+        statistics = aggregator.statistics()
+        assert statistics['total_records'] == 600
+        assert statistics['total_sales'] == pytest.approx(expected.total_sales)
+        assert not statistics['exact']
+        assert not aggregator.trackers['rep', 'sales'].is_exact
+        assert aggregator.trackers['product', 'sales'].is_exact
+
+        top = statistics['top_sales_by_rep']
+        assert [name for name, _, _ in top] == sorted(expected.sales_by_rep, key=expected.sales_by_rep.get,
+                                                      reverse=True)[:3]
+        for name, total, error in top:
+            assert expected.sales_by_rep[name] <= total + 1e-9
+            assert total - error <= expected.sales_by_rep[name] + 1e-9
+        for name, total, error in statistics['top_transactions_by_product']:
+            assert (total, error) == (expected.transactions_by_product[name], 0)
@@ -0,0 +1,81 @@
+import csv
+
+import pytest
+
+from calculate_comprehensive_statistics import SalesAggregator, TopSalesAggregator
+from create_summary_report import (process_sales_and_create_summary, create_detailed_report, create_all_reports,
+                                   run_report_pipeline, SummarySink, DetailedReportSink)
+
+HEADER = "Date,Product,Category,Quantity,Price,Sales_Rep\n"
+
+
+def sales_rows(start, stop):
+    return "".join(f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d},P{i % 3},C{i % 2},{i % 5 + 1},{i * 1.25},R{i % 4}\n"
+                   for i in range(start, stop))
+
+
+def test_pipeline_matches_separate_reports(tmp_path, capsys):
+    sales = tmp_path / "sales.csv"
+    sales.write_text(HEADER + sales_rows(0, 200))
+
+    assert process_sales_and_create_summary(str(sales), str(tmp_path / "summary.csv"))
+    assert create_detailed_report(str(sales), str(tmp_path / "detailed.csv"))
+    assert create_all_reports(str(sales), str(tmp_path / "summary_pipeline.csv"),
+                              str(tmp_path / "detailed_pipeline.csv"))
+
+    assert (tmp_path / "summary_pipeline.csv").read_text() == (tmp_path / "summary.csv").read_text()
+    assert (tmp_path / "detailed_pipeline.csv").read_text() == (tmp_path / "detailed.csv").read_text()
+    assert "Contents of" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("bad_row", ["2024-01-01,P1,C1,many,2.5,R1\n", "2024-01-01,P1,C1,1\n"])
+def test_pipeline_error_leaves_no_partial_reports(tmp_path, capsys, bad_row):
+    sales = tmp_path / "sales.csv"
+    sales.write_text(HEADER + sales_rows(0, 100) + bad_row + sales_rows(100, 120))
+    summary_sink = SummarySink(str(tmp_path / "summary.csv"))
+    detailed_sink = DetailedReportSink(str(tmp_path / "detailed.csv"))
+
+    assert not run_report_pipeline(str(sales), [summary_sink, detailed_sink])
+    assert "Error reading input file" in capsys.readouterr().out
+    assert detailed_sink.output_file.closed
+    assert list(tmp_path.iterdir()) == [sales]
+
+
+def test_pipeline_close_error_removes_written_reports(tmp_path, capsys):
+    sales = tmp_path / "sales.csv"
+    sales.write_text(HEADER + sales_rows(0, 50))
+    sinks = [SummarySink(str(tmp_path / "summary.csv")), DetailedReportSink(str(tmp_path / "detailed.csv")),
+             SummarySink(str(tmp_path / "missing" / "summary.csv"))]
+
+    assert not run_report_pipeline(str(sales), sinks)
+    output = capsys.readouterr().out
+    assert "Summary report successfully written" in output
+    assert "Error writing reports" in output
+    assert list(tmp_path.iterdir()) == [sales]
+
+
+def test_top_k_summary_reports_error_bounds(tmp_path, capsys):
+    exact, top = SalesAggregator(), TopSalesAggregator(top_k=2, capacity=20, exact_limit=40)
+    for i in range(400):
+        sale = (f"P{i % 3}", f"R{i % 3}" if i % 2 else f"X{i}", i % 5 + 1, (i % 5 + 1) * 2.5)
+        exact.add_sale(*sale)
+        top.add_sale(*sale)
+
+    SummarySink.from_aggregator(top, str(tmp_path / "summary.csv")).close()
+    with open(tmp_path / "summary.csv", newline='') as summary_file:
+        rows = list(csv.DictReader(summary_file))
+    assert list(rows[0]) == SummarySink.fieldnames + ['Sales_Error_Bound']
+
+    reps = [row for row in rows if row['Type'] == 'Sales_Rep']
+    assert [row['Name'] for row in reps] == sorted(exact.sales_by_rep, key=exact.sales_by_rep.get, reverse=True)[:2]
+    for row in reps:
+        total, error = float(row['Total_Sales']), float(row['Sales_Error_Bound'])
+        assert total - error <= exact.sales_by_rep[row['Name']] <= total
+        assert int(row['Num_Transactions']) >= exact.transactions_by_rep[row['Name']]
+
+    products = {row['Name']: row for row in rows if row['Type'] == 'Product'}
+    assert len(products) == 2
+    for name, row in products.items():
+        assert float(row['Total_Sales']) == pytest.approx(exact.sales_by_product[name])
+        assert float(row['Sales_Error_Bound']) == 0
+    capsys.readouterr()
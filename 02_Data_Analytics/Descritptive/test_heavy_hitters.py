@@ -0,0 +1,142 @@
+import random
+from collections import Counter
+
+import pytest
+
+from heavy_hitters import SpaceSaving, CountMinSketch, HeavyHitters
+
+
+def skewed_stream(count, keys, seed):
+    rng = random.Random(seed)
+    # Half the records fall on a few heavy keys, the rest spread over all keys
+    return [(f"k{rng.randrange(keys) if rng.random() < 0.5 else int(rng.paretovariate(1.0)) % keys}",
+             rng.randint(1, 5)) for _ in range(count)]
+
+
+def exact_weights(stream):
+    weights = Counter()
+    for key, weight in stream:
+        weights[key] += weight
+    return weights
+
+
+def assert_over_estimates(entries, exact):
+    for key, weight, error in entries:
+        assert exact[key] <= weight
+        assert weight - error <= exact[key]
+
+
+def test_space_saving_over_estimates_and_keeps_heavy_keys():
+    stream = skewed_stream(20000, 3000, 1)
+    exact = exact_weights(stream)
+    summary = SpaceSaving(50)
+    for key, weight in stream:
+        summary.add(key, weight)
+
+    assert len(summary.counts) == 50
+    assert_over_estimates(summary.top(50), exact)
+    assert all(exact[key] <= summary.min_count() for key in exact.keys() - summary.counts.keys())
+    total = sum(exact.values())
+    assert {key for key, weight in exact.items() if weight > total / 50} <= summary.counts.keys()
+
+
+def test_space_saving_merge_fills_missing_keys_with_min_count():
+    left, right = SpaceSaving(2), SpaceSaving(2)
+    for key, weight in (('x', 5), ('y', 3), ('z', 1)):
+        left.add(key, weight)
+    for key, weight in (('w', 10), ('v', 2)):
+        right.add(key, weight)
+    assert (left.min_count(), right.min_count()) == (4, 2)
+
+    left.merge(right)
+    assert left.top(2) == [('w', 14, 4), ('x', 7, 2)]
+
+    stream = skewed_stream(20000, 3000, 2)
+    parts = [SpaceSaving(50) for _ in range(3)]
+    for index, (key, weight) in enumerate(stream):
+        parts[index % 3].add(key, weight)
+    merged = parts[0]
+    merged.merge(parts[1])
+    merged.merge(parts[2])
+    assert_over_estimates(merged.top(50), exact_weights(stream))
+
+
+def test_space_saving_accepts_mixed_key_types():
+    summary = SpaceSaving(2)
+    for key in (1, 'a', (2, 'b'), None, 'c'):
+        summary.add(key, 1)
+    other = SpaceSaving(2)
+    other.add(3.5, 2)
+    other.add('a', 2)
+    summary.merge(other)
+    assert summary.top(1) == [('c', 5, 4)]
+    assert summary.min_count() == 4
+
+
+def test_count_min_sketch_never_under_counts():
+    stream = skewed_stream(20000, 3000, 3)
+    exact = exact_weights(stream)
+    sketch, left, right = CountMinSketch(512, 4), CountMinSketch(512, 4), CountMinSketch(512, 4)
+    for index, (key, weight) in enumerate(stream):
+        sketch.add(key, weight)
+        (left if index % 2 else right).add(key, weight)
+
+    assert sketch.total == sum(exact.values())
+    for key, weight in exact.items():
+        assert weight <= sketch.estimate(key) <= weight + sketch.error_bound()
+
+    left.merge(right)
+    assert (left.table, left.total) == (sketch.table, sketch.total)
+    with pytest.raises(ValueError):
+        left.merge(CountMinSketch(256, 4))
+
+
+def test_heavy_hitters_switches_to_sketches_after_exact_limit():
+    tracker = HeavyHitters(capacity=20, exact_limit=100)
+    for index in range(100):
+        tracker.add(f"k{index}", index)
+    assert tracker.is_exact
+    assert tracker.top(3) == [('k99', 99, 0), ('k98', 98, 0), ('k97', 97, 0)]
+
+    tracker.add('k99', 1)
+    assert tracker.is_exact
+    tracker.add('k100', 1)
+    assert not tracker.is_exact
+    assert tracker.exact == {}
+    assert tracker.top(3) == [('k99', 100, 0), ('k98', 98, 0), ('k97', 97, 0)]
+    assert tracker.candidates.min_count() == 80
+
+
+def test_heavy_hitters_estimates_bound_the_exact_weights():
+    stream = skewed_stream(20000, 3000, 4)
+    exact = exact_weights(stream)
+    tracker = HeavyHitters(capacity=100, exact_limit=500)
+    for key, weight in stream:
+        tracker.add(key, weight)
+
+    assert not tracker.is_exact
+    top = tracker.top(10)
+    assert_over_estimates(top, exact)
+    assert_over_estimates([(key,) + tracker.estimate(key) for key in exact], exact)
+    assert [key for key, _, _ in top[:3]] == [key for key, _ in exact.most_common(3)]
+
+
+@pytest.mark.parametrize("left_keys, right_keys", [(50, 50), (50, 3000), (3000, 50), (3000, 3000)])
+def test_heavy_hitters_merge(left_keys, right_keys):
+    left_stream = skewed_stream(10000, left_keys, 5)
+    right_stream = skewed_stream(10000, right_keys, 6)
+    exact = exact_weights(left_stream + right_stream)
+    left, right = HeavyHitters(capacity=100, exact_limit=500), HeavyHitters(capacity=100, exact_limit=500)
+    for key, weight in left_stream:
+        left.add(key, weight)
+    for key, weight in right_stream:
+        right.add(key, weight)
+    assert (left.is_exact, right.is_exact) == (left_keys < 500, right_keys < 500)
+
+    left.merge(right)
+    assert left.is_exact == (len(exact) <= 500)
+    if left.is_exact:
+        assert left.exact == exact
+    assert_over_estimates(left.top(10), exact)
+    assert_over_estimates([(key,) + left.estimate(key) for key in exact], exact)
+    assert [key for key, _, _ in left.top(3)] == [key for key, _ in exact.most_common(3)]